@@ -1,26 +1,397 @@
-# # main.py
-# from src.experiment_runner import ExperimentRunner
-
-# if __name__ == "__main__":
-#     runner = ExperimentRunner()
-    
-#     print("=== Starting Interval Scheduling Experiments ===\n")
-    
-#     # 1. Quality Analysis (Greedy vs Optimal)
-#     quality_results = runner.run_quality_experiments()
-#     runner.plot_quality(quality_results)
-    
-#     # 2. Greedy Big-O Validation
-#     greedy_results = runner.run_greedy_runtime_experiments()
-#     runner.plot_greedy_big_o(greedy_results)
-    
-#     # 3. Exhaustive Big-O Validation
-#     exhaustive_results = runner.run_exhaustive_runtime_experiments()
-#     runner.plot_exhaustive_big_o(exhaustive_results)
-    
-#     print("\nAll experiments completed! Plots saved in 'plots/' folder.")
-    
-from src.experiment_runner import ExperimentRunner
-
-runner = ExperimentRunner()
-runner.plot_greedy_big_o_from_csv("data/greedy_runtime_results.csv")
\ No newline at end of file
+"""Command-line entry point.
+
+    python main.py schedule intervals.txt --heuristic EFT
+    python main.py sweep greedy --n-values 1024 4096 --trials 10
+    python main.py plot greedy --csv data/greedy_runtime_results.csv
+    python main.py sweep greedy --record before && ... && python main.py sweep greedy --record after
+    python main.py compare before after
+    python main.py serve --port 8765 & python main.py load --port 8765 --concurrency 1 8 32
+    python main.py fit && python main.py plan exhaustive --n-values 20 24 28 --budget 3600
+
+Heavy modules (matplotlib, pandas, the experiment runner) are imported
+inside the subcommands that need them, so `schedule` only pays for NumPy
+and the scheduler it runs. Plots render with the non-interactive Agg
+backend.
+"""
+import argparse
+import os
+import sys
+
+from src.dataset_generator import WORKLOADS
+
+HEURISTICS = ("EFT", "EST", "SD", "exact", "external")
+
+# Sweep name -> (runner method, plot method or None)
+SWEEPS = {
+    "quality": ("run_quality_experiments", "plot_quality"),
+    "greedy": ("run_greedy_runtime_experiments", "plot_greedy_big_o"),
+    "exhaustive": ("run_exhaustive_runtime_experiments", "plot_exhaustive_big_o"),
+    "exhaustive_bitmask": ("run_bitmask_exhaustive_runtime_experiments", None),
+    "exhaustive_scaling": ("run_exhaustive_scaling_experiments", "plot_exhaustive_scaling"),
+    "weighted": ("run_weighted_runtime_experiments", "plot_weighted_big_o"),
+    "partition": ("run_partition_runtime_experiments", "plot_partition_big_o"),
+    "external": ("run_external_runtime_experiments", None),
+    "sort_backend": ("run_sort_backend_experiments", None),
+    "phase_profile": ("run_phase_profile_experiments", None),
+    "dynamic_update": ("run_dynamic_update_experiments", None),
+    "parallel_eft": ("run_parallel_eft_experiments", "plot_parallel_eft_speedup"),
+    "workload_suite": ("run_workload_suite", None),
+}
+
+# Sweeps that take distribution= (see src.dataset_generator.WORKLOADS)
+WORKLOAD_SWEEPS = ("quality", "greedy", "exhaustive")
+
+# Sweeps that support adaptive trial counts (adaptive=)
+ADAPTIVE_SWEEPS = ("quality", "greedy", "exhaustive")
+
+# Sweeps that can be stored as named baseline runs (record_as=)
+RECORDABLE_SWEEPS = ("greedy", "exhaustive")
+
+# Sweeps with runtime fits for `plan` and `sweep --budget` (src.experiment_runner.FIT_SOURCES)
+PLANNABLE_SWEEPS = ("greedy", "exhaustive")
+
+# Environment fields that make two runs' timings not directly comparable
+ENVIRONMENT_KEYS = ("hostname", "platform", "processor", "python", "numpy", "workers", "columnar")
+
+# Plots that can be redrawn from a saved CSV -> default CSV path
+REPLOTS = {
+    "greedy": "data/greedy_runtime_results.csv",
+    "parallel_eft": "data/parallel_eft_results.csv",
+    "exhaustive_scaling": "data/exhaustive_scaling_results.csv",
+}
+
+
+def _headless_runner(args):
+    """Import the experiment runner with the Agg backend selected first."""
+    import matplotlib
+    matplotlib.use("Agg")
+    from src.experiment_runner import ExperimentRunner
+
+    os.makedirs("plots", exist_ok=True)
+    return ExperimentRunner(seed=args.seed, workers=args.workers, cache_dir=args.cache_dir,
+                            results_db=args.results_db, baselines_db=args.baselines_db, columnar=args.columnar)
+
+
+def _read_jobs(path):
+    """Intervals from a raw .bin record file or a text file of "start finish" lines."""
+    from src.external import read_intervals
+    from src.intervals import IntervalSet
+    import numpy as np
+
+    if path.endswith(".bin"):
+        return read_intervals(path)
+    arr = np.loadtxt(path, delimiter="," if path.endswith(".csv") else None, ndmin=2)
+    if arr.size == 0:
+        arr = arr.reshape(0, 2)
+    return IntervalSet(arr[:, 0], arr[:, 1])
+
+
+def cmd_schedule(args):
+    if args.heuristic == "external":
+        from src.external import ExternalEarliestFinishTime
+
+        if not args.input.endswith(".bin"):
+            sys.exit("external scheduling needs a .bin record file")
+        scheduler = ExternalEarliestFinishTime(args.input, chunk_size=args.chunk_size)
+        count = scheduler.schedule_to_file(args.output or os.devnull)
+        print(count)
+        return
+
+    jobs = _read_jobs(args.input)
+    if len(jobs) == 0:
+        selected = jobs
+    elif args.heuristic == "exact":
+        from src.optimal import ExactOptimalScheduler
+        selected = ExactOptimalScheduler(jobs).schedule_jobs()
+    else:
+        from src import greedy
+        scheduler = {"EFT": greedy.EarliestFinishTime, "EST": greedy.EarlierStartTime,
+                     "SD": greedy.ShortestDuration}[args.heuristic]
+        selected = scheduler(jobs).schedule_jobs()
+
+    if args.count:
+        print(len(selected))
+    elif args.output and args.output.endswith(".bin"):
+        from src.external import write_intervals
+        write_intervals(args.output, selected)
+    else:
+        out = open(args.output, "w") if args.output else sys.stdout
+        try:
+            out.writelines(f"{s!r} {f!r}\n" for s, f in selected)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+
+def cmd_sweep(args):
+    runner = _headless_runner(args)
+    run_name, plot_name = SWEEPS[args.name]
+    kwargs = {}
+    if args.n_values and args.name == "exhaustive_scaling":
+        # Strong scaling runs at one fixed n
+        if len(args.n_values) != 1:
+            sys.exit("exhaustive_scaling takes a single --n-values entry")
+        kwargs["n"] = args.n_values[0]
+    elif args.n_values and args.name == "workload_suite":
+        kwargs["runtime_n_values"] = args.n_values
+    elif args.n_values:
+        kwargs["n_values"] = args.n_values
+    if args.trials is not None:
+        kwargs["trials"] = args.trials
+    if args.distribution is not None:
+        if args.name not in WORKLOAD_SWEEPS:
+            sys.exit(f"--distribution applies only to {', '.join(WORKLOAD_SWEEPS)}")
+        kwargs["distribution"] = args.distribution
+    if args.record is not None:
+        if args.name not in RECORDABLE_SWEEPS:
+            sys.exit(f"--record applies only to {', '.join(RECORDABLE_SWEEPS)}")
+        kwargs["record_as"] = args.record
+    if args.adaptive is not None:
+        if args.name not in ADAPTIVE_SWEEPS:
+            sys.exit(f"--adaptive applies only to {', '.join(ADAPTIVE_SWEEPS)}")
+        from src.benchmark import AdaptiveTrials
+        kwargs["adaptive"] = AdaptiveTrials(args.adaptive, args.min_trials, args.max_trials, args.cell_budget)
+    if args.budget is not None:
+        _check_budget(runner, args)
+    results = getattr(runner, run_name)(**kwargs)
+    if plot_name is not None and not args.no_plot:
+        getattr(runner, plot_name)(results)
+
+
+def _check_budget(runner, args):
+    """Refuse to start a sweep whose predicted wall time exceeds --budget."""
+    from src.experiment_runner import FIT_SOURCES
+
+    if args.name not in FIT_SOURCES:
+        sys.exit(f"--budget applies only to {', '.join(FIT_SOURCES)}")
+    # An adaptive run is bounded by its maximum trial count
+    trials = args.max_trials if args.adaptive is not None else (args.trials or 10)
+    try:
+        prediction = runner.predict_sweep_time(args.name, args.n_values, trials, args.budget)
+    except (FileNotFoundError, ValueError) as e:
+        sys.exit(f"cannot check --budget: {e}")
+    if prediction["total_seconds"] > args.budget:
+        fitting = prediction["within_budget"]
+        sys.exit(f"predicted {prediction['total_seconds']:.0f} s exceeds the {args.budget:.0f} s budget; "
+                 f"n values that fit: {' '.join(map(str, fitting)) if fitting else 'none'}")
+    print(f"predicted {prediction['total_seconds']:.1f} s (budget {args.budget:.0f} s)")
+
+
+def cmd_fit(args):
+    runner = _headless_runner(args)
+    runner.fit_complexity_models(args.sweeps, args.csv)
+
+
+def cmd_plan(args):
+    runner = _headless_runner(args)
+    try:
+        prediction = runner.predict_sweep_time(args.name, args.n_values, args.trials, args.budget)
+    except (FileNotFoundError, ValueError) as e:
+        sys.exit(f"cannot plan: {e}")
+    for row in prediction["cells"].itertuples():
+        print(f"α={row.alpha:<4} n={row.n:>8}  {row.predicted_seconds:>12.3f} s")
+    print(f"total {prediction['total_seconds']:.1f} s with {args.workers} worker(s)")
+    if args.budget is not None:
+        fitting = prediction["within_budget"]
+        print(f"n values within {args.budget:.0f} s: {' '.join(map(str, fitting)) if fitting else 'none'}")
+
+
+def cmd_plot(args):
+    runner = _headless_runner(args)
+    csv_path = args.csv or REPLOTS[args.name]
+    if args.name == "greedy":
+        runner.plot_greedy_big_o_from_csv(csv_path)
+        return
+    import pandas as pd
+    plot = {"parallel_eft": runner.plot_parallel_eft_speedup,
+            "exhaustive_scaling": runner.plot_exhaustive_scaling}[args.name]
+    plot(pd.read_csv(csv_path))
+
+
+def cmd_compare(args):
+    """Print a per-cell comparison of two baseline runs; exit 1 on any regression."""
+    from src.baselines import BaselineRegistry, compare_runs
+
+    registry = BaselineRegistry(args.baselines_db)
+    try:
+        try:
+            base_sweep, base_env = registry.run(args.baseline)
+            cand_sweep, cand_env = registry.run(args.candidate)
+        except KeyError as e:
+            sys.exit(f"no baseline run named {e.args[0]!r} in {args.baselines_db}")
+        if base_sweep != cand_sweep:
+            sys.exit(f"cannot compare a {base_sweep} run with a {cand_sweep} run")
+        baseline, candidate = registry.samples(args.baseline), registry.samples(args.candidate)
+    finally:
+        registry.close()
+
+    for key in ENVIRONMENT_KEYS:
+        if base_env.get(key) != cand_env.get(key):
+            print(f"warning: {key} differs: {base_env.get(key)!r} vs {cand_env.get(key)!r}")
+    if not baseline.keys() & candidate.keys():
+        sys.exit(f"error: {args.baseline!r} and {args.candidate!r} share no (alpha, n, algorithm) cells; "
+                 "nothing was compared")
+    unmatched = len(baseline.keys() ^ candidate.keys())
+    if unmatched:
+        print(f"warning: {unmatched} cells are in only one of the runs and are skipped")
+
+    rows = compare_runs(baseline, candidate, args.significance, args.min_slowdown)
+    print(f"{'alpha':>5} {'n':>8} {'algorithm':<10} {'baseline':>12} {'candidate':>12} "
+          f"{'ratio':>6} {'p':>8}  status")
+    for row in rows:
+        print(f"{row['alpha']:>5} {row['n']:>8} {row['algorithm']:<10} "
+              f"{row['baseline_median'] * 1000:>10.3f}ms {row['candidate_median'] * 1000:>10.3f}ms "
+              f"{row['ratio']:>6.3f} {row['p_value']:>8.2g}  {row['status']}")
+    slower = sum(row["status"] == "slower" for row in rows)
+    faster = sum(row["status"] == "faster" for row in rows)
+    print(f"{len(rows)} cells: {slower} slower, {faster} faster, {len(rows) - slower - faster} unchanged")
+    if slower:
+        sys.exit(1)
+
+
+def cmd_baselines(args):
+    from src.baselines import BaselineRegistry
+
+    registry = BaselineRegistry(args.baselines_db)
+    try:
+        for name, sweep, created in registry.runs():
+            print(f"{name}\t{sweep}\t{created}")
+    finally:
+        registry.close()
+
+
+def cmd_serve(args):
+    import asyncio
+    from src.service import SchedulingService
+
+    service = SchedulingService(args.host, args.port, args.socket, micro_batch=not args.no_micro_batch,
+                                batch_window=args.batch_window, max_batch=args.max_batch,
+                                large_threshold=args.large_threshold, workers=args.workers)
+    print(f"serving on {args.socket or f'{args.host}:{args.port}'}", flush=True)
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+def cmd_load(args):
+    import asyncio
+    import csv
+    from src.service import run_load
+
+    rows = asyncio.run(run_load(args.host, args.port, args.socket, args.concurrency, args.requests,
+                                args.n, args.alpha, args.heuristic))
+    print(f"{'concurrency':>11} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>9}")
+    for row in rows:
+        print(f"{row['concurrency']:>11} {row['p50_ms']:>8.3f} {row['p99_ms']:>8.3f} {row['throughput_rps']:>9.1f}")
+    os.makedirs(os.path.dirname(args.csv) or ".", exist_ok=True)
+    with open(args.csv, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+        writer.writeheader()
+        writer.writerows(rows)
+    print(f"Service load results saved to {args.csv}")
+
+
+def _add_runner_arguments(cmd):
+    """Options of the subcommands that build an ExperimentRunner"""
+    cmd.add_argument("--seed", type=int, default=None)
+    cmd.add_argument("--workers", type=int, default=1)
+    cmd.add_argument("--cache-dir", default=None, help="memory-mapped dataset cache directory")
+    cmd.add_argument("--columnar", action="store_true",
+                     help="time runtime sweeps on IntervalSets instead of tuple lists")
+    cmd.add_argument("--results-db", default=None, help="SQLite checkpoint for resumable sweeps")
+    cmd.add_argument("--baselines-db", default="data/baselines.sqlite", help="baseline run registry")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Empirical study of interval scheduling algorithms")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    schedule = sub.add_parser("schedule", help="schedule the intervals in a file")
+    schedule.add_argument("input", help='.bin record file, or text/.csv with one "start finish" per line')
+    schedule.add_argument("--heuristic", choices=HEURISTICS, default="EFT")
+    schedule.add_argument("--output", help="write selected intervals here (.bin for records) instead of stdout")
+    schedule.add_argument("--count", action="store_true", help="print only the number of selected intervals")
+    schedule.add_argument("--chunk-size", type=int, default=1 << 20, help="run size for --heuristic external")
+    schedule.set_defaults(func=cmd_schedule)
+
+    for name, func, choices, help_text in (
+        ("sweep", cmd_sweep, SWEEPS, "run an experiment sweep, save its CSV and plot"),
+        ("plot", cmd_plot, REPLOTS, "redraw a plot from a saved CSV"),
+        ("plan", cmd_plan, PLANNABLE_SWEEPS, "predict a sweep's wall time from fitted cost models"),
+    ):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("name", choices=sorted(choices))
+        _add_runner_arguments(cmd)
+        cmd.set_defaults(func=func)
+
+    sweep = sub.choices["sweep"]
+    sweep.add_argument("--n-values", type=int, nargs="+")
+    sweep.add_argument("--trials", type=int)
+    sweep.add_argument("--distribution", choices=WORKLOADS, help="workload shape (default: uniform)")
+    sweep.add_argument("--no-plot", action="store_true")
+    sweep.add_argument("--record", metavar="RUN", help="store the per-trial times as a named baseline run")
+    sweep.add_argument("--adaptive", type=float, metavar="WIDTH",
+                       help="add trials per cell until the 95%% CI of the mean is within WIDTH of it (e.g. 0.05)")
+    sweep.add_argument("--min-trials", type=int, default=5, help="with --adaptive")
+    sweep.add_argument("--max-trials", type=int, default=200, help="with --adaptive")
+    sweep.add_argument("--cell-budget", type=float, metavar="SECONDS", help="with --adaptive: wall time per cell")
+    sub.choices["plot"].add_argument("--csv", help="CSV to plot (defaults to the sweep's output)")
+    sweep.add_argument("--budget", type=float, metavar="SECONDS",
+                       help="refuse to start if the predicted wall time is longer (greedy, exhaustive)")
+    plan = sub.choices["plan"]
+    plan.add_argument("--n-values", type=int, nargs="+")
+    plan.add_argument("--trials", type=int, default=10)
+    plan.add_argument("--budget", type=float, metavar="SECONDS", help="also report the n values that fit")
+
+    fit = sub.add_parser("fit", help="fit n, n log n, n^2 and n 2^n cost models to the runtime CSVs")
+    fit.add_argument("--sweeps", nargs="+", choices=PLANNABLE_SWEEPS, default=list(PLANNABLE_SWEEPS))
+    fit.add_argument("--csv", default="data/complexity_fits.csv")
+    _add_runner_arguments(fit)
+    fit.set_defaults(func=cmd_fit)
+
+    compare = sub.add_parser("compare", help="test a baseline run against another for slowdowns")
+    compare.add_argument("baseline")
+    compare.add_argument("candidate")
+    compare.add_argument("--significance", type=float, default=0.05, help="family-wise level of the Holm-adjusted one-sided Mann-Whitney tests")
+    compare.add_argument("--min-slowdown", type=float, default=0.05,
+                         help="relative median slowdown below which a cell is never flagged")
+    compare.add_argument("--baselines-db", default="data/baselines.sqlite")
+    compare.set_defaults(func=cmd_compare)
+
+    baselines = sub.add_parser("baselines", help="list the stored baseline runs")
+    baselines.add_argument("--baselines-db", default="data/baselines.sqlite")
+    baselines.set_defaults(func=cmd_baselines)
+
+    serve = sub.add_parser("serve", help="run the scheduling service (JSON lines over TCP or a Unix socket)")
+    serve.add_argument("--no-micro-batch", action="store_true",
+                       help="schedule each small request on its own instead of in micro-batches")
+    serve.add_argument("--batch-window", type=float, default=0.002, help="seconds to wait to fill a micro-batch")
+    serve.add_argument("--max-batch", type=int, default=64)
+    serve.add_argument("--large-threshold", type=int, default=4096,
+                       help="requests with at least this many jobs go to the process pool")
+    serve.add_argument("--workers", type=int, default=2, help="process pool size for large requests")
+    serve.set_defaults(func=cmd_serve)
+
+    load = sub.add_parser("load", help="measure service latency and throughput at several concurrency levels")
+    load.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    load.add_argument("--requests", type=int, default=500, help="requests per concurrency level")
+    load.add_argument("--n", type=int, default=100, help="jobs per request")
+    load.add_argument("--alpha", type=float, default=1.0)
+    load.add_argument("--heuristic", choices=HEURISTICS[:4], default="EFT")
+    load.add_argument("--csv", default="data/service_load_results.csv")
+    load.set_defaults(func=cmd_load)
+    for cmd in (serve, load):
+        cmd.add_argument("--host", default="127.0.0.1")
+        cmd.add_argument("--port", type=int, default=8765)
+        cmd.add_argument("--socket", help="Unix socket path instead of host/port")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
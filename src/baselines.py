@@ -0,0 +1,174 @@
+import json
+import math
+import os
+import sqlite3
+import subprocess
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+
+Cell = Tuple[float, int, str]  # (alpha, n, algorithm)
+
+
+class BaselineRegistry:
+    """Named runtime runs kept for later comparison, in SQLite.
+
+    A run stores the per-trial samples of every (alpha, n, algorithm)
+    cell of one sweep together with the environment it was measured in,
+    so a later run can be compared against it cell by cell. Recording
+    under an existing name replaces that run.
+    """
+
+    def __init__(self, path: str = "data/baselines.sqlite"):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            " name TEXT PRIMARY KEY,"
+            " sweep TEXT NOT NULL,"
+            " created TEXT NOT NULL,"
+            " environment TEXT NOT NULL)"
+        )
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS samples ("
+            " run TEXT NOT NULL,"
+            " alpha REAL NOT NULL,"
+            " n INTEGER NOT NULL,"
+            " algorithm TEXT NOT NULL,"
+            " samples TEXT NOT NULL,"
+            " PRIMARY KEY (run, alpha, n, algorithm))"
+        )
+        self.conn.commit()
+
+    def record(self, name: str, sweep: str, samples: Dict[Cell, List[float]], environment: dict) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM samples WHERE run = ?", (name,))
+            self.conn.execute(
+                "INSERT OR REPLACE INTO runs (name, sweep, created, environment) VALUES (?, ?, ?, ?)",
+                (name, sweep, time.strftime("%Y-%m-%dT%H:%M:%S"), json.dumps(environment)),
+            )
+            self.conn.executemany(
+                "INSERT INTO samples (run, alpha, n, algorithm, samples) VALUES (?, ?, ?, ?, ?)",
+                [(name, float(alpha), int(n), algo, json.dumps([float(x) for x in values]))
+                 for (alpha, n, algo), values in samples.items()],
+            )
+
+    def runs(self) -> List[Tuple[str, str, str]]:
+        """(name, sweep, created) of every stored run, oldest first."""
+        return self.conn.execute("SELECT name, sweep, created FROM runs ORDER BY created, name").fetchall()
+
+    def run(self, name: str) -> Tuple[str, dict]:
+        """(sweep, environment) of a stored run; KeyError if there is none."""
+        row = self.conn.execute("SELECT sweep, environment FROM runs WHERE name = ?", (name,)).fetchone()
+        if row is None:
+            raise KeyError(name)
+        return row[0], json.loads(row[1])
+
+    def samples(self, name: str) -> Dict[Cell, List[float]]:
+        rows = self.conn.execute(
+            "SELECT alpha, n, algorithm, samples FROM samples WHERE run = ? ORDER BY alpha, n, algorithm", (name,)
+        ).fetchall()
+        return {(alpha, n, algo): json.loads(values) for alpha, n, algo, values in rows}
+
+    def delete(self, name: str) -> None:
+        with self.conn:
+            self.conn.execute("DELETE FROM samples WHERE run = ?", (name,))
+            self.conn.execute("DELETE FROM runs WHERE name = ?", (name,))
+
+    def close(self) -> None:
+        self.conn.close()
+
+
+def git_revision() -> Optional[str]:
+    """Commit hash of the working tree, or None outside a git checkout."""
+    try:
+        out = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() if out.returncode == 0 else None
+
+
+def mann_whitney_greater(baseline, candidate) -> float:
+    """One-sided Mann-Whitney U p-value that candidate samples tend to be larger.
+
+    Rank-based, so a few outlier trials do not dominate as they would in
+    a t-test. Uses the normal approximation with tie and continuity
+    corrections, which is adequate from about 8 samples per side.
+    """
+    a = np.asarray(baseline, dtype=np.float64)
+    b = np.asarray(candidate, dtype=np.float64)
+    n_a, n_b = len(a), len(b)
+    if n_a == 0 or n_b == 0:
+        return 1.0
+    pooled = np.concatenate([a, b])
+    values, inverse, counts = np.unique(pooled, return_inverse=True, return_counts=True)
+    # Average 1-based rank of each distinct value
+    average_rank = np.cumsum(counts) - (counts - 1) / 2
+    u = average_rank[inverse[n_a:]].sum() - n_b * (n_b + 1) / 2
+
+    total = n_a + n_b
+    ties = float((counts ** 3 - counts).sum())
+    variance = n_a * n_b / 12 * ((total + 1) - ties / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n_a * n_b / 2 - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def holm_adjust(p_values) -> np.ndarray:
+    """Holm-Bonferroni adjusted p-values, in the input order.
+
+    Rejecting every adjusted p-value below `significance` keeps the
+    chance of any false rejection across the whole family at or below
+    `significance`, which a per-test threshold does not.
+    """
+    p = np.asarray(p_values, dtype=np.float64)
+    m = len(p)
+    order = np.argsort(p, kind="stable")
+    adjusted = np.minimum(1.0, np.maximum.accumulate(p[order] * (m - np.arange(m))))
+    out = np.empty(m)
+    out[order] = adjusted
+    return out
+
+
+def compare_runs(baseline: Dict[Cell, List[float]], candidate: Dict[Cell, List[float]],
+                 significance: float = 0.05, min_slowdown: float = 0.05) -> List[dict]:
+    """Line up the cells two runs share and test each for a slowdown.
+
+    A cell is "slower" when the one-sided Mann-Whitney test rejects at
+    `significance` and the candidate median is more than min_slowdown
+    (relative) above the baseline median, "faster" in the mirrored case,
+    else "ok". The p-values of each direction are Holm-Bonferroni
+    adjusted across all shared cells, so comparing two runs of the same
+    code flags no cell with probability at least 1 - significance, however
+    many cells the sweep has. p_value is the adjusted p-value in the
+    direction of the median shift. The threshold keeps tiny but
+    consistent shifts from failing a comparison.
+    """
+    cells = sorted(baseline.keys() & candidate.keys())
+    p_slower = holm_adjust([mann_whitney_greater(baseline[cell], candidate[cell]) for cell in cells])
+    p_faster = holm_adjust([mann_whitney_greater(candidate[cell], baseline[cell]) for cell in cells])
+    rows = []
+    for cell, slower, faster in zip(cells, p_slower, p_faster):
+        base_median, cand_median = float(np.median(baseline[cell])), float(np.median(candidate[cell]))
+        ratio = cand_median / base_median if base_median > 0 else float("inf")
+        if slower < significance and ratio > 1 + min_slowdown:
+            status = "slower"
+        elif faster < significance and ratio < 1 / (1 + min_slowdown):
+            status = "faster"
+        else:
+            status = "ok"
+        alpha, n, algo = cell
+        rows.append({
+            "alpha": alpha,
+            "n": n,
+            "algorithm": algo,
+            "baseline_median": base_median,
+            "candidate_median": cand_median,
+            "ratio": ratio,
+            "p_value": float(slower if ratio >= 1 else faster),
+            "status": status,
+        })
+    return rows
@@ -0,0 +1,81 @@
+import numpy as np
+from typing import Tuple
+
+HEURISTICS = ("EFT", "EST", "SD")
+
+
+def _sort_keys(start: np.ndarray, finish: np.ndarray, heuristic: str) -> np.ndarray:
+    if heuristic == "EFT":
+        return finish
+    if heuristic == "EST":
+        return start
+    if heuristic == "SD":
+        return finish - start
+    raise ValueError(f"unknown heuristic {heuristic!r}; choose from {HEURISTICS}")
+
+
+def schedule_batch(start, finish, lengths=None, heuristic: str = "EFT") -> Tuple[np.ndarray, np.ndarray]:
+    """Run one greedy heuristic over many datasets at once.
+
+    start/finish are 2-D arrays of shape (datasets, L); row b holds dataset
+    b in its first lengths[b] columns (all L if lengths is None) and the
+    rest is padding. Each row is stable-sorted by the heuristic's key and
+    scanned with the same >= rule as greedy.py. The scan steps over the L
+    columns, vectorized across all datasets, so there is no Python loop
+    over datasets.
+
+    Returns (counts, selected): counts[b] is the number of jobs picked in
+    dataset b, selected is a (datasets, L) bool mask over the input positions.
+    """
+    start = np.asarray(start, dtype=np.float64)
+    finish = np.asarray(finish, dtype=np.float64)
+    if start.ndim != 2 or start.shape != finish.shape:
+        raise ValueError("start and finish must be 2-D arrays of equal shape")
+    B, L = start.shape
+    if lengths is None:
+        lengths = np.full(B, L, dtype=np.int64)
+    lengths = np.asarray(lengths, dtype=np.int64)
+    valid = np.arange(L) < lengths[:, None]
+
+    # Padding sorts to the end of every row
+    keys = np.where(valid, _sort_keys(start, finish, heuristic), np.inf)
+    order = np.argsort(keys, axis=1, kind="stable")
+    sorted_start = np.take_along_axis(start, order, axis=1)
+    sorted_finish = np.take_along_axis(finish, order, axis=1)
+
+    last_finish = np.full(B, -np.inf)
+    taken = np.zeros((B, L), dtype=bool)
+    for j in range(L):
+        take = (j < lengths) & (sorted_start[:, j] >= last_finish)
+        taken[:, j] = take
+        last_finish = np.where(take, sorted_finish[:, j], last_finish)
+
+    selected = np.zeros((B, L), dtype=bool)
+    np.put_along_axis(selected, order, taken, axis=1)
+    return taken.sum(axis=1), selected
+
+
+def schedule_ragged(start, finish, offsets, heuristic: str = "EFT") -> Tuple[np.ndarray, np.ndarray]:
+    """schedule_batch for ragged input: dataset b is start[offsets[b]:offsets[b+1]].
+
+    Returns (counts, selected) with selected a bool mask over the flat arrays.
+    """
+    start = np.asarray(start, dtype=np.float64)
+    finish = np.asarray(finish, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    lengths = np.diff(offsets)
+    B = len(lengths)
+    L = int(lengths.max()) if B else 0
+
+    # Scatter the flat arrays into a padded (B, L) block
+    rows = np.repeat(np.arange(B), lengths)
+    cols = np.arange(len(rows)) + offsets[0] - offsets[rows]
+    padded_start = np.zeros((B, L))
+    padded_finish = np.zeros((B, L))
+    padded_start[rows, cols] = start[offsets[0]:offsets[-1]]
+    padded_finish[rows, cols] = finish[offsets[0]:offsets[-1]]
+
+    counts, selected = schedule_batch(padded_start, padded_finish, lengths, heuristic)
+    flat_selected = np.zeros(len(start), dtype=bool)
+    flat_selected[offsets[0]:offsets[-1]] = selected[rows, cols]
+    return counts, flat_selected
@@ -0,0 +1,216 @@
+import gc
+import os
+import platform
+import sys
+import time
+import tracemalloc
+import numpy as np
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+
+def machine_info() -> Dict[str, object]:
+    """Where a measurement was taken: host, CPU, Python and NumPy versions."""
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "python": sys.version.split()[0],
+        "python_implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "hostname": platform.node(),
+    }
+
+
+def measure(fn: Callable[[], object], disable_gc: bool = True) -> float:
+    """Time one call of fn with perf_counter, optionally with the GC paused.
+
+    A full collection runs first so garbage from earlier calls is not
+    collected inside the measured region.
+    """
+    gc.collect()
+    was_enabled = gc.isenabled()
+    if disable_gc:
+        gc.disable()
+    try:
+        start = time.perf_counter()
+        fn()
+        return time.perf_counter() - start
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def measure_memory(fn: Callable[[], object]):
+    """Peak traced memory and retained blocks of one call of fn.
+
+    Returns (peak_bytes, retained_blocks): peak_bytes is the tracemalloc
+    peak above the baseline at entry; retained_blocks is the number of
+    blocks allocated during the call that are still live when it returns
+    (the result plus anything it caches). Temporaries freed inside the call
+    are not counted: tracemalloc snapshots only see live blocks, so the
+    peak is the measure of transient memory. Tracing slows the call down,
+    so this is meant for a separate, untimed run.
+    """
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        baseline = tracemalloc.get_traced_memory()[0]
+        result = fn()
+        peak = tracemalloc.get_traced_memory()[1]
+        after = tracemalloc.take_snapshot()
+    finally:
+        tracemalloc.stop()
+    del result
+    # Per allocation site, so blocks freed elsewhere cannot cancel new ones
+    retained_blocks = sum(max(stat.count_diff, 0) for stat in after.compare_to(before, "lineno"))
+    return peak - baseline, retained_blocks
+
+
+class BenchmarkResult:
+    """Per-repeat samples of one benchmark plus summary statistics (seconds)."""
+
+    def __init__(self, samples: List[float], confidence: float = 0.95, seed: int = 0):
+        self.samples = list(samples)
+        arr = np.asarray(self.samples)
+        self.min = float(arr.min())
+        self.median = float(np.median(arr))
+        self.mean = float(arr.mean())
+        self.std = float(arr.std(ddof=1)) if len(arr) > 1 else 0.0
+        q1, q3 = np.percentile(arr, [25, 75])
+        self.iqr = float(q3 - q1)
+        self.confidence = confidence
+        self.ci_low, self.ci_high = bootstrap_ci(arr, np.median, confidence, seed=seed)
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "repeats": len(self.samples),
+            "min": self.min,
+            "median": self.median,
+            "mean": self.mean,
+            "std": self.std,
+            "iqr": self.iqr,
+            "ci_low": self.ci_low,
+            "ci_high": self.ci_high,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"BenchmarkResult(repeats={len(self.samples)}, min={self.min:.6f}s, "
+            f"median={self.median:.6f}s [{self.ci_low:.6f}, {self.ci_high:.6f}], iqr={self.iqr:.6f}s)"
+        )
+
+
+def bootstrap_ci(samples, statistic=np.median, confidence: float = 0.95,
+                 resamples: int = 2000, seed: int = 0):
+    """Percentile bootstrap confidence interval of statistic(samples)."""
+    samples = np.asarray(samples, dtype=np.float64)
+    if len(samples) < 2:
+        value = float(statistic(samples))
+        return value, value
+    rng = np.random.default_rng(seed)
+    draws = rng.choice(samples, size=(resamples, len(samples)), replace=True)
+    if statistic is np.median or statistic is np.mean:
+        stats = statistic(draws, axis=1)
+    else:
+        stats = np.apply_along_axis(statistic, 1, draws)
+    tail = (1 - confidence) / 2 * 100
+    low, high = np.percentile(stats, [tail, 100 - tail])
+    return float(low), float(high)
+
+
+class PhaseProfiler:
+    """Accumulates time spent in named phases of a scheduler.
+
+    Schedulers that accept `profiler=` call add(phase, seconds) around
+    their sort / scan / validity-check phases; without a profiler they run
+    their uninstrumented code path.
+    """
+
+    def __init__(self):
+        self.totals = defaultdict(float)
+        self.calls = defaultdict(int)
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.totals[phase] += seconds
+        self.calls[phase] += 1
+
+    def report(self) -> Dict[str, float]:
+        return dict(self.totals)
+
+    def reset(self) -> None:
+        self.totals.clear()
+        self.calls.clear()
+
+
+# Two-sided 95% Student t critical values for 1..30 degrees of freedom
+_T_CRITICAL_95 = (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+                  2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+                  2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042)
+
+
+def relative_ci_width(samples) -> float:
+    """Width of the 95% t confidence interval of the mean, relative to the mean.
+
+    inf for fewer than two samples; 0 when every sample is equal.
+    """
+    arr = np.asarray(samples, dtype=np.float64)
+    if len(arr) < 2:
+        return float("inf")
+    std = float(arr.std(ddof=1))
+    if std == 0:
+        return 0.0
+    mean = abs(float(arr.mean()))
+    if mean == 0:
+        return float("inf")
+    df = len(arr) - 1
+    # Cornish-Fisher expansion of the t quantile past the table
+    t = _T_CRITICAL_95[df - 1] if df <= 30 else 1.96 + (1.96 ** 3 + 1.96) / (4 * df)
+    return float(2 * t * std / np.sqrt(len(arr)) / mean)
+
+
+class AdaptiveTrials:
+    """Stopping rule for sweeps that add trials until the mean is tight enough.
+
+    A cell runs min_trials trials, then keeps adding rounds until the
+    relative 95% CI width of the mean of every tracked metric is at most
+    `target`, max_trials is reached, or the cell has used `budget`
+    seconds of wall time (min_trials always run). Each new round is sized
+    from the current width, since the width shrinks as 1/sqrt(trials),
+    at most doubling the trials so far and trimmed to what the remaining
+    budget allows at the observed time per trial.
+    """
+
+    def __init__(self, target: float = 0.05, min_trials: int = 5, max_trials: int = 200,
+                 budget: Optional[float] = None):
+        if not 2 <= min_trials <= max_trials:
+            raise ValueError("need 2 <= min_trials <= max_trials")
+        self.target = target
+        self.min_trials = min_trials
+        self.max_trials = max_trials
+        self.budget = budget
+
+    def next_round(self, metrics: Dict[str, List[float]], elapsed: float) -> int:
+        """Trials to add given the samples so far (0 = the cell is done)."""
+        trials = min((len(samples) for samples in metrics.values()), default=0)
+        if trials < self.min_trials:
+            return self.min_trials - trials
+        if trials >= self.max_trials or (self.budget is not None and elapsed >= self.budget):
+            return 0
+        width = max(relative_ci_width(samples) for samples in metrics.values())
+        if width <= self.target:
+            return 0
+        needed = int(np.ceil(trials * (width / self.target) ** 2)) - trials
+        count = min(max(needed, 1), trials, self.max_trials - trials)
+        if self.budget is not None:
+            per_trial = elapsed / trials
+            if per_trial > 0:
+                count = min(count, max(1, int((self.budget - elapsed) / per_trial)))
+        return count
+
+    def as_dict(self) -> Dict[str, object]:
+        return {"target": self.target, "min_trials": self.min_trials,
+                "max_trials": self.max_trials, "budget": self.budget}
@@ -0,0 +1,104 @@
+import numpy as np
+from typing import Callable, Dict, List, Optional, Sequence
+
+# Candidate cost models t(n) ~ intercept + scale * f(n)
+COST_MODELS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "n": lambda n: n,
+    "n log n": lambda n: n * np.log2(n),
+    "n^2": lambda n: n ** 2,
+    "n 2^n": lambda n: n * np.exp2(n),
+}
+
+# Two parameters per model, so two points fit every model exactly
+MIN_FIT_POINTS = 3
+
+
+class CostFit:
+    """One least-squares fit of t(n) = intercept + scale * f(n)."""
+
+    def __init__(self, model: str, intercept: float, scale: float, r2: float, rel_rmse: float, points: int):
+        self.model = model
+        self.intercept = intercept
+        self.scale = scale
+        self.r2 = r2
+        self.rel_rmse = rel_rmse
+        self.points = points
+
+    def predict(self, n) -> np.ndarray:
+        """Predicted seconds at each n."""
+        return self.intercept + self.scale * COST_MODELS[self.model](np.asarray(n, dtype=np.float64))
+
+    def as_dict(self) -> Dict[str, object]:
+        return {"model": self.model, "intercept": self.intercept, "scale": self.scale,
+                "r2": self.r2, "rel_rmse": self.rel_rmse, "points": self.points}
+
+    def __repr__(self) -> str:
+        return (f"CostFit({self.model}: {self.intercept:.3g} + {self.scale:.3g} * f(n), "
+                f"r2={self.r2:.4f}, rel_rmse={self.rel_rmse:.3f})")
+
+
+def fit_cost_model(n, seconds, model: str) -> Optional[CostFit]:
+    """Fit one candidate model to a measured series, or None if it cannot fit.
+
+    Residuals are weighted by 1/t, i.e. relative error is minimized, so
+    the small-n points count as much as the large ones even though the
+    times span several decades. The intercept absorbs fixed per-call
+    overhead; if it comes out negative the fit is redone through the
+    origin, and a model whose scale is not positive is rejected. Series
+    shorter than MIN_FIT_POINTS are rejected too: with no residual degrees
+    of freedom every model would fit perfectly.
+    """
+    n = np.asarray(n, dtype=np.float64)
+    t = np.asarray(seconds, dtype=np.float64)
+    # n 2^n overflows to inf at greedy sizes; such a series is rejected below
+    with np.errstate(over="ignore"):
+        f = COST_MODELS[model](n)
+    if len(t) < MIN_FIT_POINTS or np.any(t <= 0) or not np.all(np.isfinite(f)):
+        return None
+    design = np.column_stack([1 / t, f / t])
+    (intercept, scale), *_ = np.linalg.lstsq(design, np.ones_like(t), rcond=None)
+    if intercept < 0:
+        intercept = 0.0
+        scale = np.sum(f / t) / np.sum((f / t) ** 2)
+    if scale <= 0:
+        return None
+    predicted = intercept + scale * f
+    total = np.sum((t - t.mean()) ** 2)
+    r2 = 1 - np.sum((t - predicted) ** 2) / total if total > 0 else 1.0
+    rel_rmse = np.sqrt(np.mean(((predicted - t) / t) ** 2))
+    return CostFit(model, float(intercept), float(scale), float(r2), float(rel_rmse), len(t))
+
+
+def fit_cost_models(n, seconds, models: Sequence[str] = tuple(COST_MODELS)) -> List[CostFit]:
+    """Every candidate that fits, best (lowest relative RMSE) first."""
+    fits = [fit_cost_model(n, seconds, model) for model in models]
+    return sorted((fit for fit in fits if fit is not None), key=lambda fit: fit.rel_rmse)
+
+
+def tied_fits(fits: Sequence[CostFit], margin: float = 0.25, floor: float = 0.01) -> List[CostFit]:
+    """The fits of a fit_cost_models result that the data cannot tell apart from the best.
+
+    A fit is tied when its relative RMSE is within a factor 1 + margin of
+    the best one, with errors below `floor` (1%) counted as `floor`, so
+    two near-perfect fits are tied however small their ratio. Returns
+    just the best fit when the choice is clear, [] for no fits.
+    """
+    if not fits:
+        return []
+    limit = (1 + margin) * max(fits[0].rel_rmse, floor)
+    return [fit for fit in fits if fit.rel_rmse <= limit]
+
+
+def largest_n_within(predict_total: Callable[[List[int]], float], n_values: Sequence[int],
+                     budget: float) -> List[int]:
+    """Longest prefix of the sorted n_values whose predicted total stays within budget.
+
+    predict_total maps a list of n values to predicted seconds for the
+    whole sweep; it must not decrease as n values are added.
+    """
+    chosen = []
+    for n in sorted(n_values):
+        if predict_total(chosen + [n]) > budget:
+            break
+        chosen.append(n)
+    return chosen
@@ -0,0 +1,103 @@
+import hashlib
+import os
+import numpy as np
+from typing import Optional
+from .dataset_generator import DISTRIBUTIONS, SeedLike
+from .intervals import IntervalSet
+
+
+def _seed_key(seed: SeedLike):
+    """Stable, hashable description of a seed (Generators have no stable identity)."""
+    if isinstance(seed, np.random.SeedSequence):
+        return (seed.entropy, tuple(seed.spawn_key))
+    if isinstance(seed, (int, np.integer)):
+        return int(seed)
+    raise ValueError("cached datasets need an int or SeedSequence seed")
+
+
+class DatasetCache:
+    """On-disk store of generated datasets, reloaded as memory-mapped .npy files.
+
+    Each dataset is keyed by (n, alpha, D, seed, distribution) and saved as
+    one float64 array with rows start, finish[, weights]; a hit maps the file
+    read-only and wraps its rows in an IntervalSet without copying. File
+    mtimes serve as the LRU clock, so when the directory grows past max_bytes
+    the least recently used files are deleted first; a dataset is mapped
+    before any eviction it triggers, so the caller always gets its data.
+    """
+
+    def __init__(self, root: str = "data/cache", max_bytes: int = 4 << 30):
+        self.root = root
+        self.max_bytes = max_bytes
+        os.makedirs(root, exist_ok=True)
+
+    def path(self, n: int, alpha: float, D: int, seed: SeedLike, distribution: str) -> str:
+        key = repr((n, float(alpha), D, _seed_key(seed), distribution))
+        digest = hashlib.sha1(key.encode()).hexdigest()[:20]
+        return os.path.join(self.root, f"{distribution}_n{n}_{digest}.npy")
+
+    def get(self, n: int, alpha: float, D: int = 100, seed: SeedLike = 0,
+            distribution: str = "uniform") -> IntervalSet:
+        """Load the dataset from the cache, generating and storing it on a miss."""
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"unknown distribution {distribution!r}")
+        path = self.path(n, alpha, D, seed, distribution)
+        try:
+            arr = np.load(path, mmap_mode="r")
+            os.utime(path)  # mark as most recently used
+        except FileNotFoundError:
+            intervals = DISTRIBUTIONS[distribution](n, alpha, D, seed=seed)
+            self._store(path, intervals)
+            try:
+                # Map before evicting: an open mapping outlives the file's removal
+                arr = np.load(path, mmap_mode="r")
+            except FileNotFoundError:
+                # Another process evicted it between the write and the load
+                return intervals
+            finally:
+                self.evict(keep=path)
+        weights = arr[2] if arr.shape[0] == 3 else None
+        return IntervalSet(arr[0], arr[1], weights=weights)
+
+    def _store(self, path: str, intervals: IntervalSet) -> None:
+        rows = [intervals.start, intervals.finish]
+        if intervals.weights is not None:
+            rows.append(intervals.weights)
+        # Write to a temporary name and rename, so readers never see a partial file
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.save(f, np.stack(rows))
+        os.replace(tmp_path, path)
+
+    def evict(self, keep: Optional[str] = None) -> None:
+        """Delete least recently used datasets until the cache fits in max_bytes.
+
+        The file at `keep` (the one just written) is never deleted, even if
+        it alone exceeds max_bytes.
+        """
+        keep = os.path.basename(keep) if keep is not None else None
+        entries = []
+        for name in os.listdir(self.root):
+            if not name.endswith(".npy"):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.root, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if name == keep:
+                continue
+            try:
+                os.remove(os.path.join(self.root, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self) -> None:
+        for name in os.listdir(self.root):
+            if name.endswith(".npy"):
+                os.remove(os.path.join(self.root, name))
@@ -1,20 +1,191 @@
-import random
-from typing import List, Tuple
+import numpy as np
+from typing import List, Tuple, Union
+from .intervals import IntervalSet
 
-def generate_dataset(n: int, alpha: float, D: int = 100) -> List[Tuple[float, float]]:
+SeedLike = Union[None, int, np.random.SeedSequence, np.random.Generator]
+
+
+def make_rng(seed: SeedLike = None) -> np.random.Generator:
+    """Return a numpy Generator; an existing Generator is passed through."""
+    if isinstance(seed, np.random.Generator):
+        return seed
+    return np.random.default_rng(seed)
+
+
+def generate_dataset(n: int, alpha: float, D: int = 100, seed: SeedLike = None) -> List[Tuple[float, float]]:
     """
     Generate uniform random interval dataset
     alpha controls overlap density:
         0.1 → High overlap
         1.0 → Medium
         5.0 → Low overlap
+    Pass seed (int or numpy Generator) for a reproducible draw.
+    """
+    return generate_intervals(n, alpha, D, seed=seed).to_tuples()
+
+
+def generate_intervals(n: int, alpha: float, D: int = 100, with_ids: bool = False,
+                       seed: SeedLike = None) -> IntervalSet:
     """
+    Same distribution as generate_dataset, returned as an IntervalSet
+    built directly from arrays (no per-interval Python tuples)
+    """
+    start, finish = generate_batch(n, alpha, 1, D, seed=seed)
+    ids = np.arange(n, dtype=np.int64) if with_ids else None
+    return IntervalSet(start[0], finish[0], ids)
+
+
+def generate_batch(n: int, alpha: float, trials: int, D: int = 100,
+                   seed: SeedLike = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate `trials` independent datasets in one vectorized draw.
+    Returns (start, finish), each a float64 array of shape (trials, n);
+    row t is one dataset with start ~ U(0, alpha*n*D), duration ~ U(1, D).
+    """
+    rng = make_rng(seed)
     T = alpha * n * D
-    jobs = []
-    for _ in range(n):
-        start = random.uniform(0, T)
-        duration = random.uniform(1, D)
-        finish = start + duration
-        jobs.append((start, finish))
-    
-    return jobs
\ No newline at end of file
+    start = rng.uniform(0, T, size=(trials, n))
+    finish = start + rng.uniform(1, D, size=(trials, n))
+    return start, finish
+
+
+def generate_weighted_intervals(n: int, alpha: float, D: int = 100, W: float = 100,
+                                with_ids: bool = False, seed: SeedLike = None) -> IntervalSet:
+    """
+    Weighted variant of generate_intervals: same start/duration
+    distribution, plus weight ~ U(1, W) per interval
+    """
+    rng = make_rng(seed)
+    intervals = generate_intervals(n, alpha, D, with_ids=with_ids, seed=rng)
+    intervals.weights = rng.uniform(1, W, size=n)
+    return intervals
+
+
+def _interval_set(start, finish, with_ids: bool) -> IntervalSet:
+    ids = np.arange(len(start), dtype=np.int64) if with_ids else None
+    return IntervalSet(start, finish, ids)
+
+
+def generate_clustered_intervals(n: int, alpha: float, D: int = 100, with_ids: bool = False,
+                                 seed: SeedLike = None, burst: int = 32) -> IntervalSet:
+    """
+    Bursty arrivals: n // burst cluster centers ~ U(0, alpha*n*D), each
+    start = center + N(0, D), duration ~ U(1, D). Overlap is high inside
+    a burst and low between bursts, for the same overall span as uniform.
+    """
+    rng = make_rng(seed)
+    centers = rng.uniform(0, alpha * n * D, size=max(1, n // burst))
+    start = centers[rng.integers(len(centers), size=n)] + rng.normal(0, D, size=n)
+    return _interval_set(start, start + rng.uniform(1, D, size=n), with_ids)
+
+
+def generate_pareto_intervals(n: int, alpha: float, D: int = 100, with_ids: bool = False,
+                              seed: SeedLike = None, shape: float = 1.5) -> IntervalSet:
+    """
+    Uniform starts with heavy-tailed durations 1 + (D/2) * Lomax(shape):
+    mean about 1 + D for shape 1.5, but a few intervals span huge ranges.
+    """
+    rng = make_rng(seed)
+    start = rng.uniform(0, alpha * n * D, size=n)
+    return _interval_set(start, start + 1 + rng.pareto(shape, size=n) * (D / 2), with_ids)
+
+
+def generate_nested_intervals(n: int, alpha: float, D: int = 100, with_ids: bool = False,
+                              seed: SeedLike = None, depth: int = 8) -> IntervalSet:
+    """
+    Groups of `depth` intervals sharing a center ~ U(0, alpha*n*D), each
+    [center - r, center + r] with r ~ U(0.5, D/2), so every group is a
+    chain of nested intervals and only its innermost one fits in a schedule.
+    """
+    rng = make_rng(seed)
+    centers = rng.uniform(0, alpha * n * D, size=-(-n // depth))
+    center = np.repeat(centers, depth)[:n]
+    radius = rng.uniform(0.5, D / 2, size=n)
+    return _interval_set(center - radius, center + radius, with_ids)
+
+
+def generate_presorted_intervals(n: int, alpha: float, D: int = 100, with_ids: bool = False,
+                                 seed: SeedLike = None) -> IntervalSet:
+    """Uniform intervals already in finish-time (EFT) order."""
+    intervals = generate_intervals(n, alpha, D, seed=seed)
+    order = intervals.finish.argsort(kind="stable")
+    return _interval_set(intervals.start[order], intervals.finish[order], with_ids)
+
+
+def generate_reverse_sorted_intervals(n: int, alpha: float, D: int = 100, with_ids: bool = False,
+                                      seed: SeedLike = None) -> IntervalSet:
+    """Uniform intervals in decreasing finish-time order."""
+    intervals = generate_intervals(n, alpha, D, seed=seed)
+    order = intervals.finish.argsort(kind="stable")[::-1]
+    return _interval_set(intervals.start[order], intervals.finish[order], with_ids)
+
+
+def generate_duplicate_intervals(n: int, alpha: float, D: int = 100, with_ids: bool = False,
+                                 seed: SeedLike = None, repeats: int = 8) -> IntervalSet:
+    """
+    Many equal endpoints: starts take only n // repeats distinct values
+    spread over [0, alpha*n*D) and durations are D/2 or D, so start and
+    finish keys both repeat about `repeats` times.
+    """
+    rng = make_rng(seed)
+    grid = np.sort(rng.uniform(0, alpha * n * D, size=max(1, n // repeats)))
+    start = grid[rng.integers(len(grid), size=n)]
+    return _interval_set(start, start + rng.choice([D / 2, D], size=n), with_ids)
+
+
+def generate_adversarial_est_intervals(n: int, alpha: float, D: int = 100, with_ids: bool = False,
+                                       seed: SeedLike = None, group: int = 8) -> IntervalSet:
+    """
+    Groups of one long interval plus group - 1 short back-to-back ones it
+    covers; the long one starts first, so EST takes it and loses the rest
+    (ratio about 1 / (group - 1)). Groups are alpha*D apart; input order
+    is shuffled.
+    """
+    rng = make_rng(seed)
+    groups = -(-n // group)
+    k = group - 1
+    length = rng.uniform(D / 2, D, size=groups)  # length of each short interval
+    base = np.cumsum(k * length + alpha * D) - (k * length + alpha * D)
+    slot = np.arange(k)
+    short_start = base[:, None] + slot * length[:, None]
+    start = np.column_stack([base - 0.5, short_start]).ravel()
+    finish = np.column_stack([base + k * length, short_start + length[:, None]]).ravel()
+    order = rng.permutation(n)
+    return _interval_set(start[:n][order], finish[:n][order], with_ids)
+
+
+def generate_adversarial_sd_intervals(n: int, alpha: float, D: int = 100, with_ids: bool = False,
+                                      seed: SeedLike = None) -> IntervalSet:
+    """
+    Groups of two touching long intervals and one short interval straddling
+    their boundary; SD takes the short one and blocks both (ratio 1/2).
+    Groups are alpha*D apart; input order is shuffled.
+    """
+    rng = make_rng(seed)
+    groups = -(-n // 3)
+    length = rng.uniform(D / 2, D, size=groups)
+    half = rng.uniform(0.05, 0.25, size=groups) * length  # half-width of the short interval
+    base = np.cumsum(2 * length + alpha * D) - (2 * length + alpha * D)
+    middle = base + length
+    start = np.column_stack([base, middle, middle - half]).ravel()
+    finish = np.column_stack([middle, middle + length, middle + half]).ravel()
+    order = rng.permutation(n)
+    return _interval_set(start[:n][order], finish[:n][order], with_ids)
+
+
+# Named generators, all called as fn(n, alpha, D, seed=...) -> IntervalSet
+DISTRIBUTIONS = {
+    "uniform": generate_intervals,
+    "weighted": generate_weighted_intervals,
+    "clustered": generate_clustered_intervals,
+    "pareto": generate_pareto_intervals,
+    "nested": generate_nested_intervals,
+    "presorted": generate_presorted_intervals,
+    "reverse_sorted": generate_reverse_sorted_intervals,
+    "duplicates": generate_duplicate_intervals,
+    "adversarial_est": generate_adversarial_est_intervals,
+    "adversarial_sd": generate_adversarial_sd_intervals,
+}
+
+# Unweighted input shapes for the runtime and quality sweeps
+WORKLOADS = tuple(name for name in DISTRIBUTIONS if name != "weighted")
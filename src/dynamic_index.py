@@ -0,0 +1,257 @@
+import random
+from typing import Iterator, List, Optional, Tuple
+
+NEG_INF = float("-inf")
+
+
+class _Node:
+    __slots__ = ("key", "job", "prio", "left", "right", "max_finish")
+
+    def __init__(self, key, job, prio):
+        self.key = key
+        self.job = job  # (start, finish, id)
+        self.prio = prio
+        self.left = None
+        self.right = None
+        self.max_finish = job[1]
+
+
+def _update(node: _Node) -> None:
+    m = node.job[1]
+    if node.left is not None and node.left.max_finish > m:
+        m = node.left.max_finish
+    if node.right is not None and node.right.max_finish > m:
+        m = node.right.max_finish
+    node.max_finish = m
+
+
+class Treap:
+    """Randomized balanced BST keyed by unique tuples, augmented with the
+    maximum finish time of each subtree.
+
+    insert/remove/predecessor are O(log n) expected, iter_from is O(log n)
+    to start plus O(1) amortized per step.
+    """
+
+    def __init__(self, items=(), rng: Optional[random.Random] = None):
+        self.rng = rng or random.Random(0)
+        self.root = None
+        self.size = 0
+        self._build(items)
+
+    def _build(self, items) -> None:
+        """Build from (key, job) pairs already sorted by key in O(n)."""
+        stack = []
+        for key, job in items:
+            node = _Node(key, job, self.rng.random())
+            last = None
+            while stack and stack[-1].prio < node.prio:
+                last = stack.pop()
+                _update(last)
+            node.left = last
+            if stack:
+                stack[-1].right = node
+            stack.append(node)
+            self.size += 1
+        while stack:
+            last = stack.pop()
+            _update(last)
+        self.root = last if self.size else None
+
+    def _split(self, node, key):
+        """Split into (keys < key, keys >= key)."""
+        if node is None:
+            return None, None
+        if node.key < key:
+            left, right = self._split(node.right, key)
+            node.right = left
+            _update(node)
+            return node, right
+        left, right = self._split(node.left, key)
+        node.left = right
+        _update(node)
+        return left, node
+
+    def _merge(self, a, b):
+        """Merge two treaps where every key in a is < every key in b."""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        if a.prio > b.prio:
+            a.right = self._merge(a.right, b)
+            _update(a)
+            return a
+        b.left = self._merge(a, b.left)
+        _update(b)
+        return b
+
+    def insert(self, key, job) -> None:
+        left, right = self._split(self.root, key)
+        self.root = self._merge(self._merge(left, _Node(key, job, self.rng.random())), right)
+        self.size += 1
+
+    def remove(self, key) -> None:
+        self.root = self._remove(self.root, key)
+        self.size -= 1
+
+    def _remove(self, node, key):
+        if node is None:
+            raise KeyError(key)
+        if key == node.key:
+            return self._merge(node.left, node.right)
+        if key < node.key:
+            node.left = self._remove(node.left, key)
+        else:
+            node.right = self._remove(node.right, key)
+        _update(node)
+        return node
+
+    def predecessor(self, key):
+        """Job with the largest key < key, or None."""
+        node, best = self.root, None
+        while node is not None:
+            if node.key < key:
+                best = node
+                node = node.right
+            else:
+                node = node.left
+        return best.job if best is not None else None
+
+    def iter_from(self, key=None) -> Iterator[tuple]:
+        """Jobs in key order, starting at the first key >= key."""
+        stack = []
+        node = self.root
+        while node is not None:
+            if key is None or node.key >= key:
+                stack.append(node)
+                node = node.left
+            else:
+                node = node.right
+        while stack:
+            node = stack.pop()
+            yield node.job
+            node = node.right
+            while node is not None:
+                stack.append(node)
+                node = node.left
+
+    def __len__(self) -> int:
+        return self.size
+
+
+class DynamicIntervalIndex:
+    """Interval set supporting insert/remove, conflict queries and an
+    always-current EFT selection.
+
+    Two treaps hold the intervals, one keyed by (start, id) and one by
+    (finish, id); a third holds the currently selected intervals in finish
+    order. Every subtree records its maximum finish, so conflicts(s, f)
+    walks only the start-ordered subtrees that can contain an interval
+    with start < f and finish > s.
+
+    After an update, the EFT selection is recomputed only from the changed
+    position onwards in finish order, starting from the last selected finish
+    before it. The scan stops as soon as it re-selects an interval that was
+    already selected, because from that point on the state (last selected
+    finish) is the same as before and every later decision is unchanged.
+    Ties in finish time break by insertion order, as in the stable
+    IntervalSet path of EarliestFinishTime.
+    """
+
+    def __init__(self, jobs=(), seed: int = 0):
+        rng = random.Random(seed)
+        records = [(float(s), float(f), i) for i, (s, f) in enumerate(jobs)]
+        self._next_id = len(records)
+        self._jobs = {job[2]: job for job in records}
+        self._by_start = Treap(sorted(((job[0], job[2]), job) for job in records), rng)
+        self._by_finish = Treap(sorted(((job[1], job[2]), job) for job in records), rng)
+
+        selected = []
+        last_finish = NEG_INF
+        for job in self._by_finish.iter_from():
+            if job[0] >= last_finish:
+                selected.append(((job[1], job[2]), job))
+                last_finish = job[1]
+        self._selected = Treap(selected, rng)
+        self._selected_ids = {job[2] for _, job in selected}
+        # Intervals examined by the most recent incremental rescan
+        self.last_rescan_length = 0
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def insert(self, start: float, finish: float) -> int:
+        """Add [start, finish) and update the selection; returns the new id."""
+        job = (float(start), float(finish), self._next_id)
+        self._next_id += 1
+        self._jobs[job[2]] = job
+        self._by_start.insert((job[0], job[2]), job)
+        self._by_finish.insert((job[1], job[2]), job)
+        self._rescan((job[1], job[2]))
+        return job[2]
+
+    def remove(self, job_id: int) -> None:
+        """Delete an interval by id and update the selection."""
+        job = self._jobs.pop(job_id)
+        self._by_start.remove((job[0], job_id))
+        self._by_finish.remove((job[1], job_id))
+        if job_id in self._selected_ids:
+            self._selected_ids.discard(job_id)
+            self._selected.remove((job[1], job_id))
+            self._rescan((job[1], job_id))
+        else:
+            # An unselected interval never changed the scan state
+            self.last_rescan_length = 0
+
+    def _rescan(self, from_key) -> None:
+        """Re-run the EFT scan from from_key until it rejoins the old selection."""
+        previous = self._selected.predecessor(from_key)
+        last_finish = previous[1] if previous is not None else NEG_INF
+        examined = 0
+        for job in self._by_finish.iter_from(from_key):
+            examined += 1
+            was_selected = job[2] in self._selected_ids
+            if job[0] >= last_finish:
+                if was_selected:
+                    break
+                self._selected_ids.add(job[2])
+                self._selected.insert((job[1], job[2]), job)
+                last_finish = job[1]
+            elif was_selected:
+                self._selected_ids.discard(job[2])
+                self._selected.remove((job[1], job[2]))
+        self.last_rescan_length = examined
+
+    def conflicts(self, start: float, finish: float) -> List[Tuple[float, float, int]]:
+        """All stored (start, finish, id) overlapping [start, finish), in start order."""
+        found = []
+        stack = []
+        node = self._by_start.root
+        # Iterative in-order walk, pruning subtrees that end by `start`
+        # and right subtrees whose starts are all >= `finish`
+        while stack or node is not None:
+            if node is not None and node.max_finish > start:
+                stack.append(node)
+                node = node.left
+                continue
+            if not stack:
+                break
+            node = stack.pop()
+            if node.job[0] >= finish:
+                break
+            if node.job[1] > start:
+                found.append(node.job)
+            node = node.right
+        return found
+
+    def intervals(self) -> List[Tuple[float, float]]:
+        """All stored (start, finish) pairs in insertion order."""
+        return [(job[0], job[1]) for job in self._jobs.values()]
+
+    def selected(self) -> List[Tuple[float, float]]:
+        """Current EFT selection as (start, finish) pairs in finish order."""
+        return [(job[0], job[1]) for job in self._selected.iter_from()]
+
+    def selected_count(self) -> int:
+        return len(self._selected_ids)
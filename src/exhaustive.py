@@ -1,33 +1,258 @@
 # src/exhaustive.py
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Tuple
+from .intervals import IntervalSet
+
+
+def _search_masks(task):
+    """Best subset among masks lo..hi-1 -> (count, mask); the first mask wins ties"""
+    jobs, lo, hi = task
+    n = len(jobs)
+    max_count = 0
+    best_mask = 0
+
+    for mask in range(lo, hi):
+        subset = [jobs[i] for i in range(n) if (mask & (1 << i))]
+
+        if BruteForceScheduler.is_valid(subset):
+            if len(subset) > max_count:
+                max_count = len(subset)
+                best_mask = mask
+
+    return max_count, best_mask
+
 
 class BruteForceScheduler:
-    def __init__(self, jobs: List[Tuple[float, float]]):
+    def __init__(self, jobs: List[Tuple[float, float]], profiler=None, workers: int = 1, pool=None,
+                 chunks_per_worker: int = 4):
+        if profiler is not None and (workers > 1 or pool is not None):
+            raise ValueError("profiler is not supported in parallel mode: the phases run in worker processes")
         self.jobs = jobs
+        # Optional benchmark.PhaseProfiler: receives "subset" (building each
+        # mask's subset list) and "validity" (is_valid) time on tuple lists,
+        # and "sort" (ranking by finish once) and "validity" (walking each
+        # mask's bits) on IntervalSets, which build no subsets
+        self.profiler = profiler
+        # Parallel mode (workers > 1 or a pool): the mask range is cut into
+        # about workers * chunks_per_worker contiguous chunks searched on a
+        # process pool; pass a ProcessPoolExecutor as pool to reuse workers
+        self.workers = workers
+        self.pool = pool
+        self.chunks_per_worker = chunks_per_worker
 
     def schedule_jobs(self) -> List[Tuple[float, float]]:
         """Find optimal schedule using exhaustive search (2^n)"""
+        if self.workers > 1 or self.pool is not None:
+            return self._schedule_parallel()
+        if isinstance(self.jobs, IntervalSet):
+            return self._schedule_interval_set()
+        if self.profiler is not None:
+            return self._schedule_profiled()
+
+        # Try all 2^n subsets
+        best_mask = _search_masks((self.jobs, 0, 1 << len(self.jobs)))[1]
+        return [self.jobs[i] for i in range(len(self.jobs)) if (best_mask & (1 << i))]
+
+    def _schedule_parallel(self):
+        """schedule_jobs with the 2^n masks split into chunks across processes.
+
+        Chunks are reduced in mask order, keeping a later chunk only if it
+        is strictly better, so the result is the serial one (the first
+        maximum mask) regardless of the number of workers.
+        """
+        jobs = self.jobs.to_tuples() if isinstance(self.jobs, IntervalSet) else self.jobs
+        total = 1 << len(jobs)
+        n_chunks = min(total, max(1, self.workers * self.chunks_per_worker))
+        bounds = [total * k // n_chunks for k in range(n_chunks + 1)]
+        tasks = [(jobs, lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:])]
+        if self.pool is not None:
+            parts = self.pool.map(_search_masks, tasks)
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                parts = list(pool.map(_search_masks, tasks))
+
+        max_count, best_mask = 0, 0
+        for count, mask in parts:
+            if count > max_count:
+                max_count, best_mask = count, mask
+        chosen = [i for i in range(len(jobs)) if (best_mask & (1 << i))]
+        if isinstance(self.jobs, IntervalSet):
+            return self.jobs.take(chosen)
+        return [jobs[i] for i in chosen]
+
+    def _schedule_profiled(self) -> List[Tuple[float, float]]:
+        """schedule_jobs with subset building and validity checks timed separately"""
         n = len(self.jobs)
         max_count = 0
         best_schedule = []
+        subset_time = 0.0
+        validity_time = 0.0
 
-        # Try all 2^n subsets
         for mask in range(1 << n):
+            t0 = time.perf_counter()
             subset = [self.jobs[i] for i in range(n) if (mask & (1 << i))]
-            
-            if self.is_valid(subset):
-                if len(subset) > max_count:
-                    max_count = len(subset)
-                    best_schedule = subset[:]
+            t1 = time.perf_counter()
+            valid = self.is_valid(subset)
+            validity_time += time.perf_counter() - t1
+            subset_time += t1 - t0
+
+            if valid and len(subset) > max_count:
+                max_count = len(subset)
+                best_schedule = subset[:]
 
+        self.profiler.add("subset", subset_time)
+        self.profiler.add("validity", validity_time)
         return best_schedule
 
-    def is_valid(self, schedule: List[Tuple[float, float]]) -> bool:
-        """Check if schedule has no overlapping intervals"""
+    def _schedule_interval_set(self) -> IntervalSet:
+        """Same 2^n search on an IntervalSet, without per-mask tuple lists.
+
+        Jobs are ranked by (finish, start) once up front, as in is_valid, so
+        each mask is checked by walking its bits in that order instead of
+        re-sorting the subset.
+        """
+        t0 = time.perf_counter()
+        n = len(self.jobs)
+        order = np.lexsort((self.jobs.start, self.jobs.finish)).tolist()
+        start = self.jobs.start.tolist()
+        finish = self.jobs.finish.tolist()
+        t1 = time.perf_counter()
+        max_count = 0
+        best_mask = 0
+
+        for mask in range(1 << n):
+            count = 0
+            last_finish = None
+            valid = True
+            for i in order:
+                if mask & (1 << i):
+                    if last_finish is not None and start[i] < last_finish:
+                        valid = False
+                        break
+                    last_finish = finish[i]
+                    count += 1
+            if valid and count > max_count:
+                max_count = count
+                best_mask = mask
+
+        if self.profiler is not None:
+            self.profiler.add("sort", t1 - t0)
+            self.profiler.add("validity", time.perf_counter() - t1)
+        return self.jobs.take([i for i in range(n) if best_mask & (1 << i)])
+
+    @staticmethod
+    def is_valid(schedule: List[Tuple[float, float]]) -> bool:
+        """Check if schedule has no overlapping intervals
+
+        Sorting by (finish, start) puts a zero-length job at x after every
+        job finishing at x that it touches, so checking neighbours gives
+        the same answer as the pairwise test s_i < f_j and s_j < f_i.
+        """
         if not schedule:
             return True
-        schedule = sorted(schedule, key=lambda x: x[1])  # sort by finish time
+        schedule = sorted(schedule, key=lambda x: (x[1], x[0]))  # sort by finish, then start
         for i in range(1, len(schedule)):
             if schedule[i][0] < schedule[i-1][1]:
                 return False
-        return True
\ No newline at end of file
+        return True
+
+class BitmaskExhaustiveScheduler:
+    """Exhaustive search over subsets using precomputed pairwise conflict bitmasks.
+
+    conflicts[i] has bit j set when jobs i and j overlap (s_i < f_j and
+    s_j < f_i, so touching endpoints are compatible as in is_valid). Two
+    engines, both exact:
+
+    - "gray": visits all 2^n subsets in Gray-code order. Each step flips
+      one job in or out and updates the subset size and the number of
+      conflicting pairs with one AND + popcount, so the whole search is
+      Theta(2^n) word operations instead of BruteForceScheduler's
+      per-mask list building and sorting. Ties between maximum subsets go
+      to the numerically smallest mask, the one BruteForceScheduler keeps.
+    - "bnb": depth-first branch-and-bound over independent sets. Jobs are
+      branched on from the highest index down, include first. A branch is
+      cut when its size plus the number of still-compatible jobs cannot
+      beat the best found. Worst case O(2^n); ties go to the first maximum
+      found (the numerically largest mask).
+
+    self.visited is the number of subsets (gray) or search nodes (bnb)
+    examined by the last schedule_jobs call.
+    """
+
+    METHODS = ("gray", "bnb")
+
+    def __init__(self, jobs, method: str = "gray"):
+        if method not in self.METHODS:
+            raise ValueError(f"unknown method {method!r}; expected one of {self.METHODS}")
+        self.jobs = jobs
+        self.method = method
+        self.visited = 0
+
+    def conflict_masks(self) -> List[int]:
+        if isinstance(self.jobs, IntervalSet):
+            start, finish = self.jobs.start.tolist(), self.jobs.finish.tolist()
+        else:
+            start = [job[0] for job in self.jobs]
+            finish = [job[1] for job in self.jobs]
+        n = len(start)
+        masks = []
+        for i in range(n):
+            mask = 0
+            for j in range(n):
+                if j != i and start[i] < finish[j] and start[j] < finish[i]:
+                    mask |= 1 << j
+            masks.append(mask)
+        return masks
+
+    def schedule_jobs(self):
+        conflicts = self.conflict_masks()
+        best_mask = self._gray(conflicts) if self.method == "gray" else self._branch_and_bound(conflicts)
+        chosen = [i for i in range(len(conflicts)) if best_mask >> i & 1]
+        if isinstance(self.jobs, IntervalSet):
+            return self.jobs.take(chosen)
+        return [self.jobs[i] for i in chosen]
+
+    def _gray(self, conflicts: List[int]) -> int:
+        mask = size = bad_pairs = 0
+        best_count = best_mask = 0
+        for k in range(1, 1 << len(conflicts)):
+            # Gray code k ^ (k >> 1) differs from its predecessor in the lowest set bit of k
+            i = (k & -k).bit_length() - 1
+            bit = 1 << i
+            if mask & bit:
+                mask ^= bit
+                size -= 1
+                bad_pairs -= (conflicts[i] & mask).bit_count()
+            else:
+                bad_pairs += (conflicts[i] & mask).bit_count()
+                mask |= bit
+                size += 1
+            if not bad_pairs and size >= best_count and (size > best_count or mask < best_mask):
+                best_count, best_mask = size, mask
+        self.visited = 1 << len(conflicts)
+        return best_mask
+
+    def _branch_and_bound(self, conflicts: List[int]) -> int:
+        best_count = best_mask = 0
+        visited = 0
+
+        def search(mask, count, candidates):
+            # candidates: jobs not yet decided that are compatible with mask
+            nonlocal best_count, best_mask, visited
+            visited += 1
+            if count + candidates.bit_count() <= best_count:
+                return
+            if not candidates:
+                best_count, best_mask = count, mask
+                return
+            j = candidates.bit_length() - 1
+            bit = 1 << j
+            rest = candidates ^ bit
+            search(mask | bit, count + 1, rest & ~conflicts[j])
+            search(mask, count, rest)
+
+        search(0, 0, (1 << len(conflicts)) - 1)
+        self.visited = visited
+        return best_mask
@@ -3,20 +3,660 @@ import numpy as np
 import matplotlib.pyplot as plt
 import pandas as pd  
 import os  
+import json
+import tempfile
+import tracemalloc
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from typing import List, Dict
-from .dataset_generator import generate_dataset
-from .greedy import EarliestFinishTime, EarlierStartTime, ShortestDuration
-from .exhaustive import BruteForceScheduler
+from .dataset_generator import generate_batch, DISTRIBUTIONS, WORKLOADS
+from .dataset_cache import DatasetCache
+from .results_store import ResultsStore
+from .baselines import BaselineRegistry, git_revision
+from .complexity import MIN_FIT_POINTS, CostFit, fit_cost_models, largest_n_within, tied_fits
+from .benchmark import BenchmarkResult, PhaseProfiler, machine_info, measure, measure_memory
+from .greedy import EarliestFinishTime, EarlierStartTime, ShortestDuration, PointerJumpEarliestFinishTime
+from .sorting import SORT_BACKENDS
+from .batch import schedule_batch
+from .exhaustive import BruteForceScheduler, BitmaskExhaustiveScheduler
+from .optimal import ExactOptimalScheduler
+from .intervals import IntervalSet
+from .weighted import WeightedIntervalScheduler
+from .partitioning import IntervalPartitioning
+from .dynamic_index import DynamicIntervalIndex
+from .parallel_eft import ParallelEarliestFinishTime
+from .external import ExternalEarliestFinishTime, write_intervals, read_intervals
+
+# Sweep identifiers, used in per-cell seed derivation
+QUALITY, GREEDY, EXHAUSTIVE, WEIGHTED, EXTERNAL, SORT, PHASE, PARTITION, DYNAMIC, PARALLEL_EFT, BITMASK, EXHAUSTIVE_SCALING = range(12)
+
+# Names under which each sweep's cells are checkpointed in the ResultsStore
+SWEEP_NAMES = {
+    QUALITY: "quality",
+    GREEDY: "greedy",
+    EXHAUSTIVE: "exhaustive",
+    WEIGHTED: "weighted",
+    EXTERNAL: "external",
+    SORT: "sort_backend",
+    PHASE: "phase_profile",
+    PARTITION: "partition",
+    DYNAMIC: "dynamic_update",
+    PARALLEL_EFT: "parallel_eft",
+    BITMASK: "exhaustive_bitmask",
+    EXHAUSTIVE_SCALING: "exhaustive_scaling",
+}
+
+# Schedulers available to the phase-profiling sweep
+PROFILED_SCHEDULERS = {
+    "EFT": EarliestFinishTime,
+    "EST": EarlierStartTime,
+    "SD": ShortestDuration,
+    "EFT-PJ": PointerJumpEarliestFinishTime,
+    "BruteForce": BruteForceScheduler,
+}
+
+# Algorithms timed by each runtime sweep, looked up inside the worker so
+# tasks only carry plain data across the process boundary.
+TIMED_ALGORITHMS = {
+    GREEDY: {
+        "EFT": lambda jobs: EarliestFinishTime(jobs).schedule_jobs(),
+        "EST": lambda jobs: EarlierStartTime(jobs).schedule_jobs(),
+        "SD": lambda jobs: ShortestDuration(jobs).schedule_jobs(),
+    },
+    EXHAUSTIVE: {
+        "time": lambda jobs: BruteForceScheduler(jobs).schedule_jobs(),
+    },
+    BITMASK: {
+        "gray": lambda jobs: BitmaskExhaustiveScheduler(jobs, "gray").schedule_jobs(),
+        "bnb": lambda jobs: BitmaskExhaustiveScheduler(jobs, "bnb").schedule_jobs(),
+    },
+    WEIGHTED: {
+        "WIS": lambda jobs: WeightedIntervalScheduler(jobs).schedule_jobs(),
+    },
+    PARTITION: {
+        "IP": lambda jobs: IntervalPartitioning(jobs).schedule_jobs(),
+    },
+}
+
+# Runtime series the complexity fits are drawn from:
+# sweep -> (CSV, {algorithm: mean-seconds column}, the sweep's default n_values)
+FIT_SOURCES = {
+    "greedy": ("data/greedy_runtime_results.csv",
+               {"EFT": "EFT_time_seconds_mean", "EST": "EST_time_seconds_mean", "SD": "SD_time_seconds_mean"},
+               [2**i for i in range(10, 21)]),
+    "exhaustive": ("data/exhaustive_runtime_results.csv", {"BruteForce": "time_seconds_mean"}, list(range(5, 21))),
+}
+
+# (sweep, alpha, n) cells this process has already warmed up in the
+# current sweep; cleared when a sweep starts (see _reset_warmup)
+_warmed_up = set()
+
+# Warm process pools of the parallel-scheduler sweeps, by worker count
+_trial_pools = {}
+
+
+def _usable_cores():
+    """Cores this process may run on (its affinity mask where supported)"""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _reset_warmup():
+    """Forget warmed-up cells, so the next sweep warms each cell up again.
+
+    Pools are created per sweep, so only this process's set can hold
+    cells from an earlier sweep or runner.
+    """
+    _warmed_up.clear()
+
+
+def _pin_worker(counter, cores):
+    """Pool initializer: pin each worker process to its own core.
+
+    The runner never starts more workers than len(cores), so no two
+    workers share a core.
+    """
+    with counter.get_lock():
+        index = counter.value
+        counter.value += 1
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {cores[index % len(cores)]})
+
+
+def _quality_cell(task):
+    """Trials of one (alpha, n) quality cell -> (EFT, EST, SD) ratio lists
+
+    seed is either one SeedSequence for all `trials` datasets, or a list
+    with one SeedSequence per trial (adaptive runs), so each trial's
+    dataset does not depend on how the trials are split into tasks.
+    """
+    alpha, n, trials, seed, optimal, batch, distribution = task
+    use_exact = optimal == "exact"
+    opt_class = ExactOptimalScheduler if use_exact else BruteForceScheduler
+    eft_ratio, est_ratio, sd_ratio = [], [], []
+
+    if isinstance(seed, list):
+        if distribution == "uniform":
+            draws = [generate_batch(n, alpha, 1, seed=s) for s in seed]
+            starts = np.concatenate([start for start, _ in draws]).reshape(trials, n)
+            finishes = np.concatenate([finish for _, finish in draws]).reshape(trials, n)
+        else:
+            datasets = [DISTRIBUTIONS[distribution](n, alpha, 100, seed=s) for s in seed]
+            starts = np.array([jobs.start for jobs in datasets]).reshape(trials, n)
+            finishes = np.array([jobs.finish for jobs in datasets]).reshape(trials, n)
+    elif distribution == "uniform":
+        # All trials for this (alpha, n) drawn in one vectorized batch
+        starts, finishes = generate_batch(n, alpha, trials, seed=seed)
+    else:
+        datasets = [DISTRIBUTIONS[distribution](n, alpha, 100, seed=child) for child in seed.spawn(trials)]
+        starts = np.array([jobs.start for jobs in datasets]).reshape(trials, n)
+        finishes = np.array([jobs.finish for jobs in datasets]).reshape(trials, n)
+    if batch:
+        # Heuristics scored for every trial in one call each
+        counts = {h: schedule_batch(starts, finishes, heuristic=h)[0] for h in ("EFT", "EST", "SD")}
+    for t in range(trials):
+        if use_exact:
+            jobs = IntervalSet(starts[t], finishes[t])
+        else:
+            jobs = list(zip(starts[t].tolist(), finishes[t].tolist()))
+        
+        # Optimal (exhaustive or exact oracle)
+        opt_count = len(opt_class(jobs).schedule_jobs())
+        
+        # Greedy Algorithms
+        if batch:
+            eft_count, est_count, sd_count = counts["EFT"][t], counts["EST"][t], counts["SD"][t]
+        else:
+            eft_count = len(EarliestFinishTime(jobs).schedule_jobs())
+            est_count = len(EarlierStartTime(jobs).schedule_jobs())
+            sd_count  = len(ShortestDuration(jobs).schedule_jobs())
+        
+        eft_ratio.append(float(eft_count / opt_count) if opt_count > 0 else 1.0)
+        est_ratio.append(float(est_count / opt_count) if opt_count > 0 else 1.0)
+        sd_ratio.append(float(sd_count / opt_count) if opt_count > 0 else 1.0)
+    return eft_ratio, est_ratio, sd_ratio
+
+
+def _load_dataset(alpha, n, seed, cache, distribution="uniform"):
+    """Generate a dataset, or load it memory-mapped from the cache if one is configured.
+
+    cache is None or (root, max_bytes) for a DatasetCache.
+    """
+    if cache is None:
+        return DISTRIBUTIONS[distribution](n, alpha, 100, seed=seed)
+    return DatasetCache(*cache).get(n, alpha, 100, seed=seed, distribution=distribution)
+
+
+def _timed_trial(task):
+    """One recorded trial of a runtime sweep -> {algorithm: seconds}
+
+    Each algorithm is timed on its own, one after another, so a worker
+    never overlaps two measurements, with the GC paused (benchmark.measure).
+    The first trial of a cell seen by a process is preceded by an
+    unrecorded warmup run of every algorithm on the same dataset.
+    With columnar set the algorithms get the IntervalSet as loaded
+    (memory-mapped when cached) instead of a list of tuples built from it.
+    With profile_memory set, an extra untimed run per algorithm under
+    tracemalloc adds "{algo}_peak_bytes" and "{algo}_retained_blocks".
+    """
+    sweep, alpha, n, seed, cache, columnar, profile_memory, distribution = task
+    if sweep == WEIGHTED:
+        jobs = _load_dataset(alpha, n, seed, cache, "weighted")
+    else:
+        jobs = _load_dataset(alpha, n, seed, cache, distribution)
+        if not columnar:
+            jobs = jobs.to_tuples()
+    algorithms = TIMED_ALGORITHMS[sweep]
+
+    if (sweep, alpha, n, distribution) not in _warmed_up:
+        for run in algorithms.values():
+            run(jobs)
+        _warmed_up.add((sweep, alpha, n, distribution))
+
+    times = {}
+    for name, run in algorithms.items():
+        times[name] = measure(lambda: run(jobs))
+    if profile_memory:
+        for name, run in algorithms.items():
+            times[f"{name}_peak_bytes"], times[f"{name}_retained_blocks"] = measure_memory(lambda: run(jobs))
+    return times
+
+
+def _sort_backend_trial(task):
+    """One trial of the sort-backend sweep -> {(algo, backend): (sort_s, scan_s)}
+
+    Sort and scan are timed separately on the tuple-list input, so the
+    sort cost of each backend can be told apart from the common scan.
+    """
+    alpha, n, seed, backends, cache = task
+    jobs = _load_dataset(alpha, n, seed, cache).to_tuples()
+    schedulers = {"EFT": EarliestFinishTime, "EST": EarlierStartTime, "SD": ShortestDuration}
+
+    if (SORT, alpha, n) not in _warmed_up:
+        for scheduler in schedulers.values():
+            for backend in backends:
+                scheduler(jobs, sort_backend=backend).schedule_jobs()
+        _warmed_up.add((SORT, alpha, n))
+
+    times = {}
+    for algo, scheduler in schedulers.items():
+        for backend in backends:
+            run = scheduler(jobs, sort_backend=backend)
+            sort_time = measure(run.sort)
+            times[(algo, backend)] = (sort_time, measure(run.scan))
+    return times
+
+
+def _external_trial(task):
+    """One trial of the external sweep -> {path: seconds}, plus peak bytes if requested
+
+    Both paths read the same interval file written to a private temp dir.
+    When measure_memory is set, an untimed run of each path under
+    tracemalloc precedes the timed runs and doubles as the warmup.
+    """
+    alpha, n, seed, cache, chunk_size, measure_memory = task
+    paths = {
+        "in_memory": lambda path: EarliestFinishTime(read_intervals(path)).schedule_jobs(),
+        # Selection is streamed out so only the sort/merge buffers stay resident
+        "external": lambda path: ExternalEarliestFinishTime(path, chunk_size=chunk_size).schedule_to_file(os.devnull),
+    }
+    result = {}
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = os.path.join(tmp_dir, "intervals.bin")
+        write_intervals(path, _load_dataset(alpha, n, seed, cache))
+        if measure_memory:
+            for name, run in paths.items():
+                tracemalloc.start()
+                run(path)
+                result[f"{name}_peak_bytes"] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+        for name, run in paths.items():
+            result[name] = measure(lambda: run(path))
+    return result
+
+
+def _phase_trial(task):
+    """One trial of the phase-profiling sweep -> {"algo/phase": seconds}"""
+    alpha, n, seed, algorithms, cache = task
+    jobs = _load_dataset(alpha, n, seed, cache).to_tuples()
+    if (PHASE, alpha, n) not in _warmed_up:
+        for algo in algorithms:
+            PROFILED_SCHEDULERS[algo](jobs).schedule_jobs()
+        _warmed_up.add((PHASE, alpha, n))
+
+    times = {}
+    for algo in algorithms:
+        profiler = PhaseProfiler()
+        scheduler = PROFILED_SCHEDULERS[algo](jobs, profiler=profiler)
+        times[f"{algo}/total"] = measure(scheduler.schedule_jobs)
+        for phase, seconds in profiler.report().items():
+            times[f"{algo}/{phase}"] = seconds
+    return times
+
+
+def _dynamic_trial(task):
+    """One trial of the dynamic-update sweep -> per-update and full-recompute seconds
+
+    The index is built untimed from the dataset, then a stream of
+    `updates` operations alternating insert (drawn from the same
+    distribution) and delete (of a random live interval) is applied and
+    timed as a whole. The baseline is one full EarliestFinishTime run on
+    the final interval set, i.e. what each update would cost without the
+    index; the final selection sizes of both are checked to agree.
+    """
+    alpha, n, seed, updates, cache = task
+    jobs = _load_dataset(alpha, n, seed, cache)
+    rng = np.random.default_rng(seed.spawn(1)[0])
+    starts = rng.uniform(0, alpha * n * 100, size=(updates + 1) // 2)
+    finishes = starts + rng.uniform(1, 100, size=len(starts))
+
+    # Ids are handed out sequentially, so the delete targets can be drawn up front
+    live = list(range(n))
+    ops = []
+    for i in range(updates):
+        if i % 2 == 0:
+            ops.append((True, starts[i // 2], finishes[i // 2]))
+            live.append(n + i // 2)
+        else:
+            k = int(rng.integers(len(live)))
+            live[k], live[-1] = live[-1], live[k]
+            ops.append((False, live.pop(), None))
+
+    index = DynamicIntervalIndex(jobs.to_tuples())
+    rescanned = []
+
+    def apply_updates():
+        for is_insert, a, b in ops:
+            if is_insert:
+                index.insert(a, b)
+            else:
+                index.remove(a)
+            rescanned.append(index.last_rescan_length)
+
+    update_time = measure(apply_updates) / updates
+    final = IntervalSet.from_tuples(index.intervals())
+    if (DYNAMIC, alpha, n) not in _warmed_up:
+        EarliestFinishTime(final).schedule_jobs()
+        _warmed_up.add((DYNAMIC, alpha, n))
+    recompute = EarliestFinishTime(final)
+    recompute_time = measure(recompute.schedule_jobs)
+    assert len(recompute.selected_jobs) == index.selected_count()
+    return {"update": update_time, "recompute": recompute_time, "rescan_length": float(np.mean(rescanned))}
+
+
+def _parallel_eft_trial(task):
+    """One trial of the parallel EFT sweep -> {"serial" | cores: seconds, "segments": count}
+
+    Serial EarliestFinishTime and ParallelEarliestFinishTime at each core
+    count run on the same IntervalSet; every parallel result is checked
+    against the serial one (untimed). Pools are kept per core count across
+    trials so worker start-up is not timed.
+    """
+    alpha, n, seed, core_counts, cache = task
+    jobs = _load_dataset(alpha, n, seed, cache)
+    runs = {"serial": lambda: EarliestFinishTime(jobs).schedule_jobs()}
+    for cores in core_counts:
+        runs[str(cores)] = (lambda cores: lambda: ParallelEarliestFinishTime(
+            jobs, workers=cores, pool=_trial_pool(cores)).schedule_jobs())(cores)
+
+    if (PARALLEL_EFT, alpha, n) not in _warmed_up:
+        expected = runs["serial"]()
+        for name, run in runs.items():
+            assert run() == expected, f"parallel EFT with {name} cores differs from serial"
+        _warmed_up.add((PARALLEL_EFT, alpha, n))
+
+    times = {name: measure(run) for name, run in runs.items()}
+    scheduler = ParallelEarliestFinishTime(jobs)
+    scheduler.chunks(jobs)
+    times["segments"] = scheduler.num_segments
+    return times
+
+
+def _exhaustive_scaling_trial(task):
+    """One trial of the exhaustive strong-scaling sweep -> {workers: seconds}
+
+    workers=1 is the serial BruteForceScheduler; the others split the
+    mask range over a warm pool of that size. Every parallel schedule is
+    checked against the serial one on the first trial of a cell.
+    """
+    alpha, n, seed, worker_counts, cache = task
+    jobs = _load_dataset(alpha, n, seed, cache).to_tuples()
+    runs = {
+        str(workers): (lambda workers: lambda: BruteForceScheduler(
+            jobs, workers=workers, pool=_trial_pool(workers)).schedule_jobs())(workers)
+        for workers in worker_counts
+    }
+
+    if (EXHAUSTIVE_SCALING, alpha, n) not in _warmed_up:
+        expected = BruteForceScheduler(jobs).schedule_jobs()
+        for name, run in runs.items():
+            assert run() == expected, f"parallel exhaustive search with {name} workers differs from serial"
+        _warmed_up.add((EXHAUSTIVE_SCALING, alpha, n))
+
+    return {name: measure(run) for name, run in runs.items()}
+
+
+def _trial_pool(workers):
+    """Warm pool of the given size for in-process sweep trials (None for 1)"""
+    if workers <= 1:
+        return None
+    if workers not in _trial_pools:
+        _trial_pools[workers] = ProcessPoolExecutor(max_workers=workers)
+    return _trial_pools[workers]
+
+
+def _shutdown_trial_pools():
+    for pool in _trial_pools.values():
+        pool.shutdown()
+    _trial_pools.clear()
+
+
+def _workload_suffix(distribution):
+    """"" for the default uniform workload, else "_<distribution>" (sweep and CSV names)"""
+    return "" if distribution == "uniform" else f"_{distribution}"
+
+
+def _mean_std(samples):
+    mean = np.mean(samples)
+    std = np.std(samples, ddof=1) if len(samples) > 1 else 0.0
+    return mean, std
+
+
+def _robust_stats(prefix, samples):
+    """CSV columns with the min, median, IQR and 95% bootstrap CI of the median of one cell's times"""
+    stats = BenchmarkResult(samples)
+    return {f"{prefix}_min": stats.min, f"{prefix}_median": stats.median, f"{prefix}_iqr": stats.iqr,
+            f"{prefix}_median_ci_low": stats.ci_low, f"{prefix}_median_ci_high": stats.ci_high}
+
 
 class ExperimentRunner:
-    def __init__(self):
+    def __init__(self, seed=None, workers=1, cache_dir=None, cache_max_bytes=4 << 30, results_db=None,
+                 baselines_db="data/baselines.sqlite", columnar=False):
         self.alphas = [0.1, 1.0, 5.0]
         self.alpha_names = ["High Overlap", "Medium Overlap", "Low Overlap"]
+        # Optional durable checkpoint: finished cells are stored as they
+        # complete and skipped when a sweep is re-run
+        self.store = ResultsStore(results_db) if results_db is not None else None
+        # Root seed; every (sweep, alpha, n, trial) derives its own stream
+        # from it, so serial and parallel runs draw identical datasets.
+        self.seed_entropy = np.random.SeedSequence(seed).entropy
+        if seed is None and self.store is not None:
+            # An unseeded runner adopts the entropy of the first unseeded run
+            # on this store, so restarting a crashed sweep resumes it
+            stored = self.store.get_meta("seed_entropy")
+            if stored is None:
+                self.store.set_meta("seed_entropy", str(self.seed_entropy))
+            else:
+                self.seed_entropy = int(stored)
+                print(f"Resuming with the seed entropy stored in {results_db}")
+        # Number of worker processes; 1 runs everything in this process.
+        # Clamped to the usable cores: pinned workers beyond that would
+        # share cores and time each other's trials.
+        cores = len(_usable_cores())
+        if workers > cores:
+            print(f"warning: {workers} workers requested but only {cores} usable core(s); using {cores}")
+            workers = cores
+        self.workers = workers
+        # Optional memory-mapped dataset cache shared by runtime sweeps
+        self.cache = (cache_dir, cache_max_bytes) if cache_dir is not None else None
+        # Time the runtime sweeps' schedulers on IntervalSets rather than
+        # tuple lists, so cached datasets reach them without a copy
+        self.columnar = columnar
+        # Registry that record_as= runs are saved to (see src.baselines)
+        self.baselines_db = baselines_db
         os.makedirs('data', exist_ok=True)  # Create data folder if not exists
+
+    def _cell_seed(self, sweep, alpha, n, trial=None):
+        key = (sweep, self.alphas.index(alpha), n)
+        if trial is not None:
+            key += (trial,)
+        return np.random.SeedSequence(self.seed_entropy, spawn_key=key)
+
+    def _environment(self):
+        return dict(
+            machine_info(),
+            timestamp=time.strftime("%Y-%m-%dT%H:%M:%S"),
+            workers=self.workers,
+            columnar=self.columnar,
+            seed_entropy=str(self.seed_entropy),
+        )
+
+    def _save_environment(self, sweep_name):
+        """Record the machine and library versions a sweep was measured on"""
+        path = 'data/environment.json'
+        environments = {}
+        if os.path.exists(path):
+            with open(path) as f:
+                environments = json.load(f)
+        environments[sweep_name] = self._environment()
+        with open(path, 'w') as f:
+            json.dump(environments, f, indent=2)
+
+    def _record_baseline(self, name, sweep_name, samples):
+        """Store a sweep's per-trial samples as the named baseline run"""
+        registry = BaselineRegistry(self.baselines_db)
+        try:
+            registry.record(name, sweep_name, samples, dict(self._environment(), commit=git_revision()))
+        finally:
+            registry.close()
+        print(f"Recorded baseline {name!r} in {self.baselines_db}")
+
+    @contextmanager
+    def _pinned_pool(self, workers):
+        """Process pool of `workers` workers, each pinned to its own usable core (None for 1)"""
+        if workers <= 1:
+            yield None
+            return
+        ctx = mp.get_context()
+        counter = ctx.Value("i", 0)
+        cores = _usable_cores()
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx,
+                                 initializer=_pin_worker, initargs=(counter, cores)) as pool:
+            yield pool
+
+    def _map(self, fn, tasks, workers=None):
+        """Yield fn(task) in task order, serially or on a pinned process pool.
+
+        workers overrides self.workers (e.g. 1 for sweeps that manage
+        their own pools).
+        """
+        workers = self.workers if workers is None else workers
+        with self._pinned_pool(workers) as pool:
+            yield from (pool.map(fn, tasks) if pool is not None else map(fn, tasks))
+
+    def _stored_samples(self, sweep_name, alpha, n, **expected):
+        """Samples of a stored cell, or None if there is none or it is stale
+
+        A cell is stale unless it was computed from this runner's seed and
+        its payload matches every expected field (e.g. trials=10).
+        """
+        if self.store is None:
+            return None
+        payload = self.store.get(sweep_name, alpha, n)
+        if payload is None or payload.get("seed_entropy") != str(self.seed_entropy):
+            return None
+        if any(payload.get(key) != value for key, value in expected.items()):
+            return None
+        return payload["samples"]
+
+    def _run_cells(self, sweep_name, n_values, trials, fn, make_tasks, combine, workers=None):
+        """Yield (alpha, n, samples) for every cell, in alpha-major order.
+
+        Cells already in the results store with the same seed and exactly
+        `trials` trials are loaded from it; the rest are computed by mapping
+        fn over make_tasks(alpha, n) and merged with combine(outputs), then
+        checkpointed before the next cell is yielded. workers is passed to _map.
+        """
+        _reset_warmup()
+        stored = {}
+        for alpha in self.alphas:
+            for n in n_values:
+                stored[(alpha, n)] = self._stored_samples(sweep_name, alpha, n, trials=trials)
+        pending = {cell: make_tasks(*cell) for cell, samples in stored.items() if samples is None}
+        outputs = self._map(fn, [task for tasks in pending.values() for task in tasks], workers)
+
+        for (alpha, n), samples in stored.items():
+            if samples is None:
+                samples = combine([next(outputs) for _ in pending[(alpha, n)]])
+                if self.store is not None:
+                    self.store.put(sweep_name, alpha, n, {"trials": trials, "samples": samples,
+                                                          "seed_entropy": str(self.seed_entropy)})
+            yield alpha, n, samples
+
+    def _run_adaptive_cells(self, sweep_name, n_values, adaptive, fn, make_tasks, combine, metrics):
+        """Like _run_cells, but each cell adds trials until `adaptive` stops it.
+
+        make_tasks(alpha, n, trial_indices) builds the tasks for a round of
+        trials, combine merges the outputs of every round so far, and
+        metrics(samples) picks the {name: samples} the stopping rule
+        (an AdaptiveTrials) checks. Cells run one after another, each
+        round on one pinned pool (as in _map) that stays warm across cells
+        when workers > 1. Stored cells are reused only if they were run
+        under the same stopping rule and seed.
+        """
+        sweep_name += "_adaptive"
+        _reset_warmup()
+        with self._pinned_pool(self.workers) as pool:
+            for alpha in self.alphas:
+                for n in n_values:
+                    samples = self._stored_samples(sweep_name, alpha, n, adaptive=adaptive.as_dict())
+                    if samples is not None:
+                        yield alpha, n, samples
+                        continue
+                    outputs, samples = [], {}
+                    trials, started = 0, time.perf_counter()
+                    while True:
+                        count = adaptive.next_round(metrics(samples), time.perf_counter() - started)
+                        if count == 0:
+                            break
+                        tasks = make_tasks(alpha, n, range(trials, trials + count))
+                        outputs.extend(pool.map(fn, tasks) if pool is not None else map(fn, tasks))
+                        samples = combine(outputs)
+                        trials += count
+                    if self.store is not None:
+                        self.store.put(sweep_name, alpha, n,
+                                       {"trials": trials, "samples": samples, "adaptive": adaptive.as_dict(),
+                                        "seed_entropy": str(self.seed_entropy)})
+                    yield alpha, n, samples
+
+    def _run_timed_sweep(self, sweep, n_values, trials, memory=False, distribution="uniform", adaptive=None):
+        """Run trials for every (alpha, n) cell; yields (alpha, n, {algo: [seconds]})
+
+        With memory=True the first trial of each cell also profiles memory,
+        and the cell gains {algo}_peak_bytes / {algo}_retained_blocks entries.
+        distribution names the DISTRIBUTIONS generator of the datasets.
+        With an AdaptiveTrials rule, trials is ignored and each cell runs
+        until the times of all its algorithms are tight enough.
+        """
+        def trial_tasks(alpha, n, trial_indices):
+            return [(sweep, alpha, n, self._cell_seed(sweep, alpha, n, t), self.cache, self.columnar,
+                     memory and t == 0, distribution)
+                    for t in trial_indices]
+
+        def make_tasks(alpha, n):
+            return trial_tasks(alpha, n, range(trials))
+
+        def combine(outputs):
+            cell = {name: [times[name] for times in outputs] for name in TIMED_ALGORITHMS[sweep]}
+            if memory:
+                for name in TIMED_ALGORITHMS[sweep]:
+                    cell[f"{name}_peak_bytes"] = outputs[0][f"{name}_peak_bytes"]
+                    cell[f"{name}_retained_blocks"] = outputs[0][f"{name}_retained_blocks"]
+            return cell
+
+        # The weighted sweep always runs on IntervalSets
+        columnar = self.columnar and sweep != WEIGHTED
+        sweep_name = (SWEEP_NAMES[sweep] + ("_memory" if memory else "") + ("_columnar" if columnar else "")
+                      + _workload_suffix(distribution))
+        if adaptive is not None:
+            def metrics(cell):
+                return {name: cell.get(name, []) for name in TIMED_ALGORITHMS[sweep]}
+
+            return self._run_adaptive_cells(sweep_name, n_values, adaptive, _timed_trial, trial_tasks, combine,
+                                            metrics)
+        return self._run_cells(sweep_name, n_values, trials, _timed_trial, make_tasks, combine)
     
-    def run_quality_experiments(self, n_values=list(range(4, 21, 2)), trials=20):
-        """Compare Greedy vs Optimal (for small n)"""
-        # Ensure at least 10 trials for each (alpha, n) combination
+    def run_quality_experiments(self, n_values=list(range(4, 21, 2)), trials=20, optimal="bruteforce",
+                                batch=False, distribution="uniform", adaptive=None):
+        """Compare Greedy vs Optimal
+
+        optimal selects the oracle for the optimal count: "bruteforce"
+        (exhaustive 2^n search, small n only) or "exact" (O(n log n)
+        ExactOptimalScheduler, usable up to n ~ 10^6). Exact runs feed the
+        heuristics IntervalSets and save to data/quality_results_exact.csv.
+        batch=True scores EFT/EST/SD for all trials of a cell with one
+        batch.schedule_batch call per heuristic. distribution picks the
+        workload (see dataset_generator.WORKLOADS); non-uniform runs save
+        to quality_results[_exact]_<distribution>.csv. adaptive (a
+        benchmark.AdaptiveTrials) replaces the fixed trial count: each
+        cell adds trials until all three mean ratios are tight enough.
+        The CSV's trials column is the count each cell actually used.
+        """
+        if optimal not in ("bruteforce", "exact"):
+            raise ValueError(f"unknown optimal backend: {optimal!r}")
+        # Ensure at least 10 trials for each (alpha, n) combination (unless adaptive)
         effective_trials = max(trials, 10)
         results = {
             alpha: {
@@ -26,76 +666,71 @@ class ExperimentRunner:
                 "EST_std": [],
                 "SD": [],
                 "SD_std": [],
-                "Optimal": []
+                "Optimal": [],
+                "trials": []
             }
             for alpha in self.alphas
         }
         # Keep track of which n values were actually used so plotting
         # can align x-axes even if n_values is customized.
         results_n_values = list(n_values)
-        
-        for alpha in self.alphas:
-            print(f"\nRunning quality experiments for α = {alpha}...")
-            for n in n_values:
-                eft_ratio, est_ratio, sd_ratio = [], [], []
-
-                # Warmup run (not recorded)
-                warmup_jobs = generate_dataset(n, alpha)
-                warmup_opt_scheduler = BruteForceScheduler(warmup_jobs)
-                warmup_opt_jobs = warmup_opt_scheduler.schedule_jobs()
-                _ = len(EarliestFinishTime(warmup_jobs).schedule_jobs())
-                _ = len(EarlierStartTime(warmup_jobs).schedule_jobs())
-                _ = len(ShortestDuration(warmup_jobs).schedule_jobs())
-
-                for _ in range(effective_trials):
-                    jobs = generate_dataset(n, alpha)
-                    
-                    # Exhaustive (Optimal)
-                    opt_scheduler = BruteForceScheduler(jobs)
-                    opt_jobs = opt_scheduler.schedule_jobs()
-                    opt_count = len(opt_jobs)
-                    
-                    # Greedy Algorithms
-                    eft_count = len(EarliestFinishTime(jobs).schedule_jobs())
-                    est_count = len(EarlierStartTime(jobs).schedule_jobs())
-                    sd_count  = len(ShortestDuration(jobs).schedule_jobs())
-                    
-                    eft_ratio.append(eft_count / opt_count if opt_count > 0 else 1.0)
-                    est_ratio.append(est_count / opt_count if opt_count > 0 else 1.0)
-                    sd_ratio.append(sd_count / opt_count if opt_count > 0 else 1.0)
-                
-                eft_mean = np.mean(eft_ratio)
-                est_mean = np.mean(est_ratio)
-                sd_mean = np.mean(sd_ratio)
-
-                eft_std = np.std(eft_ratio, ddof=1) if len(eft_ratio) > 1 else 0.0
-                est_std = np.std(est_ratio, ddof=1) if len(est_ratio) > 1 else 0.0
-                sd_std = np.std(sd_ratio, ddof=1) if len(sd_ratio) > 1 else 0.0
-
-                results[alpha]["EFT"].append(eft_mean)
-                results[alpha]["EFT_std"].append(eft_std)
-                results[alpha]["EST"].append(est_mean)
-                results[alpha]["EST_std"].append(est_std)
-                results[alpha]["SD"].append(sd_mean)
-                results[alpha]["SD_std"].append(sd_std)
-                results[alpha]["Optimal"].append(1.0)
+
+        def make_tasks(alpha, n):
+            return [(alpha, n, effective_trials, self._cell_seed(QUALITY, alpha, n), optimal, batch, distribution)]
+
+        def trial_tasks(alpha, n, trial_indices):
+            # One task per worker; every trial has its own seed, so the split
+            # does not change the datasets
+            chunks = np.array_split(np.asarray(trial_indices), max(1, self.workers))
+            return [(alpha, n, len(chunk), [self._cell_seed(QUALITY, alpha, n, int(t)) for t in chunk], optimal,
+                     batch, distribution)
+                    for chunk in chunks if len(chunk)]
+
+        def combine(outputs):
+            return {h: [ratio for out in outputs for ratio in out[i]] for i, h in enumerate(("EFT", "EST", "SD"))}
+
+        sweep_name = f"{SWEEP_NAMES[QUALITY]}_{optimal}{_workload_suffix(distribution)}"
+        if adaptive is not None:
+            cells = self._run_adaptive_cells(sweep_name, results_n_values, adaptive, _quality_cell, trial_tasks,
+                                             combine, lambda ratios: ratios)
+        else:
+            cells = self._run_cells(sweep_name, results_n_values, effective_trials,
+                                    _quality_cell, make_tasks, combine)
+        for alpha, n, ratios in cells:
+            if n == results_n_values[0]:
+                print(f"\nRunning quality experiments for α = {alpha}...")
                 
-                print(
-                    f"n={n:2d} | "
-                    f"EFT: {eft_mean:.3f}±{eft_std:.3f} | "
-                    f"EST: {est_mean:.3f}±{est_std:.3f} | "
-                    f"SD: {sd_mean:.3f}±{sd_std:.3f}"
-                )
+            eft_mean, eft_std = _mean_std(ratios["EFT"])
+            est_mean, est_std = _mean_std(ratios["EST"])
+            sd_mean, sd_std = _mean_std(ratios["SD"])
+
+            results[alpha]["EFT"].append(eft_mean)
+            results[alpha]["EFT_std"].append(eft_std)
+            results[alpha]["EST"].append(est_mean)
+            results[alpha]["EST_std"].append(est_std)
+            results[alpha]["SD"].append(sd_mean)
+            results[alpha]["SD_std"].append(sd_std)
+            results[alpha]["Optimal"].append(1.0)
+            results[alpha]["trials"].append(len(ratios["EFT"]))
+            
+            print(
+                f"n={n:2d} | trials={len(ratios['EFT']):3d} | "
+                f"EFT: {eft_mean:.3f}±{eft_std:.3f} | "
+                f"EST: {est_mean:.3f}±{est_std:.3f} | "
+                f"SD: {sd_mean:.3f}±{sd_std:.3f}"
+            )
         
         # Save to CSV
-        self._save_quality_to_csv(results, results_n_values)
+        csv_path = 'data/quality_results_exact' if optimal == "exact" else 'data/quality_results'
+        csv_path += f"{_workload_suffix(distribution)}.csv"
+        self._save_quality_to_csv(results, results_n_values, csv_path)
 
         # Also attach n-values into the returned structure so plot_quality
         # can infer the correct x-axis length.
         results["n_values"] = results_n_values
         return results
 
-    def _save_quality_to_csv(self, results, n_values):
+    def _save_quality_to_csv(self, results, n_values, csv_path='data/quality_results.csv'):
         data = []
         for alpha in self.alphas:
             for i, n in enumerate(n_values):
@@ -108,99 +743,75 @@ class ExperimentRunner:
                     'EST_std': results[alpha]['EST_std'][i],
                     'SD_mean': results[alpha]['SD'][i],
                     'SD_std': results[alpha]['SD_std'][i],
-                    'Optimal': results[alpha]['Optimal'][i]
+                    'Optimal': results[alpha]['Optimal'][i],
+                    'trials': results[alpha]['trials'][i]
                 })
         df = pd.DataFrame(data)
-        df.to_csv('data/quality_results.csv', index=False)
-        print("Quality results saved to data/quality_results.csv")
+        df.to_csv(csv_path, index=False)
+        print(f"Quality results saved to {csv_path}")
+        return df
+
+    def run_greedy_runtime_experiments(self, n_values=None, trials=10, memory=False, distribution="uniform",
+                                       record_as=None, adaptive=None):
+        """Measure runtime of Greedy Algorithms
 
-    def run_greedy_runtime_experiments(self, n_values=None, trials=10):
-        """Measure runtime of Greedy Algorithms"""
+        memory=True also records each algorithm's peak traced memory and
+        retained blocks per cell (extra CSV columns). distribution
+        picks the workload; non-uniform runs save to
+        greedy_runtime_results_<distribution>.csv. record_as stores the
+        per-trial times as a named run in the baseline registry, for
+        `python main.py compare`. adaptive (a benchmark.AdaptiveTrials)
+        replaces the fixed trial count: each cell adds trials until the
+        mean time of every algorithm is tight enough, and the CSV's
+        trials column records the count used.
+        """
         if n_values is None:
             n_values = [2**i for i in range(10, 21)]   # 1024 to ~1M
         
-        # Ensure at least 10 trials for each (alpha, n) combination
+        # Ensure at least 10 trials for each (alpha, n) combination (unless adaptive)
         effective_trials = max(trials, 10)
 
         results = {}
-        for alpha in self.alphas:
-            print(f"\nRunning greedy runtime experiments for α = {alpha}...")
-            times_eft = []
-            times_eft_std = []
-            times_est = []
-            times_est_std = []
-            times_sd = []
-            times_sd_std = []
-            
-            for n in n_values:
-                trial_times_eft = []
-                trial_times_est = []
-                trial_times_sd = []
-                
-                # Warmup run for each algorithm (not recorded)
-                warmup_jobs = generate_dataset(n, alpha)
-                start = time.perf_counter()
-                EarliestFinishTime(warmup_jobs).schedule_jobs()
-                _ = time.perf_counter() - start
-                start = time.perf_counter()
-                EarlierStartTime(warmup_jobs).schedule_jobs()
-                _ = time.perf_counter() - start
-                start = time.perf_counter()
-                ShortestDuration(warmup_jobs).schedule_jobs()
-                _ = time.perf_counter() - start
-
-                for _ in range(effective_trials):
-                    jobs = generate_dataset(n, alpha)
-                    
-                    start = time.perf_counter()
-                    EarliestFinishTime(jobs).schedule_jobs()
-                    trial_times_eft.append(time.perf_counter() - start)
-
-                    start = time.perf_counter()
-                    EarlierStartTime(jobs).schedule_jobs()
-                    trial_times_est.append(time.perf_counter() - start)
-
-                    start = time.perf_counter()
-                    ShortestDuration(jobs).schedule_jobs()
-                    trial_times_sd.append(time.perf_counter() - start)
-                
-                avg_time_eft = np.mean(trial_times_eft)
-                std_time_eft = np.std(trial_times_eft, ddof=1) if len(trial_times_eft) > 1 else 0.0
-                avg_time_est = np.mean(trial_times_est)
-                std_time_est = np.std(trial_times_est, ddof=1) if len(trial_times_est) > 1 else 0.0
-                avg_time_sd = np.mean(trial_times_sd)
-                std_time_sd = np.std(trial_times_sd, ddof=1) if len(trial_times_sd) > 1 else 0.0
-
-                times_eft.append(avg_time_eft)
-                times_eft_std.append(std_time_eft)
-                times_est.append(avg_time_est)
-                times_est_std.append(std_time_est)
-                times_sd.append(avg_time_sd)
-                times_sd_std.append(std_time_sd)
-
-                print(
-                    f"n={n:6d} | "
-                    f"EFT: {avg_time_eft*1000:.3f}±{std_time_eft*1000:.3f} ms | "
-                    f"EST: {avg_time_est*1000:.3f}±{std_time_est*1000:.3f} ms | "
-                    f"SD: {avg_time_sd*1000:.3f}±{std_time_sd*1000:.3f} ms"
-                )
-            
-            results[alpha] = {
-                "n": n_values,
-                "EFT_time": times_eft,
-                "EFT_time_std": times_eft_std,
-                "EST_time": times_est,
-                "EST_time_std": times_est_std,
-                "SD_time": times_sd,
-                "SD_time_std": times_sd_std,
-            }
+        samples = {}
+        algorithms = list(TIMED_ALGORITHMS[GREEDY])
+        for alpha, n, cell in self._run_timed_sweep(GREEDY, n_values, effective_trials, memory, distribution,
+                                                    adaptive):
+            if n == n_values[0]:
+                print(f"\nRunning greedy runtime experiments for α = {alpha} ({distribution})...")
+                results[alpha] = {"n": n_values, "trials": []}
+                for algo in algorithms:
+                    results[alpha][f"{algo}_time"] = []
+                    results[alpha][f"{algo}_time_std"] = []
+                    results[alpha][f"{algo}_time_stats"] = []
+                    if memory:
+                        results[alpha][f"{algo}_peak_bytes"] = []
+                        results[alpha][f"{algo}_retained_blocks"] = []
+
+            summary = []
+            for algo in algorithms:
+                avg_time, std_time = _mean_std(cell[algo])
+                samples[(alpha, n, algo)] = cell[algo]
+                results[alpha][f"{algo}_time"].append(avg_time)
+                results[alpha][f"{algo}_time_std"].append(std_time)
+                results[alpha][f"{algo}_time_stats"].append(_robust_stats(f"{algo}_time_seconds", cell[algo]))
+                entry = f"{algo}: {avg_time*1000:.3f}±{std_time*1000:.3f} ms"
+                if memory:
+                    results[alpha][f"{algo}_peak_bytes"].append(cell[f"{algo}_peak_bytes"])
+                    results[alpha][f"{algo}_retained_blocks"].append(cell[f"{algo}_retained_blocks"])
+                    entry += f", {cell[f'{algo}_peak_bytes'] / 2**20:.1f} MiB"
+                summary.append(entry)
+            results[alpha]["trials"].append(len(cell[algorithms[0]]))
+            print(f"n={n:6d} | trials={len(cell[algorithms[0]]):3d} | " + " | ".join(summary))
         
         # Save to CSV
-        self._save_greedy_runtime_to_csv(results)
+        self._save_greedy_runtime_to_csv(results, f"data/greedy_runtime_results{_workload_suffix(distribution)}.csv")
+        self._save_environment(SWEEP_NAMES[GREEDY] + _workload_suffix(distribution))
+        if record_as is not None:
+            self._record_baseline(record_as, SWEEP_NAMES[GREEDY] + _workload_suffix(distribution), samples)
         
         return results
 
-    def _save_greedy_runtime_to_csv(self, results):
+    def _save_greedy_runtime_to_csv(self, results, csv_path='data/greedy_runtime_results.csv'):
         data = []
         for alpha in self.alphas:
             for i, n in enumerate(results[alpha]['n']):
@@ -213,55 +824,66 @@ class ExperimentRunner:
                     'EST_time_seconds_std': results[alpha]['EST_time_std'][i],
                     'SD_time_seconds_mean': results[alpha]['SD_time'][i],
                     'SD_time_seconds_std': results[alpha]['SD_time_std'][i],
+                    'trials': results[alpha]['trials'][i],
                 })
+                for algo in ["EFT", "EST", "SD"]:
+                    data[-1].update(results[alpha][f'{algo}_time_stats'][i])
+                # Memory-profiling columns, present only for memory=True runs
+                for algo in ["EFT", "EST", "SD"]:
+                    if f"{algo}_peak_bytes" in results[alpha]:
+                        data[-1][f'{algo}_peak_bytes'] = results[alpha][f'{algo}_peak_bytes'][i]
+                        data[-1][f'{algo}_retained_blocks'] = results[alpha][f'{algo}_retained_blocks'][i]
         df = pd.DataFrame(data)
-        df.to_csv('data/greedy_runtime_results.csv', index=False)
-        print("Greedy runtime results saved to data/greedy_runtime_results.csv")
+        df.to_csv(csv_path, index=False)
+        print(f"Greedy runtime results saved to {csv_path}")
+        return df
+
+    def run_exhaustive_runtime_experiments(self, n_values=None, trials=10, memory=False, distribution="uniform",
+                                           record_as=None, adaptive=None):
+        """Measure runtime of Exhaustive Algorithm
 
-    def run_exhaustive_runtime_experiments(self, n_values=None, trials=10):
-        """Measure runtime of Exhaustive Algorithm"""
+        memory=True also records peak traced memory and retained
+        blocks per cell (extra CSV columns). distribution, record_as and
+        adaptive work as in run_greedy_runtime_experiments.
+        """
         if n_values is None:
             n_values = list(range(5, 21, 1))   # 5 to 20
         
-        # Ensure at least 10 trials for each (alpha, n) combination
+        # Ensure at least 10 trials for each (alpha, n) combination (unless adaptive)
         effective_trials = max(trials, 10)
 
         results = {}
-        for alpha in self.alphas:
-            print(f"\nRunning exhaustive runtime experiments for α = {alpha}...")
-            times = []
-            times_std = []
-            
-            for n in n_values:
-                trial_times = []
-                
-                # Warmup run (not recorded)
-                warmup_jobs = generate_dataset(n, alpha)
-                start = time.perf_counter()
-                BruteForceScheduler(warmup_jobs).schedule_jobs()
-                _ = time.perf_counter() - start
-
-                for _ in range(effective_trials):
-                    jobs = generate_dataset(n, alpha)
-                    
-                    start = time.perf_counter()
-                    BruteForceScheduler(jobs).schedule_jobs()
-                    trial_times.append(time.perf_counter() - start)
-                
-                avg_time = np.mean(trial_times)
-                std_time = np.std(trial_times, ddof=1) if len(trial_times) > 1 else 0.0
-                times.append(avg_time)
-                times_std.append(std_time)
+        samples = {}
+        for alpha, n, cell in self._run_timed_sweep(EXHAUSTIVE, n_values, effective_trials, memory, distribution,
+                                                    adaptive):
+            if n == n_values[0]:
+                print(f"\nRunning exhaustive runtime experiments for α = {alpha} ({distribution})...")
+                results[alpha] = {"n": n_values, "time": [], "time_std": [], "time_stats": [], "trials": []}
+                if memory:
+                    results[alpha].update({"peak_bytes": [], "retained_blocks": []})
+            avg_time, std_time = _mean_std(cell["time"])
+            samples[(alpha, n, "BruteForce")] = cell["time"]
+            results[alpha]["time"].append(avg_time)
+            results[alpha]["time_std"].append(std_time)
+            results[alpha]["time_stats"].append(_robust_stats("time_seconds", cell["time"]))
+            results[alpha]["trials"].append(len(cell["time"]))
+            if memory:
+                results[alpha]["peak_bytes"].append(cell["time_peak_bytes"])
+                results[alpha]["retained_blocks"].append(cell["time_retained_blocks"])
+                print(f"n={n:2d} | Time = {avg_time:.3f}±{std_time:.3f} s | Peak = {cell['time_peak_bytes'] / 2**10:.1f} KiB")
+            else:
                 print(f"n={n:2d} | Time = {avg_time:.3f}±{std_time:.3f} s")
-            
-            results[alpha] = {"n": n_values, "time": times, "time_std": times_std}
         
         # Save to CSV
-        self._save_exhaustive_runtime_to_csv(results)
+        self._save_exhaustive_runtime_to_csv(
+            results, f"data/exhaustive_runtime_results{_workload_suffix(distribution)}.csv")
+        self._save_environment(SWEEP_NAMES[EXHAUSTIVE] + _workload_suffix(distribution))
+        if record_as is not None:
+            self._record_baseline(record_as, SWEEP_NAMES[EXHAUSTIVE] + _workload_suffix(distribution), samples)
         
         return results
 
-    def _save_exhaustive_runtime_to_csv(self, results):
+    def _save_exhaustive_runtime_to_csv(self, results, csv_path='data/exhaustive_runtime_results.csv'):
         data = []
         for alpha in self.alphas:
             for i, n in enumerate(results[alpha]['n']):
@@ -269,13 +891,592 @@ class ExperimentRunner:
                     'alpha': alpha,
                     'n': n,
                     'time_seconds_mean': results[alpha]['time'][i],
-                    'time_seconds_std': results[alpha]['time_std'][i]
+                    'time_seconds_std': results[alpha]['time_std'][i],
+                    'trials': results[alpha]['trials'][i]
+                })
+                data[-1].update(results[alpha]['time_stats'][i])
+                if "peak_bytes" in results[alpha]:
+                    data[-1]['peak_bytes'] = results[alpha]['peak_bytes'][i]
+                    data[-1]['retained_blocks'] = results[alpha]['retained_blocks'][i]
+        df = pd.DataFrame(data)
+        df.to_csv(csv_path, index=False)
+        print(f"Exhaustive runtime results saved to {csv_path}")
+        return df
+
+    def run_workload_suite(self, distributions=WORKLOADS, runtime_n_values=None,
+                           quality_n_values=list(range(4, 17, 2)), trials=10, optimal="bruteforce"):
+        """Greedy runtime and quality sweeps for every named workload distribution
+
+        Each distribution writes its own per-sweep CSVs as usual; the rows
+        are also gathered, with a distribution column, into
+        data/workload_runtime_results.csv and data/workload_quality_results.csv.
+        """
+        if runtime_n_values is None:
+            runtime_n_values = [2**i for i in range(10, 19, 2)]
+
+        runtime, quality = [], []
+        for distribution in distributions:
+            suffix = _workload_suffix(distribution)
+            self.run_greedy_runtime_experiments(runtime_n_values, trials, distribution=distribution)
+            runtime.append(pd.read_csv(f"data/greedy_runtime_results{suffix}.csv"))
+            self.run_quality_experiments(quality_n_values, trials, optimal=optimal, distribution=distribution)
+            prefix = 'data/quality_results_exact' if optimal == "exact" else 'data/quality_results'
+            quality.append(pd.read_csv(f"{prefix}{suffix}.csv"))
+            runtime[-1].insert(0, 'distribution', distribution)
+            quality[-1].insert(0, 'distribution', distribution)
+
+        runtime_df = pd.concat(runtime, ignore_index=True)
+        quality_df = pd.concat(quality, ignore_index=True)
+        runtime_df.to_csv('data/workload_runtime_results.csv', index=False)
+        quality_df.to_csv('data/workload_quality_results.csv', index=False)
+        print("Workload suite results saved to data/workload_runtime_results.csv and "
+              "data/workload_quality_results.csv")
+        return runtime_df, quality_df
+
+    def run_bitmask_exhaustive_runtime_experiments(self, n_values=None, trials=10):
+        """Measure runtime of the conflict-bitmask exhaustive engines (Gray code, branch-and-bound)
+
+        Same cells and datasets layout as run_exhaustive_runtime_experiments,
+        so the two CSVs can be compared row by row.
+        """
+        if n_values is None:
+            n_values = list(range(5, 25, 1))   # 5 to 24
+        
+        # Ensure at least 10 trials for each (alpha, n) combination
+        effective_trials = max(trials, 10)
+        methods = TIMED_ALGORITHMS[BITMASK]
+
+        results = {}
+        for alpha, n, cell in self._run_timed_sweep(BITMASK, n_values, effective_trials):
+            if n == n_values[0]:
+                print(f"\nRunning bitmask exhaustive runtime experiments for α = {alpha}...")
+                results[alpha] = {"n": n_values}
+                for method in methods:
+                    results[alpha].update({f"{method}_time": [], f"{method}_time_std": [], f"{method}_time_stats": []})
+            parts = []
+            for method in methods:
+                avg_time, std_time = _mean_std(cell[method])
+                results[alpha][f"{method}_time"].append(avg_time)
+                results[alpha][f"{method}_time_std"].append(std_time)
+                results[alpha][f"{method}_time_stats"].append(_robust_stats(f"{method}_time_seconds", cell[method]))
+                parts.append(f"{method}: {avg_time:.4f}±{std_time:.4f} s")
+            print(f"n={n:2d} | " + " | ".join(parts))
+        
+        # Save to CSV
+        data = []
+        for alpha in self.alphas:
+            for i, n in enumerate(results[alpha]['n']):
+                data.append({'alpha': alpha, 'n': n})
+                for method in methods:
+                    data[-1][f'{method}_time_seconds_mean'] = results[alpha][f'{method}_time'][i]
+                    data[-1][f'{method}_time_seconds_std'] = results[alpha][f'{method}_time_std'][i]
+                    data[-1].update(results[alpha][f'{method}_time_stats'][i])
+        pd.DataFrame(data).to_csv('data/exhaustive_bitmask_runtime_results.csv', index=False)
+        print("Bitmask exhaustive runtime results saved to data/exhaustive_bitmask_runtime_results.csv")
+        self._save_environment(SWEEP_NAMES[BITMASK])
+        
+        return results
+
+    def run_exhaustive_scaling_experiments(self, n=18, trials=10, worker_counts=None):
+        """Strong scaling of the parallel exhaustive search: time vs workers at fixed n
+
+        Cells run in this process one at a time; each trial times
+        BruteForceScheduler serially and with the mask range split over
+        pools of each size in worker_counts.
+        """
+        if worker_counts is None:
+            cpu_count = os.cpu_count() or 1
+            worker_counts = [2**i for i in range(cpu_count.bit_length()) if 2**i <= cpu_count]
+        worker_counts = tuple(sorted(set(worker_counts) | {1}))
+        
+        # Ensure at least 10 trials for each (alpha, n) combination
+        effective_trials = max(trials, 10)
+
+        def make_tasks(alpha, n):
+            return [(alpha, n, self._cell_seed(EXHAUSTIVE_SCALING, alpha, n, t), worker_counts, self.cache)
+                    for t in range(effective_trials)]
+
+        def combine(outputs):
+            return {key: [out[key] for out in outputs] for key in outputs[0]}
+
+        cells = self._run_cells(f"{SWEEP_NAMES[EXHAUSTIVE_SCALING]}[{','.join(map(str, worker_counts))}]", [n],
+                                effective_trials, _exhaustive_scaling_trial, make_tasks, combine, workers=1)
+        data = []
+        try:
+            for alpha, n, samples in cells:
+                print(f"\nRunning exhaustive strong-scaling experiments for α = {alpha} (n={n})...")
+                serial_mean, _ = _mean_std(samples["1"])
+                for workers in worker_counts:
+                    mean, std = _mean_std(samples[str(workers)])
+                    data.append({
+                        'alpha': alpha,
+                        'n': n,
+                        'workers': workers,
+                        'time_seconds_mean': mean,
+                        'time_seconds_std': std,
+                        'speedup': serial_mean / mean,
+                        'efficiency': serial_mean / mean / workers,
+                    })
+                    print(f"workers={workers:3d} | {mean:.3f}±{std:.3f} s | speedup {serial_mean / mean:.2f}x")
+        finally:
+            _shutdown_trial_pools()
+
+        df = pd.DataFrame(data)
+        df.to_csv('data/exhaustive_scaling_results.csv', index=False)
+        self._save_environment(SWEEP_NAMES[EXHAUSTIVE_SCALING])
+        print("Exhaustive strong-scaling results saved to data/exhaustive_scaling_results.csv")
+        return df
+
+    def run_weighted_runtime_experiments(self, n_values=None, trials=10):
+        """Measure runtime of Weighted Interval Scheduling (DP + binary search)"""
+        if n_values is None:
+            n_values = [2**i for i in range(10, 21)]   # 1024 to ~1M
+        
+        # Ensure at least 10 trials for each (alpha, n) combination
+        effective_trials = max(trials, 10)
+
+        results = {}
+        for alpha, n, cell in self._run_timed_sweep(WEIGHTED, n_values, effective_trials):
+            if n == n_values[0]:
+                print(f"\nRunning weighted runtime experiments for α = {alpha}...")
+                results[alpha] = {"n": n_values, "WIS_time": [], "WIS_time_std": [], "WIS_time_stats": []}
+            avg_time, std_time = _mean_std(cell["WIS"])
+            results[alpha]["WIS_time"].append(avg_time)
+            results[alpha]["WIS_time_std"].append(std_time)
+            results[alpha]["WIS_time_stats"].append(_robust_stats("WIS_time_seconds", cell["WIS"]))
+            print(f"n={n:6d} | WIS: {avg_time*1000:.3f}±{std_time*1000:.3f} ms")
+        
+        # Save to CSV
+        self._save_weighted_runtime_to_csv(results)
+        self._save_environment(SWEEP_NAMES[WEIGHTED])
+        
+        return results
+
+    def _save_weighted_runtime_to_csv(self, results):
+        data = []
+        for alpha in self.alphas:
+            for i, n in enumerate(results[alpha]['n']):
+                data.append({
+                    'alpha': alpha,
+                    'n': n,
+                    'WIS_time_seconds_mean': results[alpha]['WIS_time'][i],
+                    'WIS_time_seconds_std': results[alpha]['WIS_time_std'][i],
+                    **results[alpha]['WIS_time_stats'][i],
+                })
+        df = pd.DataFrame(data)
+        df.to_csv('data/weighted_runtime_results.csv', index=False)
+        print("Weighted runtime results saved to data/weighted_runtime_results.csv")
+
+    def run_partition_runtime_experiments(self, n_values=None, trials=10):
+        """Measure runtime of Interval Partitioning (start sort + min-heap)"""
+        if n_values is None:
+            n_values = [2**i for i in range(10, 21)]   # 1024 to ~1M
+        
+        # Ensure at least 10 trials for each (alpha, n) combination
+        effective_trials = max(trials, 10)
+
+        results = {}
+        for alpha, n, cell in self._run_timed_sweep(PARTITION, n_values, effective_trials):
+            if n == n_values[0]:
+                print(f"\nRunning partition runtime experiments for α = {alpha}...")
+                results[alpha] = {"n": n_values, "IP_time": [], "IP_time_std": [], "IP_time_stats": []}
+            avg_time, std_time = _mean_std(cell["IP"])
+            results[alpha]["IP_time"].append(avg_time)
+            results[alpha]["IP_time_std"].append(std_time)
+            results[alpha]["IP_time_stats"].append(_robust_stats("IP_time_seconds", cell["IP"]))
+            print(f"n={n:6d} | IP: {avg_time*1000:.3f}±{std_time*1000:.3f} ms")
+        
+        # Save to CSV
+        self._save_partition_runtime_to_csv(results)
+        self._save_environment(SWEEP_NAMES[PARTITION])
+        
+        return results
+
+    def _save_partition_runtime_to_csv(self, results):
+        data = []
+        for alpha in self.alphas:
+            for i, n in enumerate(results[alpha]['n']):
+                data.append({
+                    'alpha': alpha,
+                    'n': n,
+                    'IP_time_seconds_mean': results[alpha]['IP_time'][i],
+                    'IP_time_seconds_std': results[alpha]['IP_time_std'][i],
+                    **results[alpha]['IP_time_stats'][i],
                 })
         df = pd.DataFrame(data)
-        df.to_csv('data/exhaustive_runtime_results.csv', index=False)
-        print("Exhaustive runtime results saved to data/exhaustive_runtime_results.csv")
+        df.to_csv('data/partition_runtime_results.csv', index=False)
+        print("Partition runtime results saved to data/partition_runtime_results.csv")
+
+    def run_dynamic_update_experiments(self, n_values=None, trials=10, updates=1000):
+        """Compare per-update cost of DynamicIntervalIndex with a full EFT recompute
+
+        Each trial applies `updates` alternating inserts and deletes to an
+        index built over a generate_dataset workload of size n; the
+        baseline re-runs EarliestFinishTime on the whole updated set.
+        """
+        if n_values is None:
+            n_values = [2**i for i in range(10, 19, 2)]
+        
+        # Ensure at least 10 trials for each (alpha, n) combination
+        effective_trials = max(trials, 10)
+
+        def make_tasks(alpha, n):
+            return [(alpha, n, self._cell_seed(DYNAMIC, alpha, n, t), updates, self.cache)
+                    for t in range(effective_trials)]
+
+        def combine(outputs):
+            return {key: [out[key] for out in outputs] for key in outputs[0]}
+
+        cells = self._run_cells(f"{SWEEP_NAMES[DYNAMIC]}_updates{updates}", n_values, effective_trials,
+                                _dynamic_trial, make_tasks, combine)
+        data = []
+        for alpha, n, samples in cells:
+            if n == n_values[0]:
+                print(f"\nRunning dynamic update experiments for α = {alpha}...")
+            update_mean, update_std = _mean_std(samples["update"])
+            recompute_mean, recompute_std = _mean_std(samples["recompute"])
+            data.append({
+                'alpha': alpha,
+                'n': n,
+                'updates': updates,
+                'update_time_seconds_mean': update_mean,
+                'update_time_seconds_std': update_std,
+                'recompute_time_seconds_mean': recompute_mean,
+                'recompute_time_seconds_std': recompute_std,
+                'speedup': recompute_mean / update_mean,
+                'rescan_length_mean': float(np.mean(samples["rescan_length"])),
+            })
+            print(
+                f"n={n:8d} | update: {update_mean*1e6:.1f} µs "
+                f"(rescans {data[-1]['rescan_length_mean']:.1f} jobs) | "
+                f"recompute: {recompute_mean*1000:.3f} ms | speedup {data[-1]['speedup']:.0f}x"
+            )
+
+        df = pd.DataFrame(data)
+        df.to_csv('data/dynamic_update_results.csv', index=False)
+        self._save_environment(SWEEP_NAMES[DYNAMIC])
+        print("Dynamic update results saved to data/dynamic_update_results.csv")
+        return df
+
+    def run_parallel_eft_experiments(self, n_values=None, trials=10, core_counts=None):
+        """Speedup of gap-partitioned parallel EFT over serial EFT vs number of cores
+
+        Cells always run in this process, one after another, so the
+        ParallelEarliestFinishTime pools have the cores to themselves.
+        High overlap leaves few idle points to cut at, so expect the
+        speedup to grow with alpha.
+        """
+        if n_values is None:
+            n_values = [2**i for i in range(16, 21, 2)]
+        if core_counts is None:
+            cpu_count = os.cpu_count() or 1
+            core_counts = [2**i for i in range(cpu_count.bit_length()) if 2**i <= cpu_count]
+        core_counts = tuple(core_counts)
+        
+        # Ensure at least 10 trials for each (alpha, n) combination
+        effective_trials = max(trials, 10)
+
+        def make_tasks(alpha, n):
+            return [(alpha, n, self._cell_seed(PARALLEL_EFT, alpha, n, t), core_counts, self.cache)
+                    for t in range(effective_trials)]
+
+        def combine(outputs):
+            return {key: [out[key] for out in outputs] for key in outputs[0]}
+
+        cells = self._run_cells(f"{SWEEP_NAMES[PARALLEL_EFT]}[{','.join(map(str, core_counts))}]", n_values,
+                                effective_trials, _parallel_eft_trial, make_tasks, combine, workers=1)
+        data = []
+        try:
+            for alpha, n, samples in cells:
+                if n == n_values[0]:
+                    print(f"\nRunning parallel EFT experiments for α = {alpha}...")
+                serial_mean, _ = _mean_std(samples["serial"])
+                segments = int(np.mean(samples["segments"]))
+                parts = []
+                for cores in core_counts:
+                    mean, std = _mean_std(samples[str(cores)])
+                    data.append({
+                        'alpha': alpha,
+                        'n': n,
+                        'cores': cores,
+                        'segments': segments,
+                        'serial_time_seconds_mean': serial_mean,
+                        'time_seconds_mean': mean,
+                        'time_seconds_std': std,
+                        'speedup': serial_mean / mean,
+                    })
+                    parts.append(f"{cores}: {serial_mean / mean:.2f}x")
+                print(f"n={n:8d} | {segments} segments | speedup " + ", ".join(parts))
+        finally:
+            _shutdown_trial_pools()
+
+        df = pd.DataFrame(data)
+        df.to_csv('data/parallel_eft_results.csv', index=False)
+        self._save_environment(SWEEP_NAMES[PARALLEL_EFT])
+        print("Parallel EFT results saved to data/parallel_eft_results.csv")
+        return df
+
+    def run_external_runtime_experiments(self, n_values=None, trials=10, chunk_size=1 << 16):
+        """Compare out-of-core EFT (external merge sort) with in-memory EFT
+
+        Both paths start from the same interval file: in-memory loads it
+        whole and sorts with argsort, external sorts runs of chunk_size and
+        merges them from disk. Time is measured per trial; peak traced
+        memory comes from one extra untimed run per path under tracemalloc.
+        """
+        if n_values is None:
+            n_values = [2**i for i in range(14, 21, 2)]
+        
+        # Ensure at least 10 trials for each (alpha, n) combination
+        effective_trials = max(trials, 10)
+        names = ("in_memory", "external")
+
+        def make_tasks(alpha, n):
+            return [
+                (alpha, n, self._cell_seed(EXTERNAL, alpha, n, t), self.cache, chunk_size, t == 0)
+                for t in range(effective_trials)
+            ]
+
+        def combine(outputs):
+            samples = {name: [out[name] for out in outputs] for name in names}
+            samples["peak_bytes"] = {name: outputs[0][f"{name}_peak_bytes"] for name in names}
+            return samples
+
+        cells = self._run_cells(f"{SWEEP_NAMES[EXTERNAL]}_chunk{chunk_size}", n_values, effective_trials,
+                                _external_trial, make_tasks, combine)
+        data = []
+        for alpha, n, samples in cells:
+            if n == n_values[0]:
+                print(f"\nRunning external runtime experiments for α = {alpha} (chunk={chunk_size})...")
+            peak_bytes = samples["peak_bytes"]
+            row = {'alpha': alpha, 'n': n, 'chunk_size': chunk_size}
+            for name in names:
+                mean, std = _mean_std(samples[name])
+                row[f'{name}_time_seconds_mean'] = mean
+                row[f'{name}_time_seconds_std'] = std
+                row[f'{name}_peak_bytes'] = peak_bytes[name]
+            data.append(row)
+            print(
+                f"n={n:8d} | "
+                f"in-memory: {row['in_memory_time_seconds_mean']:.3f} s, {peak_bytes['in_memory'] / 2**20:.1f} MiB | "
+                f"external: {row['external_time_seconds_mean']:.3f} s, {peak_bytes['external'] / 2**20:.1f} MiB"
+            )
+
+        df = pd.DataFrame(data)
+        df.to_csv('data/external_runtime_results.csv', index=False)
+        self._save_environment(SWEEP_NAMES[EXTERNAL])
+        print("External runtime results saved to data/external_runtime_results.csv")
+        return df
+
+    def run_sort_backend_experiments(self, n_values=None, trials=10, backends=SORT_BACKENDS):
+        """Measure sort and scan time of EFT, EST and SD for each sort backend"""
+        if n_values is None:
+            n_values = [2**i for i in range(10, 21, 2)]
+        
+        # Ensure at least 10 trials for each (alpha, n) combination
+        effective_trials = max(trials, 10)
+        backends = tuple(backends)
 
-    def plot_quality(self, results):
+        def make_tasks(alpha, n):
+            return [(alpha, n, self._cell_seed(SORT, alpha, n, t), backends, self.cache)
+                    for t in range(effective_trials)]
+
+        def combine(outputs):
+            samples = {}
+            for times in outputs:
+                for (algo, backend), (sort_time, scan_time) in times.items():
+                    cell = samples.setdefault(f"{algo}/{backend}", {"sort": [], "scan": []})
+                    cell["sort"].append(sort_time)
+                    cell["scan"].append(scan_time)
+            return samples
+
+        cells = self._run_cells(f"{SWEEP_NAMES[SORT]}[{','.join(backends)}]", n_values, effective_trials,
+                                _sort_backend_trial, make_tasks, combine)
+        data = []
+        for alpha, n, samples in cells:
+            if n == n_values[0]:
+                print(f"\nRunning sort backend experiments for α = {alpha}...")
+            for key, times in samples.items():
+                algo, backend = key.split("/")
+                sort_mean, sort_std = _mean_std(times["sort"])
+                scan_mean, scan_std = _mean_std(times["scan"])
+                data.append({
+                    'alpha': alpha,
+                    'n': n,
+                    'algorithm': algo,
+                    'backend': backend,
+                    'sort_time_seconds_mean': sort_mean,
+                    'sort_time_seconds_std': sort_std,
+                    'scan_time_seconds_mean': scan_mean,
+                    'scan_time_seconds_std': scan_std,
+                })
+            eft_sorts = " | ".join(
+                f"{row['backend']}: {row['sort_time_seconds_mean']*1000:.2f} ms"
+                for row in data if row['alpha'] == alpha and row['n'] == n and row['algorithm'] == "EFT"
+            )
+            print(f"n={n:8d} | EFT sort {eft_sorts}")
+
+        df = pd.DataFrame(data)
+        df.to_csv('data/sort_backend_results.csv', index=False)
+        self._save_environment(SWEEP_NAMES[SORT])
+        print("Sort backend results saved to data/sort_backend_results.csv")
+        return df
+
+    def run_phase_profile_experiments(self, n_values=None, trials=10, algorithms=("EFT", "EST", "SD")):
+        """Split scheduler runtime into phases (sort/scan, or subset/validity)
+
+        Uses the PhaseProfiler hooks in the greedy classes and
+        BruteForceScheduler; include "BruteForce" in algorithms only with
+        small n_values.
+        """
+        if n_values is None:
+            n_values = [2**i for i in range(10, 21, 2)]
+        
+        # Ensure at least 10 trials for each (alpha, n) combination
+        effective_trials = max(trials, 10)
+        algorithms = tuple(algorithms)
+
+        def make_tasks(alpha, n):
+            return [(alpha, n, self._cell_seed(PHASE, alpha, n, t), algorithms, self.cache)
+                    for t in range(effective_trials)]
+
+        def combine(outputs):
+            return {key: [times[key] for times in outputs] for key in outputs[0]}
+
+        cells = self._run_cells(f"{SWEEP_NAMES[PHASE]}[{','.join(algorithms)}]", n_values, effective_trials,
+                                _phase_trial, make_tasks, combine)
+        data = []
+        for alpha, n, samples in cells:
+            if n == n_values[0]:
+                print(f"\nRunning phase profile experiments for α = {alpha}...")
+            summary = []
+            for algo in algorithms:
+                totals = np.array(samples[f"{algo}/total"])
+                phases = [key.split("/")[1] for key in samples if key.startswith(f"{algo}/") and key != f"{algo}/total"]
+                parts = []
+                for phase in phases:
+                    phase_times = np.array(samples[f"{algo}/{phase}"])
+                    mean, std = _mean_std(phase_times)
+                    fraction = float(np.mean(phase_times / totals))
+                    data.append({
+                        'alpha': alpha,
+                        'n': n,
+                        'algorithm': algo,
+                        'phase': phase,
+                        'time_seconds_mean': mean,
+                        'time_seconds_std': std,
+                        'fraction_of_total_mean': fraction,
+                    })
+                    parts.append(f"{phase} {fraction * 100:.0f}%")
+                summary.append(f"{algo}: " + ", ".join(parts))
+            print(f"n={n:8d} | " + " | ".join(summary))
+
+        df = pd.DataFrame(data)
+        df.to_csv('data/phase_profile_results.csv', index=False)
+        self._save_environment(SWEEP_NAMES[PHASE])
+        print("Phase profile results saved to data/phase_profile_results.csv")
+        return df
+
+    def _fit_rows(self, sweep):
+        """Every fitting cost model per (algorithm, alpha) series of one sweep's CSV
+
+        A series with fewer than MIN_FIT_POINTS n values is skipped with a
+        warning. `tied` marks the fits the data cannot tell apart from the
+        best one (complexity.tied_fits); a series with more than one tied
+        fit gets a warning, since its best model is then a guess.
+        """
+        csv_path, columns, _ = FIT_SOURCES[sweep]
+        if not os.path.exists(csv_path):
+            raise FileNotFoundError(f"{csv_path} not found; run the {sweep} sweep first")
+        df = pd.read_csv(csv_path)
+        rows = []
+        for algo, column in columns.items():
+            for alpha in self.alphas:
+                series = df[df["alpha"] == alpha].sort_values("n")
+                if len(series) < MIN_FIT_POINTS:
+                    print(f"warning: {sweep} {algo} α={alpha} has {len(series)} n value(s); "
+                          f"at least {MIN_FIT_POINTS} are needed to fit, skipped")
+                    continue
+                fits = fit_cost_models(series["n"].to_numpy(), series[column].to_numpy())
+                tied = tied_fits(fits)
+                if len(tied) > 1:
+                    print(f"warning: {sweep} {algo} α={alpha}: models "
+                          f"{', '.join(fit.model for fit in tied)} fit about equally well")
+                for rank, fit in enumerate(fits):
+                    rows.append(dict(sweep=sweep, algorithm=algo, alpha=alpha, **fit.as_dict(),
+                                     n_min=int(series["n"].min()), n_max=int(series["n"].max()),
+                                     best=rank == 0, tied=rank < len(tied)))
+        return rows
+
+    def fit_complexity_models(self, sweeps=tuple(FIT_SOURCES), csv_path="data/complexity_fits.csv"):
+        """Fit n, n log n, n^2 and n 2^n cost models to the measured runtimes
+
+        Each (sweep, algorithm, alpha) series in the sweep's runtime CSV is
+        fitted to t(n) = intercept + scale * f(n) for every model in
+        complexity.COST_MODELS by relative least squares. One row per
+        successful fit goes to csv_path, with r2, relative RMSE and a best
+        flag on the lowest-error model of each series.
+        """
+        rows = []
+        for sweep in sweeps:
+            rows.extend(self._fit_rows(sweep))
+        df = pd.DataFrame(rows)
+        for row in df[df["best"]].itertuples():
+            print(f"{row.sweep:>10} {row.algorithm:<10} α={row.alpha:<4} best: {row.model:<8} "
+                  f"t(n) = {row.intercept:.3g} + {row.scale:.3g} f(n)  (R²={row.r2:.4f}, "
+                  f"rel. RMSE={row.rel_rmse:.3f})")
+        df.to_csv(csv_path, index=False)
+        print(f"Complexity fits saved to {csv_path}")
+        return df
+
+    def predict_sweep_time(self, sweep, n_values=None, trials=10, budget=None):
+        """Predicted wall time of a greedy or exhaustive runtime sweep before running it
+
+        Uses the best fit of every (algorithm, alpha) series in the sweep's
+        current CSV (see fit_complexity_models), so predictions beyond
+        the measured n range are extrapolations. Where several models fit
+        a series about equally well, the one predicting the most time at
+        each n is used. Raises ValueError if a series has no usable fit,
+        e.g. because it was measured at fewer than MIN_FIT_POINTS n values.
+        Each cell costs one
+        warmup plus max(trials, 10) timed runs of every algorithm, spread
+        over self.workers processes. Dataset generation is not counted.
+
+        Returns a dict with the per-cell predictions ("cells", a
+        DataFrame), the predicted total seconds, and, when a budget in
+        seconds is given, "within_budget": the longest prefix of the
+        sorted n_values whose predicted total fits in it.
+        """
+        if n_values is None:
+            n_values = FIT_SOURCES[sweep][2]
+        runs_per_cell = max(trials, 10) + 1
+        # (alpha, algorithm) -> the fits tied for best
+        tied = {}
+        for row in self._fit_rows(sweep):
+            if row["tied"]:
+                tied.setdefault((row["alpha"], row["algorithm"]), []).append(
+                    CostFit(row["model"], row["intercept"], row["scale"], row["r2"], row["rel_rmse"], row["points"]))
+        missing = [f"{algo} α={alpha}" for algo in FIT_SOURCES[sweep][1] for alpha in self.alphas
+                   if (alpha, algo) not in tied]
+        if missing:
+            raise ValueError(f"no cost model fits {', '.join(missing)}; measure the {sweep} sweep "
+                             f"at {MIN_FIT_POINTS} or more n values first")
+
+        def cell_seconds(alpha, n):
+            return runs_per_cell * sum(max(float(fit.predict(n)) for fit in tied[(alpha, algo)])
+                                       for algo in FIT_SOURCES[sweep][1])
+
+        def total(ns):
+            return sum(cell_seconds(alpha, n) for alpha in self.alphas for n in ns) / max(1, self.workers)
+
+        cells = pd.DataFrame([{"alpha": alpha, "n": n, "predicted_seconds": cell_seconds(alpha, n)}
+                              for alpha in self.alphas for n in n_values])
+        prediction = {"cells": cells, "total_seconds": total(list(n_values))}
+        if budget is not None:
+            prediction["within_budget"] = largest_n_within(total, n_values, budget)
+        return prediction
+
+    def plot_quality(self, results, filename="plots/quality_comparison.png"):
         # Prefer n-values recorded by run_quality_experiments; fallback to
         # the original default range if not present (for backward-compat).
         n_values = results.get("n_values", list(range(8, 21, 2)))
@@ -290,11 +1491,13 @@ class ExperimentRunner:
             plt.xlabel("Number of intervals (n)")
             plt.ylabel("Ratio to Optimal")
             plt.ylim(0.0, 1.05)
+            if max(n_values) / max(min(n_values), 1) > 100:
+                plt.xscale('log')  # exact-oracle sweeps span decades of n
             plt.legend()
             plt.grid(True, alpha=0.3)
         plt.suptitle("Solution Quality: Greedy vs Optimal", fontsize=16)
         plt.tight_layout()
-        plt.savefig("plots/quality_comparison.png", dpi=300)
+        plt.savefig(filename, dpi=300)
 
     def plot_greedy_big_o(self, results):
         algorithms = ["EFT", "EST", "SD"]
@@ -416,6 +1619,109 @@ class ExperimentRunner:
         plt.tight_layout(rect=[0, 0.06, 1, 0.94])
         plt.savefig("plots/greedy_big_o_from_csv.png", dpi=300)
 
+    def _plot_single_big_o(self, results, algo, color, title, filename):
+        """Raw and t(n) / (n log2 n) runtime plots for a single-algorithm sweep"""
+        fig, axes = plt.subplots(2, len(self.alphas), figsize=(5 * len(self.alphas), 8), sharex='col')
+
+        for col, alpha in enumerate(self.alphas):
+            n_arr = np.array(results[alpha]["n"])
+            t_arr = np.array(results[alpha][f"{algo}_time"])
+
+            # Row 0: Runtime t(n) vs n (log-log scale)
+            ax_raw = axes[0, col]
+            ax_raw.plot(n_arr, t_arr, marker="o", color=color, label=algo)
+            ax_raw.set_xscale('log')
+            ax_raw.set_yscale('log')
+            ax_raw.set_title(f"α = {alpha} ({self.alpha_names[col]})")
+            ax_raw.grid(True)
+            if col == 0:
+                ax_raw.set_ylabel("t(n) (log-log)")
+
+            # Row 1: Normalized runtime t(n) / (n log2 n)
+            ax_norm = axes[1, col]
+            log_n = np.log2(n_arr + 1e-8)  # avoid div0
+            ax_norm.plot(n_arr, t_arr / (n_arr * log_n), marker="o", color=color, label=algo)
+            ax_norm.set_xscale('log')
+            ax_norm.grid(True)
+            ax_norm.set_xlabel("n (log scale)")
+            if col == 0:
+                ax_norm.set_ylabel("t(n) / (n log2 n)")
+
+        handles, labels = axes[0, 0].get_legend_handles_labels()
+        fig.legend(handles, labels, loc='lower center', ncol=1, bbox_to_anchor=(0.5, 0.02))
+        fig.suptitle(title, fontsize=16, y=0.98)
+
+        plt.tight_layout(rect=[0, 0.06, 1, 0.94])
+        plt.savefig(filename, dpi=300)
+
+    def plot_weighted_big_o(self, results):
+        self._plot_single_big_o(results, "WIS", "tab:purple", "Weighted Interval Scheduling Runtime vs n",
+                                "plots/weighted_big_o.png")
+
+    def plot_partition_big_o(self, results):
+        self._plot_single_big_o(results, "IP", "tab:red", "Interval Partitioning Runtime vs n",
+                                "plots/partition_big_o.png")
+
+    def plot_parallel_eft_speedup(self, df, filename="plots/parallel_eft_speedup.png"):
+        """Speedup over serial EFT vs cores, one panel per alpha and one line per n"""
+        self._plot_speedup(df, "cores", "speedup vs serial EFT", "Gap-Partitioned Parallel EFT Speedup",
+                           filename)
+
+    def plot_exhaustive_scaling(self, df, filename="plots/exhaustive_scaling.png"):
+        """Strong-scaling speedup of the parallel exhaustive search vs workers"""
+        self._plot_speedup(df, "workers", "speedup vs serial", "Exhaustive Search Strong Scaling", filename)
+
+    def _plot_speedup(self, df, x, ylabel, title, filename):
+        """Speedup vs x (cores / workers) per alpha, one line per n, with the ideal diagonal"""
+        fig, axes = plt.subplots(1, len(self.alphas), figsize=(5 * len(self.alphas), 4.5), sharey=True)
+        counts = sorted(df[x].unique())
+
+        for col, alpha in enumerate(self.alphas):
+            ax = axes[col]
+            for n, rows in df[df['alpha'] == alpha].groupby('n'):
+                rows = rows.sort_values(x)
+                ax.plot(rows[x], rows['speedup'], marker="o", label=f"n={n}")
+            ax.plot(counts, counts, 'k--', linewidth=1, label="ideal")
+            ax.set_xscale('log', base=2)
+            ax.set_title(f"α = {alpha} ({self.alpha_names[col]})")
+            ax.set_xlabel(x)
+            ax.grid(True)
+            if col == 0:
+                ax.set_ylabel(ylabel)
+                ax.legend()
+
+        fig.suptitle(title, fontsize=16)
+        plt.tight_layout()
+        plt.savefig(filename, dpi=300)
+
+    def plot_memory_per_interval(self, results, filename="plots/greedy_memory.png"):
+        """Peak bytes per interval vs n from a memory=True greedy or exhaustive run"""
+        fig, axes = plt.subplots(1, len(self.alphas), figsize=(5 * len(self.alphas), 4.5), sharey=True)
+
+        for col, alpha in enumerate(self.alphas):
+            ax = axes[col]
+            n_arr = np.array(results[alpha]["n"])
+            # Greedy results have {algo}_peak_bytes keys, exhaustive a single peak_bytes
+            for key in results[alpha]:
+                if key == "peak_bytes":
+                    label = "Exhaustive"
+                elif key.endswith("_peak_bytes"):
+                    label = key[:-len("_peak_bytes")]
+                else:
+                    continue
+                ax.plot(n_arr, np.array(results[alpha][key]) / n_arr, marker="o", label=label)
+            ax.set_xscale('log')
+            ax.set_title(f"α = {alpha} ({self.alpha_names[col]})")
+            ax.set_xlabel("n (log scale)")
+            ax.grid(True)
+            if col == 0:
+                ax.set_ylabel("peak bytes / interval")
+                ax.legend()
+
+        fig.suptitle("Peak Traced Memory per Interval", fontsize=16)
+        plt.tight_layout()
+        plt.savefig(filename, dpi=300)
+
     def plot_exhaustive_big_o(self, results):
         plt.figure(figsize=(12, 5))
         
@@ -0,0 +1,134 @@
+import heapq
+import os
+import tempfile
+import numpy as np
+from operator import itemgetter
+from typing import Iterator, List, Tuple
+from .intervals import IntervalSet
+
+# On-disk layout: raw little-endian float64 (start, finish) records
+RECORD_DTYPE = np.dtype([("start", "<f8"), ("finish", "<f8")])
+
+
+def write_intervals(path: str, intervals: IntervalSet) -> None:
+    """Write intervals as raw (start, finish) float64 records."""
+    records = np.empty(len(intervals), dtype=RECORD_DTYPE)
+    records["start"] = intervals.start
+    records["finish"] = intervals.finish
+    records.tofile(path)
+
+
+def read_intervals(path: str) -> IntervalSet:
+    """Load a whole interval file into memory."""
+    records = np.fromfile(path, dtype=RECORD_DTYPE)
+    return IntervalSet(records["start"], records["finish"])
+
+
+def read_interval_chunks(path: str, chunk_size: int) -> Iterator[np.ndarray]:
+    """Yield record arrays of at most chunk_size intervals from a file."""
+    with open(path, "rb") as f:
+        while True:
+            records = np.fromfile(f, dtype=RECORD_DTYPE, count=chunk_size)
+            if len(records) == 0:
+                return
+            yield records
+
+
+def _iter_run(path: str, block_size: int) -> Iterator[Tuple[float, float]]:
+    """Stream (start, finish) tuples from a sorted run, block_size at a time."""
+    for block in read_interval_chunks(path, block_size):
+        yield from zip(block["start"].tolist(), block["finish"].tolist())
+
+
+def _write_stream(out, jobs: Iterator[Tuple[float, float]], block_size: int) -> int:
+    """Append a stream of (start, finish) tuples to out in blocks; return the count."""
+    count = 0
+    buffer = []
+    for job in jobs:
+        buffer.append(job)
+        if len(buffer) >= block_size:
+            np.array(buffer, dtype=np.float64).tofile(out)
+            count += len(buffer)
+            buffer = []
+    if buffer:
+        np.array(buffer, dtype=np.float64).tofile(out)
+        count += len(buffer)
+    return count
+
+
+class ExternalEarliestFinishTime:
+    """EFT over an interval file that does not fit in memory.
+
+    Phase 1 reads chunk_size intervals at a time, sorts each chunk by finish
+    time and writes it out as a sorted run. Phase 2 k-way merges the runs
+    (each read back in blocks of chunk_size // k) and feeds the merged stream
+    into the usual EFT scan. When there are more than fan_in runs they are
+    first merged in groups of fan_in, so at most fan_in files are open at
+    once. Peak memory is O(chunk_size) regardless of the file size. Sorting
+    is stable, so ties break in file order as with the in-memory IntervalSet
+    path.
+    """
+
+    def __init__(self, path: str, chunk_size: int = 1 << 20, tmp_dir: str = None, fan_in: int = 256):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        if fan_in < 2:
+            raise ValueError("fan_in must be at least 2")
+        self.path = path
+        self.chunk_size = chunk_size
+        self.tmp_dir = tmp_dir
+        self.fan_in = fan_in
+
+    def _write_runs(self, run_dir: str) -> List[str]:
+        runs = []
+        for records in read_interval_chunks(self.path, self.chunk_size):
+            records = records[np.argsort(records["finish"], kind="stable")]
+            run_path = os.path.join(run_dir, f"run_{len(runs):06d}.bin")
+            records.tofile(run_path)
+            runs.append(run_path)
+        return runs
+
+    def _merge(self, runs: List[str]) -> Iterator[Tuple[float, float]]:
+        block_size = max(1, self.chunk_size // len(runs))
+        return heapq.merge(*(_iter_run(r, block_size) for r in runs), key=itemgetter(1))
+
+    def _reduce_runs(self, runs: List[str], run_dir: str) -> List[str]:
+        """Merge groups of fan_in runs into longer runs until few enough remain."""
+        generation = 0
+        while len(runs) > self.fan_in:
+            merged_runs = []
+            for g in range(0, len(runs), self.fan_in):
+                group = runs[g:g + self.fan_in]
+                out_path = os.path.join(run_dir, f"merge_{generation:03d}_{len(merged_runs):06d}.bin")
+                with open(out_path, "wb") as out:
+                    _write_stream(out, self._merge(group), self.chunk_size)
+                for path in group:
+                    os.remove(path)
+                merged_runs.append(out_path)
+            runs = merged_runs
+            generation += 1
+        return runs
+
+    def _iter_selected(self) -> Iterator[Tuple[float, float]]:
+        with tempfile.TemporaryDirectory(dir=self.tmp_dir) as run_dir:
+            runs = self._reduce_runs(self._write_runs(run_dir), run_dir)
+            if not runs:
+                return
+            merged = self._merge(runs)
+
+            last = next(merged)
+            yield last
+            last_finish = last[1]
+            for job in merged:
+                if job[0] >= last_finish:
+                    yield job
+                    last_finish = job[1]
+
+    def schedule_jobs(self) -> List[Tuple[float, float]]:
+        """Selected intervals in finish order, collected in memory."""
+        return list(self._iter_selected())
+
+    def schedule_to_file(self, output_path: str) -> int:
+        """Stream the selection to output_path (same record layout); return its size."""
+        with open(output_path, "wb") as out:
+            return _write_stream(out, self._iter_selected(), self.chunk_size)
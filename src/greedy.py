@@ -1,38 +1,76 @@
-from .sorting import merge_sort, merge_sort_by_duration
+import time
+import numpy as np
+from .sorting import sort_jobs
+from .intervals import IntervalSet, greedy_scan, pointer_jump_scan
 
-class EarlierStartTime:
-    def __init__(self, job):
-        self.job = job
-    
-    def schedule_jobs(self):
-        self.job = merge_sort(self.job, dimension=0)
-        self.selected_jobs = [self.job[0]]
-        for job in self.job[1:]:
-            if job[0] >= self.selected_jobs[-1][1]:
-                self.selected_jobs.append(job)
-        return self.selected_jobs
 
+class GreedyScheduler:
+    """Sort jobs by `sort_key`, then keep every job that starts at or after
+    the last selected finish.
 
-class EarliestFinishTime:
-    def __init__(self, job):
+    sort_backend picks the sorting algorithm (see sorting.SORT_BACKENDS);
+    None keeps the default for the input type: merge sort for tuple lists,
+    numpy argsort for IntervalSets. An optional profiler (see
+    benchmark.PhaseProfiler) receives the time of the "sort" and "scan"
+    phases.
+    """
+    sort_key = None
+
+    def __init__(self, job, sort_backend=None, profiler=None):
         self.job = job
-    
-    def schedule_jobs(self):
-        self.job = merge_sort(self.job, dimension=1)
+        self.sort_backend = sort_backend
+        self.profiler = profiler
+
+    def sort(self):
+        self.job = sort_jobs(self.job, self.sort_key, self.sort_backend)
+        return self.job
+
+    def scan(self):
+        if isinstance(self.job, IntervalSet):
+            self.selected_jobs = self.job.take(greedy_scan(self.job.start.tolist(), self.job.finish.tolist()))
+            return self.selected_jobs
         self.selected_jobs = [self.job[0]]
         for job in self.job[1:]:
             if job[0] >= self.selected_jobs[-1][1]:
                 self.selected_jobs.append(job)
         return self.selected_jobs
-    
-class ShortestDuration:
-    def __init__(self, job):
-        self.job = job
-    
+
     def schedule_jobs(self):
-        self.job = merge_sort_by_duration(self.job)
-        self.selected_jobs = [self.job[0]]
-        for job in self.job[1:]:
-            if job[0] >= self.selected_jobs[-1][1]:
-                self.selected_jobs.append(job)
-        return self.selected_jobs
\ No newline at end of file
+        if self.profiler is None:
+            self.sort()
+            return self.scan()
+        start = time.perf_counter()
+        self.sort()
+        self.profiler.add("sort", time.perf_counter() - start)
+        start = time.perf_counter()
+        selected = self.scan()
+        self.profiler.add("scan", time.perf_counter() - start)
+        return selected
+
+
+class EarlierStartTime(GreedyScheduler):
+    sort_key = "start"
+
+
+class EarliestFinishTime(GreedyScheduler):
+    sort_key = "finish"
+
+
+class ShortestDuration(GreedyScheduler):
+    sort_key = "duration"
+
+
+class PointerJumpEarliestFinishTime(EarliestFinishTime):
+    """EarliestFinishTime with the Python scan loop replaced by
+    intervals.pointer_jump_scan (searchsorted successors + pointer
+    doubling). Same sort, so the output is identical for both input types.
+    """
+
+    def scan(self):
+        if isinstance(self.job, IntervalSet):
+            self.selected_jobs = self.job.take(pointer_jump_scan(self.job.start, self.job.finish))
+            return self.selected_jobs
+        # Tuples may carry a weight after (start, finish)
+        arr = np.array(self.job, dtype=np.float64).reshape(len(self.job), -1)
+        self.selected_jobs = [self.job[i] for i in pointer_jump_scan(arr[:, 0], arr[:, 1]).tolist()]
+        return self.selected_jobs
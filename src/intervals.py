@@ -0,0 +1,156 @@
+import numpy as np
+from typing import Iterable, List, Tuple
+
+
+class IntervalSet:
+    """Columnar interval container backed by contiguous NumPy arrays.
+
+    start/finish are float64 arrays of equal length; ids is an optional
+    int64 column that survives sorting and selection so results can be
+    mapped back to the original jobs, and weights is an optional float64
+    value column for weighted scheduling. Iterating yields (start, finish)
+    tuples, so code written against List[Tuple[float, float]] keeps working.
+    """
+
+    def __init__(self, start, finish, ids=None, weights=None):
+        self.start = np.ascontiguousarray(start, dtype=np.float64)
+        self.finish = np.ascontiguousarray(finish, dtype=np.float64)
+        if self.start.ndim != 1 or self.start.shape != self.finish.shape:
+            raise ValueError("start and finish must be 1-D arrays of equal length")
+        if ids is not None:
+            ids = np.ascontiguousarray(ids, dtype=np.int64)
+            if ids.shape != self.start.shape:
+                raise ValueError("ids must have the same length as start/finish")
+        self.ids = ids
+        if weights is not None:
+            weights = np.ascontiguousarray(weights, dtype=np.float64)
+            if weights.shape != self.start.shape:
+                raise ValueError("weights must have the same length as start/finish")
+        self.weights = weights
+
+    @classmethod
+    def from_tuples(cls, jobs: Iterable[Tuple[float, ...]], with_ids: bool = False) -> "IntervalSet":
+        """Build from (start, finish) pairs or (start, finish, weight) triples."""
+        arr = np.asarray(list(jobs), dtype=np.float64)
+        if arr.size == 0:
+            arr = arr.reshape(0, 2)
+        if arr.ndim != 2 or arr.shape[1] not in (2, 3):
+            raise ValueError("jobs must be (start, finish) or (start, finish, weight) tuples")
+        ids = np.arange(len(arr), dtype=np.int64) if with_ids else None
+        weights = arr[:, 2] if arr.shape[1] == 3 else None
+        return cls(arr[:, 0], arr[:, 1], ids, weights)
+
+    def to_tuples(self) -> List[Tuple[float, ...]]:
+        """(start, finish) pairs, or (start, finish, weight) triples if weighted."""
+        if self.weights is not None:
+            return list(zip(self.start.tolist(), self.finish.tolist(), self.weights.tolist()))
+        return list(zip(self.start.tolist(), self.finish.tolist()))
+
+    @property
+    def duration(self) -> np.ndarray:
+        return self.finish - self.start
+
+    def take(self, indices) -> "IntervalSet":
+        """Return the intervals at the given positions (in that order)."""
+        indices = np.asarray(indices, dtype=np.intp)
+        ids = self.ids[indices] if self.ids is not None else None
+        weights = self.weights[indices] if self.weights is not None else None
+        return IntervalSet(self.start[indices], self.finish[indices], ids, weights)
+
+    def __len__(self) -> int:
+        return self.start.shape[0]
+
+    def __getitem__(self, key):
+        if isinstance(key, (int, np.integer)):
+            return (float(self.start[key]), float(self.finish[key]))
+        if isinstance(key, slice):
+            # Basic slicing keeps views into the parent arrays (no copy)
+            ids = self.ids[key] if self.ids is not None else None
+            weights = self.weights[key] if self.weights is not None else None
+            return IntervalSet(self.start[key], self.finish[key], ids, weights)
+        return self.take(key)
+
+    def __iter__(self):
+        return iter(zip(self.start.tolist(), self.finish.tolist()))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return (
+            np.array_equal(self.start, other.start)
+            and np.array_equal(self.finish, other.finish)
+        )
+
+    def __repr__(self) -> str:
+        return f"IntervalSet(n={len(self)}, ids={'yes' if self.ids is not None else 'no'})"
+
+
+def as_interval_set(jobs, with_ids: bool = False) -> IntervalSet:
+    """Return jobs as an IntervalSet, without copying if it already is one."""
+    if isinstance(jobs, IntervalSet):
+        return jobs
+    return IntervalSet.from_tuples(jobs, with_ids=with_ids)
+
+
+def greedy_scan(start: List[float], finish: List[float]) -> List[int]:
+    """Positions picked by the greedy loop over already-ordered intervals.
+
+    Mirrors the selection rule in greedy.py: always take the first interval,
+    then take any interval whose start is >= the last selected finish.
+    """
+    selected = [0]
+    last_finish = finish[0]
+    for i in range(1, len(start)):
+        if start[i] >= last_finish:
+            selected.append(i)
+            last_finish = finish[i]
+    return selected
+
+
+def eft_successors(start: np.ndarray, finish: np.ndarray) -> np.ndarray:
+    """For intervals in non-decreasing finish order, the position greedy_scan
+    picks right after selecting each one (len(start) if none).
+
+    next[i] is the first j > i with start[j] >= finish[i]. Any j with
+    start[j] >= finish[i] has finish[j] >= finish[i], so apart from
+    zero-length intervals tying on finish with i it is the first j overall;
+    that is one searchsorted on the running maximum of start. Zero-length
+    intervals are nudged one ulp down in that maximum so a tie never
+    matches from before i, and are instead taken from a next-zero-length
+    table when they sit after i in its finish block.
+    """
+    n = len(start)
+    zero_length = start == finish
+    if not zero_length.any():
+        return np.searchsorted(np.maximum.accumulate(start), finish, side="left")
+    reach = np.maximum.accumulate(np.where(zero_length, np.nextafter(start, -np.inf), start))
+    following = np.searchsorted(reach, finish, side="left")
+
+    # Next zero-length position strictly after i, and whether it ties on finish
+    next_zero = np.minimum.accumulate(np.where(zero_length, np.arange(n), n)[::-1])[::-1]
+    next_zero = np.append(next_zero[1:], n)
+    tied = next_zero < n
+    tied[tied] = finish[next_zero[tied]] == finish[tied]
+    return np.where(tied, next_zero, following)
+
+
+def pointer_jump_scan(start: np.ndarray, finish: np.ndarray) -> np.ndarray:
+    """Positions picked by greedy_scan over intervals in non-decreasing finish order.
+
+    The picks are the chain 0, next[0], next[next[0]], ... of
+    eft_successors. Pointer doubling collects it in O(log n) vectorized
+    passes: after k passes `chain` holds the first 2^k chain entries and
+    jump is next applied 2^k times.
+    """
+    n = len(start)
+    if n == 0:
+        return np.empty(0, dtype=np.intp)
+    index_type = np.int32 if n < np.iinfo(np.int32).max else np.int64
+    jump = np.append(eft_successors(start, finish), n).astype(index_type)  # position n is a sink
+    chain = np.zeros(1, dtype=index_type)
+    while jump[0] < n:
+        reached = jump[chain]
+        chain = np.concatenate([chain, reached[reached < n]])
+        jump = jump[jump]
+    chain.sort()
+    return chain.astype(np.intp)
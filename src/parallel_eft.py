@@ -0,0 +1,94 @@
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from .intervals import IntervalSet, as_interval_set, greedy_scan
+
+
+def find_segments(start, finish) -> np.ndarray:
+    """Cut positions of start-ordered intervals into independent segments.
+
+    start/finish must already be in start order. Position i is a cut when
+    start[i] is strictly later than every earlier finish, so no interval
+    crosses it; one pass of a running maximum finds them all. Touching
+    endpoints are not cut, so a zero-length interval at the cut time can
+    never tie in finish with the segment before it.
+    """
+    if len(start) == 0:
+        return np.empty(0, dtype=np.intp)
+    reach = np.maximum.accumulate(finish)
+    return np.flatnonzero(start[1:] > reach[:-1]) + 1
+
+
+def _schedule_chunk(task):
+    """EFT over one run of whole segments -> selected original positions, in finish order
+
+    Ties in finish break by original position, like the stable argsort of
+    the serial IntervalSet path.
+    """
+    start, finish, positions = task
+    # Chunks arrive in start order, so finish is nearly sorted and a stable
+    # argsort is cheap; only equal finishes need the positional tie-break
+    order = finish.argsort(kind="stable")
+    ordered_finish = finish[order]
+    if np.any(ordered_finish[1:] == ordered_finish[:-1]):
+        order = np.lexsort((positions, finish))
+    selected = greedy_scan(start[order].tolist(), finish[order].tolist())
+    return positions[order][selected]
+
+
+class ParallelEarliestFinishTime:
+    """Earliest Finish Time, split at idle points and scheduled on several cores.
+
+    Intervals are ordered by start once to find the cut points; the
+    segments between cuts share no time, so EFT on each is independent
+    and their selections concatenate (segments are in finish order too)
+    into exactly the serial EarliestFinishTime result on an IntervalSet.
+    Consecutive segments are grouped into about workers * chunks_per_worker
+    chunks of similar size, one pool task each.
+
+    Pass an existing ProcessPoolExecutor as pool to reuse warm workers
+    (workers should then be its size); otherwise one with `workers`
+    processes is started per call, and workers=1 runs in this process.
+    Tuple-list input is returned as tuples and matches the tuple path of
+    EarliestFinishTime whenever finish times are distinct (its merge sort
+    does not break ties by input order).
+    """
+
+    def __init__(self, job, workers=1, pool=None, chunks_per_worker=4):
+        self.job = job
+        self.workers = workers
+        self.pool = pool
+        self.chunks_per_worker = chunks_per_worker
+        self.num_segments = 0
+
+    def chunks(self, jobs: IntervalSet):
+        """Pool tasks: (start, finish, original positions) per chunk, in start order."""
+        by_start = jobs.start.argsort(kind="stable")
+        start, finish = jobs.start[by_start], jobs.finish[by_start]
+        cuts = find_segments(start, finish)
+        self.num_segments = len(cuts) + 1 if len(start) else 0
+
+        # Snap evenly spaced split targets to the next cut point
+        n_chunks = max(1, self.workers * self.chunks_per_worker)
+        targets = np.linspace(0, len(start), n_chunks + 1)[1:-1]
+        snapped = np.searchsorted(cuts, targets)
+        bounds = np.unique(cuts[snapped[snapped < len(cuts)]])
+        edges = [0, *bounds.tolist(), len(start)]
+        return [(start[a:b], finish[a:b], by_start[a:b]) for a, b in zip(edges[:-1], edges[1:])]
+
+    def schedule_jobs(self):
+        jobs = as_interval_set(self.job)
+        if len(jobs) == 0:
+            self.selected_jobs = jobs if isinstance(self.job, IntervalSet) else []
+            return self.selected_jobs
+        tasks = self.chunks(jobs)
+        if self.pool is not None:
+            parts = list(self.pool.map(_schedule_chunk, tasks))
+        elif self.workers > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                parts = list(pool.map(_schedule_chunk, tasks))
+        else:
+            parts = [_schedule_chunk(task) for task in tasks]
+
+        selected = jobs.take(np.concatenate(parts))
+        self.selected_jobs = selected if isinstance(self.job, IntervalSet) else selected.to_tuples()
+        return self.selected_jobs
@@ -0,0 +1,71 @@
+import json
+import os
+import sqlite3
+from typing import List, Optional, Tuple
+
+
+class ResultsStore:
+    """Durable per-cell checkpoint of experiment results in SQLite.
+
+    Each finished (sweep, alpha, n) cell is written and committed as soon
+    as it completes, as a JSON payload of its per-trial samples, so a
+    crashed sweep can be restarted and skip the cells already done. A
+    small key/value table (get_meta / set_meta) keeps run-wide settings,
+    such as the seed entropy an unseeded runner resumes with.
+    """
+
+    def __init__(self, path: str = "data/results.sqlite"):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS cells ("
+            " sweep TEXT NOT NULL,"
+            " alpha REAL NOT NULL,"
+            " n INTEGER NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " PRIMARY KEY (sweep, alpha, n))"
+        )
+        self.conn.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+        self.conn.commit()
+
+    def get(self, sweep: str, alpha: float, n: int) -> Optional[dict]:
+        row = self.conn.execute(
+            "SELECT payload FROM cells WHERE sweep = ? AND alpha = ? AND n = ?",
+            (sweep, float(alpha), int(n)),
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put(self, sweep: str, alpha: float, n: int, payload: dict) -> None:
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cells (sweep, alpha, n, payload) VALUES (?, ?, ?, ?)",
+                (sweep, float(alpha), int(n), json.dumps(payload)),
+            )
+
+    def get_meta(self, key: str) -> Optional[str]:
+        row = self.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value))
+
+    def cells(self, sweep: str) -> List[Tuple[float, int, dict]]:
+        rows = self.conn.execute(
+            "SELECT alpha, n, payload FROM cells WHERE sweep = ? ORDER BY alpha, n", (sweep,)
+        ).fetchall()
+        return [(alpha, n, json.loads(payload)) for alpha, n, payload in rows]
+
+    def clear(self, sweep: Optional[str] = None) -> None:
+        """Forget stored cells (of one sweep, or all) so they are recomputed."""
+        with self.conn:
+            if sweep is None:
+                self.conn.execute("DELETE FROM cells")
+            else:
+                self.conn.execute("DELETE FROM cells WHERE sweep = ?", (sweep,))
+
+    def close(self) -> None:
+        self.conn.close()
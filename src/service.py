@@ -0,0 +1,331 @@
+import asyncio
+import json
+import time
+import numpy as np
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional, Sequence
+from .batch import schedule_ragged
+from .dataset_generator import generate_dataset
+from .greedy import EarliestFinishTime, EarlierStartTime, ShortestDuration
+from .intervals import IntervalSet
+from .optimal import ExactOptimalScheduler
+
+SERVICE_HEURISTICS = {
+    "EFT": EarliestFinishTime,
+    "EST": EarlierStartTime,
+    "SD": ShortestDuration,
+    "exact": ExactOptimalScheduler,
+}
+
+
+def _schedule_request(task):
+    """One request through its scheduler class -> selected input positions, ascending
+
+    Runs in a thread for small requests and in a pool worker for large ones.
+    """
+    heuristic, start, finish = task
+    jobs = IntervalSet(start, finish, np.arange(len(start), dtype=np.int64))
+    selected = SERVICE_HEURISTICS[heuristic](jobs).schedule_jobs()
+    return np.sort(selected.ids).tolist()
+
+
+def _schedule_micro_batch(requests):
+    """Small requests -> selected positions per request, grouped by heuristic
+
+    A group is scheduled with one schedule_ragged call when it has at
+    least half as many requests as its longest request has jobs. The
+    kernel's Python loop runs once per column, and each column costs
+    about as much as two small requests scheduled one by one, so smaller
+    groups are faster through the scheduler classes. "exact" breaks
+    finish-time ties by start time, which schedule_ragged does not, so
+    those requests are always scheduled one by one.
+    """
+    results = [None] * len(requests)
+    groups = {}
+    for i, (heuristic, start, finish) in enumerate(requests):
+        groups.setdefault(heuristic, []).append(i)
+    for heuristic, members in groups.items():
+        lengths = [len(requests[i][1]) for i in members]
+        if heuristic == "exact" or 2 * len(members) < max(lengths):
+            for i in members:
+                results[i] = _schedule_request(requests[i])
+            continue
+        offsets = np.concatenate([[0], np.cumsum(lengths)])
+        start = np.concatenate([requests[i][1] for i in members])
+        finish = np.concatenate([requests[i][2] for i in members])
+        _, selected = schedule_ragged(start, finish, offsets, heuristic)
+        for i, a, b in zip(members, offsets[:-1], offsets[1:]):
+            results[i] = np.flatnonzero(selected[a:b]).tolist()
+    return results
+
+
+class SchedulingService:
+    """Long-running asyncio scheduling server, so callers skip Python start-up and imports.
+
+    Clients send one JSON request per line, {"id": ..., "heuristic":
+    "EFT"|"EST"|"SD"|"exact", "jobs": [[start, finish], ...]}, and get
+    one line back, {"id": ..., "count": k, "selected": [positions]} with
+    the positions of the picked jobs in the request's list, ascending,
+    or {"id": ..., "error": message}. {"op": "stats"} returns the
+    counters of stats(). Requests on one connection are answered in
+    order; clients open several connections for concurrency.
+
+    Requests with fewer than large_threshold jobs are queued and grouped
+    into micro-batches: the batcher waits up to batch_window seconds for
+    more requests, but never for more than max_batch or than the number of
+    connections that could still send one (a connection has at most one
+    request outstanding), so a lone client is not delayed. It schedules
+    the whole batch in a thread so the event loop keeps accepting
+    connections, with one vectorized batch.schedule_ragged call per
+    heuristic once a batch is big enough to amortize it. With
+    micro_batch=False each small request is scheduled on its own in a
+    thread instead. Larger requests go to a process pool of `workers`
+    processes and never block the loop. Any failure while scheduling
+    (e.g. a broken process pool) becomes an error response, not a dropped
+    connection.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, path: Optional[str] = None,
+                 micro_batch: bool = True, batch_window: float = 0.002, max_batch: int = 64,
+                 large_threshold: int = 4096, workers: int = 2, latency_window: int = 10000):
+        self.host = host
+        self.port = port
+        self.path = path
+        self.micro_batch = micro_batch
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.large_threshold = large_threshold
+        self.workers = workers
+        self.counters = dict(requests=0, errors=0, jobs=0, batches=0, batched_requests=0, pooled_requests=0)
+        # Seconds from request parsed to response ready, most recent first out
+        self.latencies = deque(maxlen=latency_window)
+        self.started = time.perf_counter()
+        self._queue = None
+        self._pool = None
+        self._server = None
+        self._batcher = None
+        # Open connections (their writers) and the handler tasks serving them
+        self._writers = set()
+        self._handlers = set()
+        self._pooled_in_flight = 0
+
+    def stats(self) -> Dict[str, object]:
+        """Request counters, throughput since start-up, and latency percentiles (ms)"""
+        uptime = time.perf_counter() - self.started
+        stats = dict(self.counters, uptime_seconds=uptime,
+                     throughput_rps=self.counters["requests"] / uptime if uptime > 0 else 0.0)
+        if self.counters["batches"]:
+            stats["mean_batch_size"] = self.counters["batched_requests"] / self.counters["batches"]
+        if self.latencies:
+            p50, p90, p99 = np.percentile(np.fromiter(self.latencies, dtype=np.float64), [50, 90, 99]) * 1000
+            stats["latency_ms"] = {"p50": p50, "p90": p90, "p99": p99, "max": max(self.latencies) * 1000}
+        return stats
+
+    async def start(self) -> None:
+        self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        if self.micro_batch:
+            self._queue = asyncio.Queue()
+            self._batcher = asyncio.ensure_future(self._run_batches())
+        # Large requests arrive as a single line, so lift the 64 KiB default line limit
+        if self.path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=self.path, limit=1 << 30)
+        else:
+            self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=1 << 30)
+            self.port = self._server.sockets[0].getsockname()[1]
+        self.started = time.perf_counter()
+
+    async def close(self) -> None:
+        self._server.close()
+        # Dropping the connections ends each handler at its next read
+        for writer in list(self._writers):
+            writer.close()
+        await asyncio.gather(*self._handlers, return_exceptions=True)
+        await self._server.wait_closed()
+        if self._batcher is not None:
+            self._batcher.cancel()
+        self._pool.shutdown()
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def _handle(self, reader, writer) -> None:
+        self._writers.add(writer)
+        self._handlers.add(asyncio.current_task())
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                response = await self._respond(line)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._writers.discard(writer)
+            self._handlers.discard(asyncio.current_task())
+            writer.close()
+
+    async def _respond(self, line: bytes) -> dict:
+        received = time.perf_counter()
+        request_id = None
+        try:
+            request = json.loads(line)
+            request_id = request.get("id")
+            if request.get("op") == "stats":
+                return {"id": request_id, "stats": self.stats()}
+            heuristic = request.get("heuristic", "EFT")
+            if heuristic not in SERVICE_HEURISTICS:
+                raise ValueError(f"unknown heuristic {heuristic!r}; choose from {tuple(SERVICE_HEURISTICS)}")
+            arr = np.asarray(request["jobs"], dtype=np.float64)
+            if arr.size == 0:
+                arr = arr.reshape(0, 2)
+            if arr.ndim != 2 or arr.shape[1] != 2:
+                raise ValueError("jobs must be a list of [start, finish] pairs")
+            selected = await self._schedule(heuristic, arr[:, 0].copy(), arr[:, 1].copy())
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self.counters["errors"] += 1
+            return {"id": request_id, "error": str(e)}
+        except Exception as e:
+            # e.g. BrokenProcessPool: answer instead of dropping the connection
+            self.counters["errors"] += 1
+            return {"id": request_id, "error": f"internal error: {type(e).__name__}: {e}"}
+        self.counters["requests"] += 1
+        self.counters["jobs"] += len(arr)
+        self.latencies.append(time.perf_counter() - received)
+        return {"id": request_id, "count": len(selected), "selected": selected}
+
+    async def _schedule(self, heuristic, start, finish) -> List[int]:
+        if len(start) == 0:
+            return []
+        loop = asyncio.get_running_loop()
+        if len(start) >= self.large_threshold:
+            self.counters["pooled_requests"] += 1
+            self._pooled_in_flight += 1
+            pool = self._pool
+            try:
+                return await loop.run_in_executor(pool, _schedule_request, (heuristic, start, finish))
+            except BrokenProcessPool:
+                # A worker died: fail this request, but serve later ones from a fresh pool
+                if self._pool is pool:
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers)
+                    pool.shutdown(wait=False)
+                raise
+            finally:
+                self._pooled_in_flight -= 1
+        if not self.micro_batch:
+            return await loop.run_in_executor(None, _schedule_request, (heuristic, start, finish))
+        future = loop.create_future()
+        await self._queue.put(((heuristic, start, finish), future))
+        return await future
+
+    async def _run_batches(self) -> None:
+        """Collect queued small requests into micro-batches and schedule them"""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.batch_window
+            while len(batch) < min(self.max_batch, len(self._writers) - self._pooled_in_flight):
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            self.counters["batches"] += 1
+            self.counters["batched_requests"] += len(batch)
+            try:
+                results = await loop.run_in_executor(None, _schedule_micro_batch, [req for req, _ in batch])
+            except Exception as e:
+                # Each waiting request answers with the error (see _respond)
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+
+class ScheduleClient:
+    """One connection to a SchedulingService; requests are sent one at a time."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, path: Optional[str] = None):
+        self.host = host
+        self.port = port
+        self.path = path
+        self._reader = None
+        self._writer = None
+        self._next_id = 0
+
+    async def connect(self) -> None:
+        if self.path is not None:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.path, limit=1 << 30)
+        else:
+            self._reader, self._writer = await asyncio.open_connection(self.host, self.port, limit=1 << 30)
+
+    async def request(self, payload: dict) -> dict:
+        self._next_id += 1
+        self._writer.write(json.dumps(dict(payload, id=self._next_id)).encode() + b"\n")
+        await self._writer.drain()
+        return json.loads(await self._reader.readline())
+
+    async def schedule(self, jobs, heuristic: str = "EFT") -> dict:
+        return await self.request({"heuristic": heuristic, "jobs": [list(job[:2]) for job in jobs]})
+
+    async def stats(self) -> dict:
+        return (await self.request({"op": "stats"}))["stats"]
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+
+
+async def run_load(host: str = "127.0.0.1", port: int = 8765, path: Optional[str] = None,
+                   concurrency_levels: Sequence[int] = (1, 4, 16, 64), requests: int = 500,
+                   n: int = 100, alpha: float = 1.0, heuristic: str = "EFT", seed: int = 0) -> List[dict]:
+    """Measure client-side latency and throughput at several concurrency levels.
+
+    At each level, `concurrency` connections share `requests` requests,
+    each sending its next request as soon as the previous one returns.
+    Request bodies cycle through 32 generate_dataset(n, alpha) datasets
+    drawn up front. Returns one row per level.
+    """
+    bodies = [{"heuristic": heuristic, "jobs": [list(job) for job in generate_dataset(n, alpha, seed=child)]}
+              for child in np.random.SeedSequence(seed).spawn(32)]
+    rows = []
+    for concurrency in concurrency_levels:
+        clients = [ScheduleClient(host, port, path) for _ in range(concurrency)]
+        await asyncio.gather(*(client.connect() for client in clients))
+        latencies = []
+        remaining = iter(range(requests))
+
+        async def drive(client):
+            for i in remaining:
+                sent = time.perf_counter()
+                response = await client.request(bodies[i % len(bodies)])
+                latencies.append(time.perf_counter() - sent)
+                if "error" in response:
+                    raise RuntimeError(response["error"])
+
+        started = time.perf_counter()
+        await asyncio.gather(*(drive(client) for client in clients))
+        elapsed = time.perf_counter() - started
+        await asyncio.gather(*(client.close() for client in clients))
+        p50, p99 = np.percentile(latencies, [50, 99]) * 1000
+        rows.append({
+            "concurrency": concurrency,
+            "requests": len(latencies),
+            "n": n,
+            "p50_ms": p50,
+            "p99_ms": p99,
+            "throughput_rps": len(latencies) / elapsed,
+        })
+    return rows
@@ -1,3 +1,7 @@
+import numpy as np
+from .intervals import IntervalSet
+
+
 def merge_sort(jobs, dimension=0):
     if len(jobs) <= 1:
         return jobs
@@ -10,12 +14,13 @@ def merge(left, right, dimension):
     sorted_arr = []
     i = j = 0
     while i < len(left) and j < len(right):
-        if left[i][dimension] < right[j][dimension]:
-            sorted_arr.append(left[i])
-            i += 1
-        else:
+        # Take from the left on ties, so equal keys keep their input order
+        if right[j][dimension] < left[i][dimension]:
             sorted_arr.append(right[j])
             j += 1
+        else:
+            sorted_arr.append(left[i])
+            i += 1
     sorted_arr.extend(left[i:])
     sorted_arr.extend(right[j:])
     return sorted_arr
@@ -35,12 +40,117 @@ def merge_by_duration(left, right):
     while i < len(left) and j < len(right):
         left_duration = left[i][1] - left[i][0]
         right_duration = right[j][1] - right[j][0]
-        if left_duration < right_duration:
-            sorted_arr.append(left[i])
-            i += 1
-        else:
+        if right_duration < left_duration:
             sorted_arr.append(right[j])
             j += 1
+        else:
+            sorted_arr.append(left[i])
+            i += 1
     sorted_arr.extend(left[i:])
     sorted_arr.extend(right[j:])
-    return sorted_arr
\ No newline at end of file
+    return sorted_arr
+
+# ---------------------------------------------------------------------------
+# Pluggable sort backends
+#
+# Every backend maps a sequence of keys to a stable ordering (a permutation
+# of positions). "merge" on tuple lists keeps the original merge_sort /
+# merge_sort_by_duration path above, which is stable too, so tuple lists,
+# IntervalSets and batch.schedule_batch break ties the same way.
+# ---------------------------------------------------------------------------
+
+SORT_BACKENDS = ("merge", "bottomup", "timsort", "argsort", "radix")
+
+# Column used for each sort key by the tuple-based merge sort
+KEY_DIMENSION = {"start": 0, "finish": 1}
+
+
+def bottom_up_merge_order(keys):
+    """Iterative (bottom-up) stable merge sort over precomputed keys.
+
+    Merges runs of width 1, 2, 4, ... between two index buffers, so there
+    is no recursion and no list slicing; keys are looked up, never recomputed.
+    """
+    n = len(keys)
+    src = list(range(n))
+    dst = [0] * n
+    width = 1
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if keys[src[j]] < keys[src[i]]:
+                    dst[k] = src[j]
+                    j += 1
+                else:
+                    dst[k] = src[i]
+                    i += 1
+                k += 1
+            dst[k:hi] = src[i:mid] if i < mid else src[j:hi]
+        src, dst = dst, src
+        width *= 2
+    return src
+
+
+def radix_order(keys):
+    """LSD radix sort on the IEEE-754 bits of float64 keys.
+
+    Floats are mapped to uint64 so that unsigned order equals numeric order
+    (flip all bits of negatives, set the sign bit of non-negatives), then
+    sorted in four stable passes over 16-bit digits. Each pass is a counting
+    sort: numpy's stable argsort on uint16 digits is a radix/counting sort.
+    """
+    # + 0.0 turns -0.0 into 0.0 so the two compare equal, as with <
+    bits = (np.asarray(keys, dtype=np.float64) + 0.0).view(np.uint64)
+    sign = np.uint64(1 << 63)
+    bits = np.where(bits & sign, ~bits, bits | sign)
+    order = np.arange(len(bits))
+    for shift in range(0, 64, 16):
+        digits = ((bits[order] >> np.uint64(shift)) & np.uint64(0xFFFF)).astype(np.uint16)
+        order = order[np.argsort(digits, kind="stable")]
+    return order
+
+
+def sort_order(keys, backend="argsort"):
+    """Stable ordering of keys using the named backend."""
+    if backend == "merge":
+        # The original top-down merge sort, applied to (key, position) pairs
+        return [i for _, i in merge_sort(list(zip(keys, range(len(keys)))), dimension=0)]
+    if backend == "bottomup":
+        return bottom_up_merge_order(list(keys))
+    if backend == "timsort":
+        keys = list(keys)
+        return sorted(range(len(keys)), key=keys.__getitem__)
+    if backend == "argsort":
+        return np.argsort(np.asarray(keys, dtype=np.float64), kind="stable")
+    if backend == "radix":
+        return radix_order(keys)
+    raise ValueError(f"unknown sort backend {backend!r}; choose from {SORT_BACKENDS}")
+
+
+def sort_jobs(jobs, key="finish", backend=None):
+    """Sort jobs by "start", "finish" or "duration" with a pluggable backend.
+
+    Tuple lists default to the original merge sort and come back as lists;
+    IntervalSets default to numpy argsort and come back as IntervalSets.
+    """
+    if key not in ("start", "finish", "duration"):
+        raise ValueError(f"unknown sort key {key!r}")
+    if isinstance(jobs, IntervalSet):
+        keys = jobs.duration if key == "duration" else getattr(jobs, key)
+        return jobs.take(sort_order(keys, backend or "argsort"))
+
+    backend = backend or "merge"
+    if backend == "merge":
+        if key == "duration":
+            return merge_sort_by_duration(jobs)
+        return merge_sort(jobs, dimension=KEY_DIMENSION[key])
+    # Keys are computed once up front, not on every comparison
+    if key == "duration":
+        keys = [job[1] - job[0] for job in jobs]
+    else:
+        dim = KEY_DIMENSION[key]
+        keys = [job[dim] for job in jobs]
+    return [jobs[i] for i in sort_order(keys, backend)]
@@ -0,0 +1,65 @@
+import numpy as np
+from .intervals import IntervalSet, as_interval_set
+
+
+class WeightedIntervalScheduler:
+    """Maximum-weight compatible subset in O(n log n).
+
+    Jobs are either (start, finish, weight) tuples, (start, finish) tuples
+    plus a separate `weights` sequence, or an IntervalSet with a weights
+    column. Intervals that touch (start == previous finish) are compatible,
+    matching the >= rule used by the greedy schedulers.
+    """
+
+    def __init__(self, jobs, weights=None):
+        self.return_intervals = isinstance(jobs, IntervalSet)
+        self.jobs = as_interval_set(jobs)
+        if weights is not None:
+            self.jobs = IntervalSet(self.jobs.start, self.jobs.finish, self.jobs.ids, weights)
+        if self.jobs.weights is None and len(self.jobs) == 0:
+            self.jobs.weights = np.empty(0)
+        if self.jobs.weights is None:
+            raise ValueError("WeightedIntervalScheduler needs a weight column")
+        self.total_weight = 0.0
+
+    def predecessors(self, ordered: IntervalSet) -> np.ndarray:
+        """p[i] = last position j < i (finish order) with finish[j] <= start[i], else -1.
+
+        One vectorized searchsorted over the sorted finish times.
+        """
+        p = np.searchsorted(ordered.finish, ordered.start, side="right") - 1
+        # Zero-length intervals can find themselves (or later ties); any
+        # earlier position has finish <= start there, so clamp to i - 1.
+        return np.minimum(p, np.arange(len(ordered)) - 1)
+
+    def schedule_jobs(self):
+        n = len(self.jobs)
+        # Finish ties broken by start, as in ExactOptimalScheduler: a zero-length
+        # job at x then follows every job ending at x, so the DP can combine them
+        ordered = self.jobs.take(np.lexsort((self.jobs.start, self.jobs.finish)))
+        pred = self.predecessors(ordered).tolist()
+        w = ordered.weights.tolist()
+
+        # opt[i + 1] = best weight using the first i + 1 jobs in finish order
+        opt = [0.0] * (n + 1)
+        for i in range(n):
+            take = w[i] + opt[pred[i] + 1]
+            skip = opt[i]
+            opt[i + 1] = take if take > skip else skip
+
+        # Traceback from the last job
+        selected = []
+        i = n - 1
+        while i >= 0:
+            if w[i] + opt[pred[i] + 1] > opt[i]:
+                selected.append(i)
+                i = pred[i]
+            else:
+                i -= 1
+        selected.reverse()
+
+        self.total_weight = opt[n]
+        self.selected_jobs = ordered.take(selected)
+        if self.return_intervals:
+            return self.selected_jobs
+        return self.selected_jobs.to_tuples()
@@ -0,0 +1,54 @@
+"""Baseline registry and the statistics behind `python main.py compare`."""
+import numpy as np
+import pytest
+
+from src.baselines import BaselineRegistry, compare_runs, holm_adjust, mann_whitney_greater
+
+
+def test_mann_whitney_known_values():
+    # Fully separated 8 vs 8: U = 64, mean 32, variance 8 * 8 * 17 / 12, z = 31.5 / 9.522
+    assert mann_whitney_greater(range(1, 9), range(9, 17)) == pytest.approx(4.6955e-4, rel=1e-4)
+    # With ties: U = 24, mean 15, tie-corrected variance 28.773, z = 1.5846
+    assert mann_whitney_greater([1, 2, 2, 3, 4], [2, 3, 3, 5, 6, 6]) == pytest.approx(0.05652, rel=1e-3)
+    # The other direction is not significant
+    assert mann_whitney_greater(range(9, 17), range(1, 9)) > 0.99
+
+
+def test_mann_whitney_degenerate_inputs():
+    assert mann_whitney_greater([], [1.0, 2.0]) == 1.0
+    assert mann_whitney_greater([3.0] * 5, [3.0] * 5) == 1.0
+
+
+def test_holm_adjust_known_values():
+    # Sorted: 0.01 * 4, 0.03 * 3, max(0.04 * 2, 0.09), 0.2 * 1
+    np.testing.assert_allclose(holm_adjust([0.01, 0.04, 0.03, 0.2]), [0.04, 0.09, 0.09, 0.2])
+    np.testing.assert_allclose(holm_adjust([0.5, 0.6]), [1.0, 1.0])
+    assert len(holm_adjust([])) == 0
+
+
+def test_compare_runs_flags_only_real_shifts():
+    rng = np.random.default_rng(0)
+    baseline = {(1.0, n, "EFT"): list(rng.normal(1.0, 0.01, 20)) for n in (10, 20, 30)}
+    candidate = {cell: list(rng.normal(1.0, 0.01, 20)) for cell in baseline}
+    candidate[(1.0, 20, "EFT")] = list(rng.normal(1.5, 0.01, 20))
+    candidate[(1.0, 30, "EFT")] = list(rng.normal(0.5, 0.01, 20))
+    candidate[(5.0, 10, "EFT")] = [1.0] * 20    # not in the baseline: ignored
+    rows = compare_runs(baseline, candidate)
+    assert [(row["n"], row["status"]) for row in rows] == [(10, "ok"), (20, "slower"), (30, "faster")]
+    assert rows[1]["ratio"] == pytest.approx(1.5, rel=0.02)
+    assert all(row["p_value"] < 0.05 for row in rows[1:])
+
+
+def test_registry_round_trip(tmp_path):
+    registry = BaselineRegistry(str(tmp_path / "baselines.sqlite"))
+    samples = {(1.0, 64, "EFT"): [0.1, 0.2], (5.0, 64, "SD"): [0.3]}
+    registry.record("before", "greedy_runtime", samples, {"python": "3.11"})
+    assert registry.samples("before") == samples
+    assert registry.run("before") == ("greedy_runtime", {"python": "3.11"})
+    registry.record("before", "greedy_runtime", {(1.0, 64, "EFT"): [0.5]}, {})
+    assert registry.samples("before") == {(1.0, 64, "EFT"): [0.5]}
+    registry.delete("before")
+    assert registry.runs() == []
+    with pytest.raises(KeyError):
+        registry.run("before")
+    registry.close()
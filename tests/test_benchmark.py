@@ -0,0 +1,109 @@
+"""Timing statistics and adaptive trial counts in src/benchmark.py, as the runtime sweeps use them."""
+import matplotlib
+
+matplotlib.use("Agg")
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import src.experiment_runner as experiment_runner
+from src.benchmark import AdaptiveTrials, BenchmarkResult, bootstrap_ci, measure_memory, relative_ci_width
+from src.experiment_runner import ExperimentRunner
+
+
+def test_benchmark_result_statistics():
+    stats = BenchmarkResult([4.0, 1.0, 3.0, 2.0, 5.0])
+    assert stats.min == 1.0
+    assert stats.median == 3.0
+    assert stats.iqr == 2.0
+    assert stats.ci_low <= stats.median <= stats.ci_high
+    assert 1.0 <= stats.ci_low and stats.ci_high <= 5.0
+
+
+def test_bootstrap_ci_degenerate_and_generic_statistic():
+    assert bootstrap_ci([2.5]) == (2.5, 2.5)
+    assert bootstrap_ci([1.0, 1.0, 1.0]) == (1.0, 1.0)
+    samples = np.random.default_rng(0).normal(10.0, 1.0, 50)
+    low, high = bootstrap_ci(samples, statistic=lambda a: float(np.percentile(a, 50)))
+    assert (low, high) == bootstrap_ci(samples)
+
+
+def test_measure_memory_counts_retained_blocks_only():
+    def transient():
+        [object() for _ in range(1000)]
+
+    kept = []
+
+    def retaining():
+        kept.extend(object() for _ in range(1000))
+
+    peak, retained = measure_memory(transient)
+    assert peak > 0 and retained < 100
+    peak, retained = measure_memory(retaining)
+    assert retained >= 1000
+
+
+def test_runtime_csv_reports_robust_statistics(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    ExperimentRunner(seed=1).run_greedy_runtime_experiments(n_values=[64, 128])
+    df = pd.read_csv("data/greedy_runtime_results.csv")
+    for algo in ["EFT", "EST", "SD"]:
+        prefix = f"{algo}_time_seconds"
+        assert (df[f"{prefix}_min"] <= df[f"{prefix}_median"]).all()
+        assert (df[f"{prefix}_median_ci_low"] <= df[f"{prefix}_median"]).all()
+        assert (df[f"{prefix}_median"] <= df[f"{prefix}_median_ci_high"]).all()
+        assert (df[f"{prefix}_iqr"] >= 0).all()
+
+
+def test_relative_ci_width_known_value():
+    # mean 2, std 1, t(2 df) = 4.303: 2 * 4.303 / sqrt(3) / 2
+    assert np.isclose(relative_ci_width([1.0, 2.0, 3.0]), 4.303 / np.sqrt(3))
+    assert relative_ci_width([1.0]) == float("inf")
+    assert relative_ci_width([2.0, 2.0]) == 0.0
+
+
+def test_adaptive_trials_stopping_rule():
+    with pytest.raises(ValueError):
+        AdaptiveTrials(min_trials=1)
+    rule = AdaptiveTrials(target=0.05, min_trials=5, max_trials=20)
+    assert rule.next_round({}, 0.0) == 5
+    assert rule.next_round({"a": [1.0, 2.0]}, 0.0) == 3
+    assert rule.next_round({"a": [1.0] * 5}, 0.0) == 0
+    # Wide interval: at most double the trials so far, never past max_trials
+    noisy = [1.0, 3.0] * 4
+    assert rule.next_round({"a": noisy}, 0.0) == 8
+    assert rule.next_round({"a": noisy + [2.0] * 8}, 0.0) == 4
+    assert rule.next_round({"a": noisy * 3}, 0.0) == 0
+    # Every tracked metric must be tight
+    assert rule.next_round({"a": [1.0] * 8, "b": noisy}, 0.0) == 8
+
+
+def test_adaptive_trials_budget():
+    rule = AdaptiveTrials(target=0.01, min_trials=4, max_trials=100, budget=1.5)
+    noisy = [1.0, 3.0, 1.0, 3.0]
+    assert rule.next_round({"a": noisy}, 1.5) == 0
+    # 0.25 s per trial leaves room for two more, not the four the width asks for
+    assert rule.next_round({"a": noisy}, 1.0) == 2
+
+
+def test_adaptive_rounds_run_on_the_pinned_pool(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    runner = ExperimentRunner(seed=1)
+    runner.workers = 2
+    sizes = []
+    pinned_pool = ExperimentRunner._pinned_pool
+
+    def spy(self, workers):
+        sizes.append(workers)
+        return pinned_pool(self, workers)
+
+    def unpinned(workers):
+        raise AssertionError("adaptive rounds must not use the unpinned trial pools")
+
+    monkeypatch.setattr(ExperimentRunner, "_pinned_pool", spy)
+    monkeypatch.setattr(experiment_runner, "_trial_pool", unpinned)
+    results = runner.run_greedy_runtime_experiments(
+        n_values=[64], adaptive=AdaptiveTrials(target=10.0, min_trials=2, max_trials=4))
+    assert sizes == [2]
+    assert all(2 <= t <= 4 for alpha in runner.alphas for t in results[alpha]["trials"])
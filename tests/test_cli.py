@@ -0,0 +1,11 @@
+"""Argument validation in main.py."""
+import pytest
+
+from main import build_parser
+
+
+def test_sweep_rejects_unknown_distribution():
+    parser = build_parser()
+    with pytest.raises(SystemExit):
+        parser.parse_args(["sweep", "greedy", "--distribution", "bogus"])
+    assert parser.parse_args(["sweep", "greedy", "--distribution", "pareto"]).distribution == "pareto"
@@ -0,0 +1,53 @@
+"""Empirical cost-model fits used by `python main.py fit` and `plan`."""
+import numpy as np
+import pytest
+
+from src.complexity import COST_MODELS, CostFit, fit_cost_model, fit_cost_models, largest_n_within, tied_fits
+
+
+@pytest.mark.parametrize("model, n", [
+    ("n", [2**i for i in range(10, 18)]),
+    ("n log n", [2**i for i in range(10, 18)]),
+    ("n^2", [2**i for i in range(6, 14)]),
+    ("n 2^n", list(range(5, 16))),
+])
+def test_fit_recovers_the_generating_model(model, n):
+    n = np.asarray(n, dtype=np.float64)
+    rng = np.random.default_rng(0)
+    seconds = (1e-4 + 1e-7 * COST_MODELS[model](n)) * rng.normal(1.0, 0.01, len(n))
+    fits = fit_cost_models(n, seconds)
+    assert fits[0].model == model
+    assert fits[0].scale == pytest.approx(1e-7, rel=0.05)
+    assert fits[0].rel_rmse < 0.03
+    assert np.allclose(fits[0].predict(n), seconds, rtol=0.05)
+
+
+def test_fit_rejects_short_or_unusable_series():
+    assert fit_cost_model([10, 20], [1.0, 2.0], "n") is None
+    assert fit_cost_model([10, 20, 30], [1.0, 0.0, 3.0], "n") is None
+    # Decreasing times cannot have a positive scale
+    assert fit_cost_model([10, 20, 30], [3.0, 2.0, 1.0], "n") is None
+    # n 2^n overflows at greedy sizes
+    assert fit_cost_model([2**10, 2**11, 2**12], [1.0, 2.0, 4.0], "n 2^n") is None
+
+
+def test_negative_intercept_refits_through_the_origin():
+    n = np.array([10.0, 20.0, 40.0, 80.0])
+    fit = fit_cost_model(n, 2.0 * n - 5.0, "n")
+    assert fit.intercept == 0.0 and fit.scale > 0
+
+
+def test_tied_fits():
+    def fit(model, rel_rmse):
+        return CostFit(model, 0.0, 1.0, 1.0, rel_rmse, 5)
+
+    assert tied_fits([]) == []
+    assert [f.model for f in tied_fits([fit("n", 0.01), fit("n log n", 0.2)])] == ["n"]
+    assert [f.model for f in tied_fits([fit("n", 0.10), fit("n log n", 0.12)])] == ["n", "n log n"]
+    # Below the 1% floor two near-perfect fits are tied however small their ratio
+    assert len(tied_fits([fit("n", 0.0001), fit("n log n", 0.009)])) == 2
+
+
+def test_largest_n_within():
+    assert largest_n_within(sum, [30, 10, 20, 40], 60) == [10, 20, 30]
+    assert largest_n_within(sum, [10], 5) == []
@@ -0,0 +1,62 @@
+"""Memory-mapped dataset cache: hits, keys and LRU eviction."""
+import os
+
+import numpy as np
+import pytest
+
+from src.dataset_cache import DatasetCache
+from src.dataset_generator import DISTRIBUTIONS
+
+
+def _age(path, seconds_ago):
+    t = os.path.getmtime(path) - seconds_ago
+    os.utime(path, (t, t))
+
+
+def test_hit_returns_the_generated_dataset(tmp_path):
+    cache = DatasetCache(str(tmp_path))
+    seed = np.random.SeedSequence(5, spawn_key=(1, 2))
+    first = cache.get(100, 1.0, seed=seed, distribution="pareto")
+    again = cache.get(100, 1.0, seed=np.random.SeedSequence(5, spawn_key=(1, 2)), distribution="pareto")
+    expected = DISTRIBUTIONS["pareto"](100, 1.0, seed=np.random.SeedSequence(5, spawn_key=(1, 2)))
+    # Zero-copy views of the read-only mapping
+    assert not again.start.flags.writeable and not again.start.flags.owndata
+    for got in (first, again):
+        np.testing.assert_array_equal(got.start, expected.start)
+        np.testing.assert_array_equal(got.finish, expected.finish)
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_key_covers_every_generation_parameter(tmp_path):
+    cache = DatasetCache(str(tmp_path))
+    paths = {cache.path(100, 1.0, 100, 0, "uniform"), cache.path(101, 1.0, 100, 0, "uniform"),
+             cache.path(100, 5.0, 100, 0, "uniform"), cache.path(100, 1.0, 50, 0, "uniform"),
+             cache.path(100, 1.0, 100, 1, "uniform"), cache.path(100, 1.0, 100, 0, "nested")}
+    assert len(paths) == 6
+    with pytest.raises(ValueError):
+        cache.get(10, 1.0, seed=np.random.default_rng(0))
+    with pytest.raises(ValueError):
+        cache.get(10, 1.0, distribution="bogus")
+
+
+def test_eviction_drops_least_recently_used_first(tmp_path):
+    cache = DatasetCache(str(tmp_path))
+    paths = [cache.path(1000, 1.0, 100, seed, "uniform") for seed in range(3)]
+    for age, seed in zip((30, 20, 10), range(3)):
+        cache.get(1000, 1.0, seed=seed)
+        _age(paths[seed], age)
+    size = os.path.getsize(paths[0])
+    cache.get(1000, 1.0, seed=0)    # a hit makes seed 0 the most recently used
+
+    cache.max_bytes = 3 * size
+    cache.get(1000, 1.0, seed=3)
+    assert [os.path.exists(p) for p in paths] == [True, False, True]
+    assert os.path.exists(cache.path(1000, 1.0, 100, 3, "uniform"))
+
+
+def test_eviction_keeps_the_new_dataset_even_past_the_limit(tmp_path):
+    cache = DatasetCache(str(tmp_path), max_bytes=1)
+    cache.get(1000, 1.0, seed=0)
+    jobs = cache.get(1000, 1.0, seed=1)
+    assert os.listdir(tmp_path) == [os.path.basename(cache.path(1000, 1.0, 100, 1, "uniform"))]
+    np.testing.assert_array_equal(jobs.start, DISTRIBUTIONS["uniform"](1000, 1.0, seed=1).start)
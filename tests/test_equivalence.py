@@ -0,0 +1,181 @@
+"""Randomized equivalence checks between the schedulers and their reference versions."""
+import numpy as np
+import pytest
+
+from src.batch import schedule_batch, schedule_ragged
+from src.benchmark import PhaseProfiler
+from src.dataset_generator import DISTRIBUTIONS, generate_intervals
+from src.dynamic_index import DynamicIntervalIndex
+from src.exhaustive import BitmaskExhaustiveScheduler, BruteForceScheduler
+from src.greedy import EarliestFinishTime, EarlierStartTime, ShortestDuration, PointerJumpEarliestFinishTime
+from src.intervals import IntervalSet
+from src.optimal import ExactOptimalScheduler, cross_check_with_bruteforce
+from src.parallel_eft import ParallelEarliestFinishTime
+from src.sorting import SORT_BACKENDS, sort_order
+
+GREEDY = {"EFT": EarliestFinishTime, "EST": EarlierStartTime, "SD": ShortestDuration}
+
+
+def random_jobs(rng, n, integer=False):
+    """Intervals with frequent ties; integer data also has zero-length jobs."""
+    if integer:
+        start = rng.integers(0, max(1, n), n).astype(np.float64)
+        finish = start + rng.integers(0, 4, n)
+    else:
+        start = rng.uniform(0, n, n).round(1)
+        finish = start + rng.uniform(0.1, 3, n).round(1)
+    return IntervalSet(start, finish, np.arange(n))
+
+
+def test_exact_matches_bruteforce():
+    assert cross_check_with_bruteforce(n_values=range(1, 9), trials=10) == 3 * 8 * 10
+
+
+@pytest.mark.parametrize("integer", [False, True])
+def test_pointer_jump_matches_eft(integer):
+    rng = np.random.default_rng(1)
+    for _ in range(300):
+        jobs = random_jobs(rng, int(rng.integers(1, 60)), integer)
+        assert PointerJumpEarliestFinishTime(jobs).schedule_jobs().ids.tolist() == \
+            EarliestFinishTime(jobs).schedule_jobs().ids.tolist()
+        tuples = jobs.to_tuples()
+        assert PointerJumpEarliestFinishTime(tuples).schedule_jobs() == EarliestFinishTime(tuples).schedule_jobs()
+
+
+@pytest.mark.parametrize("integer", [False, True])
+def test_parallel_eft_matches_eft(integer):
+    rng = np.random.default_rng(2)
+    for _ in range(200):
+        jobs = random_jobs(rng, int(rng.integers(1, 200)), integer)
+        expected = EarliestFinishTime(jobs).schedule_jobs().ids.tolist()
+        assert ParallelEarliestFinishTime(jobs, chunks_per_worker=8).schedule_jobs().ids.tolist() == expected
+
+
+def test_dynamic_index_matches_eft():
+    rng = np.random.default_rng(3)
+    jobs = random_jobs(rng, 200, integer=True)
+    index = DynamicIntervalIndex(jobs.to_tuples())
+    live = list(range(len(jobs)))
+    for step in range(300):
+        if step % 3 == 0 and live:
+            index.remove(live.pop(int(rng.integers(len(live)))))
+        else:
+            s = float(rng.integers(0, 200))
+            live.append(index.insert(s, s + float(rng.integers(0, 4))))
+        current = IntervalSet.from_tuples(index.intervals())
+        assert index.selected() == EarliestFinishTime(current).schedule_jobs().to_tuples()
+
+
+@pytest.mark.parametrize("heuristic", sorted(GREEDY))
+def test_ragged_matches_per_request_schedulers(heuristic):
+    rng = np.random.default_rng(4)
+    datasets = [random_jobs(rng, int(rng.integers(0, 40)), integer=True) for _ in range(30)]
+    offsets = np.concatenate([[0], np.cumsum([len(jobs) for jobs in datasets])])
+    start = np.concatenate([jobs.start for jobs in datasets])
+    finish = np.concatenate([jobs.finish for jobs in datasets])
+    counts, selected = schedule_ragged(start, finish, offsets, heuristic)
+    for b, jobs in enumerate(datasets):
+        expected = sorted(GREEDY[heuristic](jobs).schedule_jobs().ids.tolist()) if len(jobs) else []
+        assert counts[b] == len(expected)
+        assert np.flatnonzero(selected[offsets[b]:offsets[b + 1]]).tolist() == expected
+
+
+def test_ragged_with_nonzero_first_offset():
+    start = np.arange(8, dtype=np.float64)
+    finish = start + 1.5
+    counts, selected = schedule_ragged(start, finish, [2, 3, 8])
+    assert counts.tolist() == [1, 3]
+    assert np.flatnonzero(selected).tolist() == [2, 3, 5, 7]
+
+    rng = np.random.default_rng(8)
+    for heuristic, scheduler in GREEDY.items():
+        jobs = [random_jobs(rng, int(rng.integers(1, 30)), integer=True) for _ in range(3)]
+        lead = int(rng.integers(1, 5))
+        offsets = np.cumsum([lead] + [len(j) for j in jobs])
+        start = np.concatenate([np.zeros(lead)] + [j.start for j in jobs])
+        finish = np.concatenate([np.zeros(lead)] + [j.finish for j in jobs])
+        counts, selected = schedule_ragged(start, finish, offsets, heuristic)
+        assert not selected[:lead].any()
+        for b, dataset in enumerate(jobs):
+            expected = sorted(scheduler(dataset).schedule_jobs().ids.tolist())
+            assert counts[b] == len(expected)
+            assert np.flatnonzero(selected[offsets[b]:offsets[b + 1]]).tolist() == expected
+
+
+@pytest.mark.parametrize("method", BitmaskExhaustiveScheduler.METHODS)
+def test_bitmask_matches_bruteforce(method):
+    rng = np.random.default_rng(5)
+    for _ in range(60):
+        jobs = random_jobs(rng, int(rng.integers(1, 10))).to_tuples()
+        expected = BruteForceScheduler(jobs).schedule_jobs()
+        got = BitmaskExhaustiveScheduler(jobs, method).schedule_jobs()
+        assert BruteForceScheduler.is_valid(got)
+        assert len(got) == len(expected)
+        if method == "gray":
+            assert got == expected
+
+
+@pytest.mark.parametrize("method", BitmaskExhaustiveScheduler.METHODS)
+def test_bitmask_matches_bruteforce_with_zero_length_jobs(method):
+    start = [4, 0, 5, 6, 1, 1, 3, 0, 4, 5]
+    finish = [4, 2, 5, 8, 3, 1, 3, 2, 5, 8]
+    jobs = list(zip(map(float, start), map(float, finish)))
+    assert BruteForceScheduler.is_valid([(5.0, 5.0), (4.0, 5.0)])
+    assert len(BitmaskExhaustiveScheduler(jobs, method).schedule_jobs()) == len(
+        BruteForceScheduler(jobs).schedule_jobs()) == 7
+
+    rng = np.random.default_rng(9)
+    for _ in range(100):
+        jobs = random_jobs(rng, int(rng.integers(1, 10)), integer=True)
+        expected = BruteForceScheduler(jobs.to_tuples()).schedule_jobs()
+        assert len(BruteForceScheduler(jobs).schedule_jobs()) == len(expected)
+        got = BitmaskExhaustiveScheduler(jobs.to_tuples(), method).schedule_jobs()
+        assert BruteForceScheduler.is_valid(got)
+        assert len(got) == len(expected)
+        if method == "gray":
+            assert got == expected
+
+
+@pytest.mark.parametrize("integer", [False, True])
+def test_exact_is_optimal_count(integer):
+    rng = np.random.default_rng(6)
+    for _ in range(100):
+        jobs = random_jobs(rng, int(rng.integers(1, 10)), integer).to_tuples()
+        assert ExactOptimalScheduler(jobs).optimal_count() == len(BruteForceScheduler(jobs).schedule_jobs())
+
+
+def test_parallel_bruteforce_matches_serial():
+    jobs = generate_intervals(10, 1.0, seed=7).to_tuples()
+    assert BruteForceScheduler(jobs, workers=2).schedule_jobs() == BruteForceScheduler(jobs).schedule_jobs()
+
+
+def test_bruteforce_profiler_covers_every_path():
+    jobs = generate_intervals(8, 1.0, seed=10)
+    profiler = PhaseProfiler()
+    BruteForceScheduler(jobs, profiler=profiler).schedule_jobs()
+    assert set(profiler.report()) == {"sort", "validity"}
+    profiler = PhaseProfiler()
+    BruteForceScheduler(jobs.to_tuples(), profiler=profiler).schedule_jobs()
+    assert set(profiler.report()) == {"subset", "validity"}
+    with pytest.raises(ValueError):
+        BruteForceScheduler(jobs, profiler=PhaseProfiler(), workers=2)
+
+
+@pytest.mark.parametrize("backend", SORT_BACKENDS)
+def test_sort_order_is_stable(backend):
+    rng = np.random.default_rng(11)
+    for _ in range(50):
+        keys = rng.integers(0, 5, int(rng.integers(0, 40))).astype(np.float64)
+        assert list(sort_order(keys, backend)) == np.argsort(keys, kind="stable").tolist()
+
+
+@pytest.mark.parametrize("heuristic", sorted(GREEDY))
+def test_tie_order_is_the_same_for_every_container(heuristic):
+    rng = np.random.default_rng(15)
+    for _ in range(100):
+        jobs = DISTRIBUTIONS["duplicates"](int(rng.integers(1, 40)), 1.0, seed=rng, with_ids=True)
+        expected = sorted(GREEDY[heuristic](jobs).schedule_jobs().ids.tolist())
+        tuples = [(s, f, i) for s, f, i in zip(jobs.start.tolist(), jobs.finish.tolist(), jobs.ids.tolist())]
+        assert sorted(job[2] for job in GREEDY[heuristic](tuples).schedule_jobs()) == expected
+        _, selected = schedule_batch(jobs.start[None, :], jobs.finish[None, :], heuristic=heuristic)
+        assert np.flatnonzero(selected[0]).tolist() == expected
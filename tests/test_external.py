@@ -0,0 +1,34 @@
+"""External-memory EFT against the in-memory scheduler."""
+import pytest
+
+from src.dataset_generator import DISTRIBUTIONS
+from src.external import ExternalEarliestFinishTime, read_intervals, write_intervals
+from src.greedy import EarliestFinishTime
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "duplicates", "nested"])
+def test_multi_pass_merge_matches_in_memory(tmp_path, distribution):
+    jobs = DISTRIBUTIONS[distribution](1000, 1.0, seed=7)
+    path = str(tmp_path / "jobs.bin")
+    write_intervals(path, jobs)
+    expected = EarliestFinishTime(jobs).schedule_jobs().to_tuples()
+
+    # 28 runs with fan_in=3 need three merge passes before the final merge
+    scheduler = ExternalEarliestFinishTime(path, chunk_size=37, tmp_dir=str(tmp_path), fan_in=3)
+    assert scheduler.schedule_jobs() == expected
+
+    out = str(tmp_path / "selected.bin")
+    assert scheduler.schedule_to_file(out) == len(expected)
+    assert read_intervals(out).to_tuples() == expected
+    # Only the input and output are left behind
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["jobs.bin", "selected.bin"]
+
+
+def test_empty_file_and_bad_arguments(tmp_path):
+    path = tmp_path / "empty.bin"
+    path.write_bytes(b"")
+    assert ExternalEarliestFinishTime(str(path), chunk_size=4, fan_in=2).schedule_jobs() == []
+    with pytest.raises(ValueError):
+        ExternalEarliestFinishTime(str(path), fan_in=1)
+    with pytest.raises(ValueError):
+        ExternalEarliestFinishTime(str(path), chunk_size=0)
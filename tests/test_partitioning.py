@@ -0,0 +1,37 @@
+"""IntervalPartitioning against its max_depth lower bound."""
+import numpy as np
+
+from src.exhaustive import BitmaskExhaustiveScheduler
+from src.intervals import IntervalSet
+from src.partitioning import IntervalPartitioning
+
+
+def _check(jobs):
+    partition = IntervalPartitioning(jobs)
+    resources = partition.schedule_jobs()
+    assert partition.num_resources == partition.max_depth()
+    # No two jobs on one resource overlap
+    conflicts = BitmaskExhaustiveScheduler(jobs).conflict_masks()
+    for resource in range(partition.num_resources):
+        members = [i for i, r in enumerate(partition.assignment) if r == resource]
+        assert all(not conflicts[i] >> j & 1 for i in members for j in members)
+    return resources
+
+
+def test_zero_length_job_shares_a_touching_resource():
+    partition = IntervalPartitioning([(5.0, 7.0), (5.0, 5.0)])
+    partition.schedule_jobs()
+    assert partition.num_resources == partition.max_depth() == 1
+    partition = IntervalPartitioning([(1.0, 5.0), (3.0, 3.0)])
+    partition.schedule_jobs()
+    assert partition.num_resources == partition.max_depth() == 2
+
+
+def test_resources_equal_depth_on_integer_data():
+    rng = np.random.default_rng(12)
+    for _ in range(300):
+        n = int(rng.integers(1, 30))
+        start = rng.integers(0, n, n).astype(np.float64)
+        finish = start + rng.integers(0, 6, n)
+        _check(list(zip(start.tolist(), finish.tolist())))
+        _check(IntervalSet(start, finish))
@@ -0,0 +1,55 @@
+"""Resuming sweeps from the ResultsStore checkpoint."""
+import matplotlib
+
+matplotlib.use("Agg")
+
+import src.experiment_runner as experiment_runner
+from src.experiment_runner import ExperimentRunner
+from src.results_store import ResultsStore
+
+
+def test_store_round_trip(tmp_path):
+    store = ResultsStore(str(tmp_path / "results.sqlite"))
+    store.put("greedy", 1.0, 8, {"trials": 2, "samples": [1, 2]})
+    assert store.get("greedy", 1.0, 8) == {"trials": 2, "samples": [1, 2]}
+    assert store.get("greedy", 1.0, 16) is None
+    assert store.get_meta("seed_entropy") is None
+    store.set_meta("seed_entropy", "42")
+    assert store.get_meta("seed_entropy") == "42"
+    store.clear("greedy")
+    assert store.cells("greedy") == []
+    store.close()
+
+
+def _count_trials(monkeypatch):
+    calls = []
+    timed_trial = experiment_runner._timed_trial
+
+    def counting(task):
+        calls.append(task)
+        return timed_trial(task)
+
+    monkeypatch.setattr(experiment_runner, "_timed_trial", counting)
+    return calls
+
+
+def test_unseeded_restart_recomputes_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = _count_trials(monkeypatch)
+    first = ExperimentRunner(results_db="results.sqlite").run_exhaustive_runtime_experiments(n_values=[5, 6])
+    assert len(calls) == 3 * 2 * 10
+
+    calls.clear()
+    second = ExperimentRunner(results_db="results.sqlite").run_exhaustive_runtime_experiments(n_values=[5, 6])
+    assert calls == []
+    assert second == first
+
+
+def test_different_seed_recomputes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    calls = _count_trials(monkeypatch)
+    ExperimentRunner(seed=1, results_db="results.sqlite").run_exhaustive_runtime_experiments(n_values=[5])
+    ExperimentRunner(seed=1, results_db="results.sqlite").run_exhaustive_runtime_experiments(n_values=[5])
+    assert len(calls) == 3 * 10
+    ExperimentRunner(seed=2, results_db="results.sqlite").run_exhaustive_runtime_experiments(n_values=[5])
+    assert len(calls) == 2 * 3 * 10
@@ -0,0 +1,46 @@
+"""SchedulingService end to end over a local TCP socket."""
+import asyncio
+
+import numpy as np
+import pytest
+
+from src.dataset_generator import generate_dataset
+from src.intervals import IntervalSet
+from src.service import SERVICE_HEURISTICS, ScheduleClient, SchedulingService, _schedule_micro_batch
+
+
+def test_micro_batch_matches_per_request():
+    rng = np.random.default_rng(0)
+    requests = []
+    for k in range(40):
+        start = rng.integers(0, 20, int(rng.integers(1, 20))).astype(np.float64)
+        finish = start + rng.integers(0, 5, len(start))
+        requests.append((list(SERVICE_HEURISTICS)[k % len(SERVICE_HEURISTICS)], start, finish))
+    expected = []
+    for heuristic, start, finish in requests:
+        jobs = IntervalSet(start, finish, np.arange(len(start), dtype=np.int64))
+        expected.append(sorted(SERVICE_HEURISTICS[heuristic](jobs).schedule_jobs().ids.tolist()))
+    assert _schedule_micro_batch(requests) == expected
+
+
+@pytest.mark.parametrize("micro_batch", [True, False])
+def test_concurrent_requests(micro_batch):
+    async def run():
+        service = SchedulingService(port=0, micro_batch=micro_batch, batch_window=0.05, workers=1)
+        await service.start()
+        clients = [ScheduleClient(port=service.port) for _ in range(8)]
+        await asyncio.gather(*(client.connect() for client in clients))
+        jobs = generate_dataset(30, 1.0, seed=1)
+        responses = await asyncio.gather(*(client.schedule(jobs) for client in clients))
+        bad = await clients[0].request({"heuristic": "nope", "jobs": []})
+        stats = await clients[0].stats()
+        await asyncio.gather(*(client.close() for client in clients))
+        await service.close()
+        return responses, bad, stats
+
+    responses, bad, stats = asyncio.run(run())
+    assert len({tuple(r["selected"]) for r in responses}) == 1
+    assert responses[0]["count"] == len(responses[0]["selected"]) > 0
+    assert "error" in bad
+    assert stats["requests"] == 8 and stats["errors"] == 1
+    assert (stats["batches"] < 8) if micro_batch else (stats["batches"] == 0)
@@ -0,0 +1,43 @@
+"""WeightedIntervalScheduler against the exhaustive search."""
+import numpy as np
+
+from src.exhaustive import BruteForceScheduler
+from src.weighted import WeightedIntervalScheduler
+
+
+def test_zero_length_job_combines_with_a_job_ending_at_it():
+    for jobs in ([(5.0, 5.0, 1.0), (0.0, 5.0, 1.0)], [(0.0, 5.0, 1.0), (5.0, 5.0, 1.0)]):
+        scheduler = WeightedIntervalScheduler(jobs)
+        assert len(scheduler.schedule_jobs()) == 2
+        assert scheduler.total_weight == 2
+
+
+def test_unit_weights_match_bruteforce_count():
+    rng = np.random.default_rng(13)
+    for _ in range(500):
+        n = int(rng.integers(1, 10))
+        start = rng.integers(0, n, n).astype(np.float64)
+        finish = start + rng.integers(0, 4, n)
+        jobs = list(zip(start.tolist(), finish.tolist()))
+        scheduler = WeightedIntervalScheduler(jobs, weights=np.ones(n))
+        selected = scheduler.schedule_jobs()
+        assert BruteForceScheduler.is_valid([job[:2] for job in selected])
+        assert scheduler.total_weight == len(selected) == len(BruteForceScheduler(jobs).schedule_jobs())
+
+
+def test_weights_match_bruteforce_optimum():
+    rng = np.random.default_rng(14)
+    for _ in range(200):
+        n = int(rng.integers(1, 9))
+        start = rng.integers(0, n, n).astype(np.float64)
+        finish = start + rng.integers(0, 4, n)
+        weights = rng.integers(1, 10, n).astype(np.float64)
+        jobs = list(zip(start.tolist(), finish.tolist()))
+        best = 0.0
+        for mask in range(1 << n):
+            subset = [i for i in range(n) if mask >> i & 1]
+            if BruteForceScheduler.is_valid([jobs[i] for i in subset]):
+                best = max(best, weights[subset].sum())
+        scheduler = WeightedIntervalScheduler(jobs, weights=weights)
+        scheduler.schedule_jobs()
+        assert scheduler.total_weight == best